@@ -5,17 +5,24 @@
 - Flutter CatalogProvider에서 호출하는 엔드포인트들
 """
 from fastapi import APIRouter, HTTPException, Depends, Query
-from typing import List, Optional
+from fastapi.responses import StreamingResponse
+from typing import Iterator, List, Optional
 from datetime import datetime
+import csv
+import io
+import json
 import uuid
 from sqlalchemy.orm import Session
-from app.core.config import get_kst_now
+from app.core.config import get_kst_now, settings
 from sqlalchemy import func, and_
 
 from app.schemas import Catalog, CatalogCreate, CatalogUpdate, ErrorResponse
-from app.models import get_db, CatalogDB, ItemDB, UserItemStatusDB
-from app.core.security import get_current_user_id
+from app.models import get_db, ReadSessionLocal, CatalogDB, ItemDB, UserItemStatusDB
+from app.core.security import get_current_user_id, get_optional_user_id
 from app.crud import catalog as catalog_crud
+from app.crud import item as item_crud
+from app.crud import user_catalog as user_catalog_crud
+from app.core.user_api import fetch_user_nickname
 
 # 카탈로그 라우터 생성 - main.py에서 /api/catalogs 경로에 마운트
 router = APIRouter()
@@ -58,49 +65,30 @@ def get_public_catalogs(
     - 모든 공개 카탈로그를 시간순으로 반환 (로그인 불필요)
     """
     try:
-        import requests
-        from app.crud.user_catalog import check_catalog_saved
-        
         catalog_records = catalog_crud.get_public_catalogs(db, category, user_id)
+        catalog_ids = [catalog_record.catalog_id for catalog_record in catalog_records]
+        
+        # 저장 여부와 통계는 카탈로그 수와 관계없이 한 번에 조회
+        saved_catalogs = user_catalog_crud.get_saved_catalog_map(db, user_id, catalog_ids) if user_id else {}
+        catalog_stats = catalog_crud.calculate_catalogs_stats(db, catalog_ids)
         
-        # User API에서 사용자 정보 가져오기
-        user_api_url = "http://localhost:8080/api/users"
+        # User API에서 생성자 닉네임 가져오기 (같은 요청 안에서는 사용자별 1회만 조회)
         user_nicknames = {}
         
         catalogs = []
         for catalog_record in catalog_records:
             # 생성자 닉네임 가져오기
-            creator_nickname = None
             if catalog_record.user_id not in user_nicknames:
-                try:
-                    url = f"{user_api_url}/{catalog_record.user_id}"
-                    response = requests.get(url, timeout=2)
-                    
-                    if response.status_code == 200:
-                        if response.text:
-                            user_data = response.json()
-                            user_nicknames[catalog_record.user_id] = user_data.get("nickname", "알 수 없음")
-                        else:
-                            user_nicknames[catalog_record.user_id] = "알 수 없음"
-                    else:
-                        user_nicknames[catalog_record.user_id] = "알 수 없음"
-                except Exception as e:
-                    user_nicknames[catalog_record.user_id] = "알 수 없음"
+                user_nicknames[catalog_record.user_id] = fetch_user_nickname(catalog_record.user_id)
             
             creator_nickname = user_nicknames.get(catalog_record.user_id)
             
-            # 저장 여부 확인
-            is_saved = False
-            if user_id:
-                is_saved = check_catalog_saved(db, user_id, catalog_record.catalog_id)
-            
             # 공개 카탈로그는 원작자 기준으로 통계 계산
-            stats = catalog_crud.calculate_catalog_stats(db, catalog_record.catalog_id, catalog_record.user_id)
             catalog_data = catalog_crud.build_catalog_response(
                 catalog_record, 
-                stats,
+                catalog_stats[catalog_record.catalog_id],
                 creator_nickname=creator_nickname,
-                is_saved=is_saved
+                is_saved=catalog_record.catalog_id in saved_catalogs
             )
             catalogs.append(Catalog(**catalog_data))
         
@@ -138,6 +126,85 @@ async def get_catalog(
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"데이터베이스 오류: {e}")
 
+# 내보내기 CSV 컬럼 순서
+EXPORT_CSV_COLUMNS = [
+    "item_id", "catalog_id", "name", "description", "image_url",
+    "owned", "user_fields", "created_at", "updated_at"
+]
+
+def _export_ndjson_lines(catalog_id: str, user_id: Optional[str]) -> Iterator[str]:
+    """아이템을 한 줄씩 NDJSON으로 직렬화 (요청 세션과 별도의 읽기 전용 세션 사용)"""
+    db = ReadSessionLocal()
+    try:
+        for item_record, owned in item_crud.iter_items_with_owned(
+            db, catalog_id, user_id, settings.EXPORT_BATCH_SIZE
+        ):
+            item_data = item_crud.build_item_response(item_record, owned, catalog_id)
+            yield json.dumps(item_data, ensure_ascii=False) + "\n"
+    finally:
+        db.close()
+
+def _export_csv_lines(catalog_id: str, user_id: Optional[str]) -> Iterator[str]:
+    """아이템을 한 줄씩 CSV로 직렬화 (헤더 포함, user_fields는 JSON 문자열)"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    
+    writer.writerow(EXPORT_CSV_COLUMNS)
+    yield buffer.getvalue()
+    
+    db = ReadSessionLocal()
+    try:
+        for item_record, owned in item_crud.iter_items_with_owned(
+            db, catalog_id, user_id, settings.EXPORT_BATCH_SIZE
+        ):
+            item_data = item_crud.build_item_response(item_record, owned, catalog_id)
+            item_data["user_fields"] = json.dumps(item_data["user_fields"], ensure_ascii=False)
+            
+            buffer.seek(0)
+            buffer.truncate(0)
+            writer.writerow([item_data[column] for column in EXPORT_CSV_COLUMNS])
+            yield buffer.getvalue()
+    finally:
+        db.close()
+
+@router.get("/{catalog_id}/export")
+def export_catalog(
+    catalog_id: str,
+    format: str = Query("ndjson", pattern="^(ndjson|csv)$", description="내보내기 형식 (ndjson/csv)"),
+    user_id: Optional[str] = Depends(get_optional_user_id),  # 선택적 사용자 ID (보유 여부 표시용)
+    db: Session = Depends(get_db)
+):
+    """
+    카탈로그 아이템 내보내기 (스트리밍)
+    - 서버 측 커서로 아이템을 나눠 읽으며 바로 전송하므로 메모리 사용량이 카탈로그 크기와 무관
+    - 로그인한 경우 각 아이템에 요청자의 보유 여부(owned) 포함
+    - 공개 카탈로그는 인증 불필요, 비공개 카탈로그는 소유자만 가능
+    """
+    catalog_record = catalog_crud.get_catalog(db, catalog_id)
+    
+    if not catalog_record:
+        raise HTTPException(status_code=404, detail="카탈로그를 찾을 수 없습니다")
+    
+    if catalog_record.visibility != "public":
+        if not user_id:
+            raise HTTPException(status_code=401, detail="인증이 필요합니다")
+        if catalog_record.user_id != user_id:
+            raise HTTPException(status_code=403, detail="접근 권한이 없습니다")
+    
+    if format == "csv":
+        content = _export_csv_lines(catalog_id, user_id)
+        media_type = "text/csv; charset=utf-8"
+    else:
+        content = _export_ndjson_lines(catalog_id, user_id)
+        media_type = "application/x-ndjson"
+    
+    filename = f"catalog-{catalog_id}.{format}"
+    return StreamingResponse(
+        content,
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+    )
+
 @router.post("/", response_model=Catalog, status_code=201)
 async def create_catalog(
     catalog: CatalogCreate,
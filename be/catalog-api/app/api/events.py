@@ -0,0 +1,74 @@
+"""
+실시간 변경 알림 API 라우터 (WebSocket)
+- 같은 사용자의 다른 기기에서 바꾼 보유 상태, 아이템 생성/수정/삭제, 카탈로그 변경을 바로 전달
+- 인증: Authorization: Bearer <JWT> 헤더 (헤더를 지정할 수 없는 클라이언트는 ?token=<JWT>)
+- 서버 → 클라이언트 JSON 메시지만 사용 (클라이언트가 보낸 메시지는 무시)
+- 연결 직후 {"type": "subscribed"}를 보내므로, 클라이언트는 이때 /api/sync로 연결 전 변경분을 받아 두면 누락이 없음
+"""
+from fastapi import APIRouter, HTTPException, WebSocket, WebSocketDisconnect, Query, status
+from typing import Optional
+import asyncio
+
+from app.core import events
+from app.core.security import verify_token
+
+router = APIRouter()
+
+
+def _websocket_user_id(websocket: WebSocket, token: Optional[str]) -> Optional[str]:
+    """Authorization 헤더 또는 token 쿼리의 JWT에서 사용자 ID 추출 (실패 시 None)"""
+    authorization = websocket.headers.get("authorization", "")
+    if authorization.startswith("Bearer "):
+        token = authorization.split(" ")[1]
+    if not token:
+        return None
+    try:
+        return verify_token(token)
+    except HTTPException:
+        return None
+
+
+async def _wait_for_disconnect(websocket: WebSocket) -> None:
+    """클라이언트 메시지를 읽어 버리다가 연결이 끊기면 종료"""
+    try:
+        while True:
+            await websocket.receive_text()
+    except WebSocketDisconnect:
+        pass
+
+
+@router.websocket("/ws")
+async def event_stream(websocket: WebSocket, token: Optional[str] = Query(None)):
+    """
+    내 카탈로그 변경 알림 구독
+    - 이벤트: catalog.created/updated/deleted, item.created/updated/deleted, item.owned, resync
+    - resync: 처리하지 못한 이벤트가 너무 많이 쌓여 버려졌음 - /api/sync로 변경분을 다시 받음
+    """
+    user_id = _websocket_user_id(websocket, token)
+    if user_id is None:
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION, reason="인증이 필요합니다")
+        return
+    
+    hub = events.get_event_hub()
+    if hub is None:
+        await websocket.close(code=status.WS_1013_TRY_AGAIN_LATER, reason="알림 서비스가 준비되지 않았습니다")
+        return
+    
+    await websocket.accept()
+    queue = hub.subscribe(user_id)
+    disconnected = asyncio.create_task(_wait_for_disconnect(websocket))
+    try:
+        await websocket.send_json({"type": "subscribed", "user_id": user_id})
+        while True:
+            next_event = asyncio.create_task(queue.get())
+            done, _ = await asyncio.wait({next_event, disconnected}, return_when=asyncio.FIRST_COMPLETED)
+            if next_event not in done:
+                next_event.cancel()
+                break
+            await websocket.send_json(next_event.result())
+    except (WebSocketDisconnect, RuntimeError):
+        # 전송 중 연결이 끊긴 경우
+        pass
+    finally:
+        hub.unsubscribe(user_id, queue)
+        disconnected.cancel()
@@ -15,12 +15,33 @@ from sqlalchemy import and_
 from app.schemas import Item, ItemCreate, ItemUpdate, ErrorResponse
 from app.models import get_db, CatalogDB, ItemDB, UserItemStatusDB
 from app.core.security import get_current_user_id, get_optional_user_id
+from app.core.write_queue import run_write
 from app.crud import item as item_crud
 from app.crud import catalog as catalog_crud
+from app.crud import catalog_reference as catalog_reference_crud
 
 # 아이템 라우터 생성 - main.py에서 /api/items 경로에 마운트
 router = APIRouter()
 
+def _resolve_item_access(db: Session, item_record: ItemDB, user_id: str):
+    """
+    아이템 접근 권한 확인 - 참조 모드로 공유 중인 아이템이면 저장 기록 반환 (본인 아이템이면 None)
+    - 카탈로그 소유자도 아니고 공유 중인 아이템도 아니면 403
+    """
+    catalog_record = catalog_crud.get_catalog(db, item_record.catalog_id)
+    
+    if not catalog_record:
+        raise HTTPException(status_code=404, detail="연관된 카탈로그를 찾을 수 없습니다")
+    
+    if catalog_record.user_id == user_id:
+        return None
+    
+    reference = catalog_reference_crud.find_item_reference(db, user_id, item_record)
+    if not reference:
+        raise HTTPException(status_code=403, detail="접근 권한이 없습니다")
+    
+    return reference
+
 @router.get("/catalog/{catalog_id}", response_model=List[Item])
 async def get_items_by_catalog(
     catalog_id: str,
@@ -42,25 +63,22 @@ async def get_items_by_catalog(
             if catalog_record.user_id != user_id:
                 raise HTTPException(status_code=403, detail="접근 권한이 없습니다")
         
-        item_records = item_crud.get_items_by_catalog(db, catalog_id)
+        # 사용자별 보유 상태는 로그인한 경우만 (참조 모드 카탈로그는 공유 중인 원본 아이템 포함)
+        item_rows = item_crud.get_catalog_items_with_owned(db, catalog_id, user_id)
         
         items = []
-        for item_record in item_records:
-            # 사용자별 보유 상태 조회 (로그인한 경우만)
-            owned_status = False
-            if user_id:
-                user_status = item_crud.get_user_item_status(db, user_id, item_record.item_id)
-                owned_status = user_status.owned if user_status else False
-            
+        for item_record, owned_status in item_rows:
             # 보유 여부 필터 적용
             if owned is not None and owned_status != owned:
                 continue
             
-            item_data = item_crud.build_item_response(item_record, owned_status)
+            item_data = item_crud.build_item_response(item_record, owned_status, catalog_id)
             items.append(Item(**item_data))
         
         return items
         
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"데이터베이스 오류: {e}")
 
@@ -77,21 +95,17 @@ async def get_item(
         if not item_record:
             raise HTTPException(status_code=404, detail="아이템을 찾을 수 없습니다")
         
-        catalog_record = catalog_crud.get_catalog(db, item_record.catalog_id)
-        
-        if not catalog_record:
-            raise HTTPException(status_code=404, detail="연관된 카탈로그를 찾을 수 없습니다")
-        
-        if catalog_record.user_id != user_id:
-            raise HTTPException(status_code=403, detail="접근 권한이 없습니다")
+        reference = _resolve_item_access(db, item_record, user_id)
         
         user_status = item_crud.get_user_item_status(db, user_id, item_id)
         owned = user_status.owned if user_status else False
         
-        item_data = item_crud.build_item_response(item_record, owned)
+        item_data = item_crud.build_item_response(item_record, owned, reference.copied_catalog_id if reference else None)
         
         return Item(**item_data)
         
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"데이터베이스 오류: {e}")
 
@@ -111,7 +125,7 @@ async def create_item(
         if catalog_record.user_id != user_id:
             raise HTTPException(status_code=403, detail="접근 권한이 없습니다")
         
-        item_record = item_crud.create_item(db, item, user_id)
+        item_record = await run_write(db, item_crud.create_item, item, user_id)
         
         item_data = item_crud.build_item_response(item_record, False)
         
@@ -127,26 +141,29 @@ async def update_item(
     user_id: str = Depends(get_current_user_id),
     db: Session = Depends(get_db)
 ):
-    """아이템 수정"""
+    """
+    아이템 수정
+    - 참조 모드로 공유 중인 아이템은 저장 카탈로그로 복사한 뒤 수정 (응답의 item_id가 새 아이템 ID)
+    """
     try:
         item_record = item_crud.get_item(db, item_id)
         
         if not item_record:
             raise HTTPException(status_code=404, detail="아이템을 찾을 수 없습니다")
         
-        catalog_record = catalog_crud.get_catalog(db, item_record.catalog_id)
+        reference = _resolve_item_access(db, item_record, user_id)
         
-        if not catalog_record:
-            raise HTTPException(status_code=404, detail="연관된 카탈로그를 찾을 수 없습니다")
-        
-        if catalog_record.user_id != user_id:
-            raise HTTPException(status_code=403, detail="접근 권한이 없습니다")
-        
-        item_record = item_crud.update_item(db, item_id, item_update)
+        if reference:
+            item_record = catalog_reference_crud.materialize_item(db, reference, user_id, item_record, item_update)
+            item_id = item_record.item_id
+        else:
+            item_record = item_crud.update_item(db, item_id, item_update)
         
         # 업데이트된 아이템 조회
         return await get_item(item_id, user_id, db)
         
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"데이터베이스 오류: {e}")
 
@@ -167,12 +184,16 @@ async def toggle_item_owned(
         if not item_record:
             raise HTTPException(status_code=404, detail="아이템을 찾을 수 없습니다")
         
-        user_status = item_crud.toggle_item_owned(db, user_id, item_id)
+        reference = catalog_reference_crud.find_item_reference(db, user_id, item_record)
+        
+        user_status = await run_write(db, item_crud.toggle_item_owned, user_id, item_id)
         
-        item_data = item_crud.build_item_response(item_record, user_status.owned)
+        item_data = item_crud.build_item_response(item_record, user_status.owned, reference.copied_catalog_id if reference else None)
         
         return Item(**item_data)
         
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"데이터베이스 오류: {e}")
 
@@ -182,20 +203,21 @@ async def delete_item(
     user_id: str = Depends(get_current_user_id),
     db: Session = Depends(get_db)
 ):
-    """아이템 삭제"""
+    """
+    아이템 삭제
+    - 참조 모드로 공유 중인 아이템은 원본을 두고 저장 카탈로그에서만 제외
+    """
     try:
         item_record = item_crud.get_item(db, item_id)
         
         if not item_record:
             raise HTTPException(status_code=404, detail="아이템을 찾을 수 없습니다")
         
-        catalog_record = catalog_crud.get_catalog(db, item_record.catalog_id)
-        
-        if not catalog_record:
-            raise HTTPException(status_code=404, detail="연관된 카탈로그를 찾을 수 없습니다")
+        reference = _resolve_item_access(db, item_record, user_id)
         
-        if catalog_record.user_id != user_id:
-            raise HTTPException(status_code=403, detail="접근 권한이 없습니다")
+        if reference:
+            catalog_reference_crud.hide_item(db, reference, user_id, item_record)
+            return {"message": "아이템이 성공적으로 삭제되었습니다"}
         
         success = item_crud.delete_item(db, item_id)
         
@@ -204,5 +226,7 @@ async def delete_item(
         
         return {"message": "아이템이 성공적으로 삭제되었습니다"}
         
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"데이터베이스 오류: {e}")
\ No newline at end of file
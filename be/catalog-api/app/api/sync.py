@@ -0,0 +1,118 @@
+"""
+동기화 API 라우터
+- 앱 시작 시 전체 목록을 다시 받는 대신 마지막으로 받은 버전 이후의 변경만 조회
+- 변경 기록은 사용자별 단조 증가 버전으로 정렬, 삭제된 카탈로그/아이템은 삭제 기록(tombstone)으로 전달
+- 응답의 version을 다음 요청의 since로 사용하고, has_more가 false가 될 때까지 반복
+"""
+from fastapi import APIRouter, HTTPException, Depends, Query
+from typing import List
+import logging
+from sqlalchemy.orm import Session
+
+from app.schemas import Catalog, Item, SyncResponse, SyncTombstone
+from app.models import get_write_db, CatalogDB
+from app.core.security import get_current_user_id
+from app.crud import catalog as catalog_crud
+from app.crud import item as item_crud
+from app.crud import user_catalog as user_catalog_crud
+from app.crud import change_log as change_log_crud
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+
+router = APIRouter()
+
+
+def _build_catalogs(db: Session, user_id: str, catalog_ids: List[str]) -> List[Catalog]:
+    """변경된 카탈로그 응답 (통계/원본 ID는 카탈로그 수와 관계없이 쿼리 몇 번으로 조회)"""
+    if not catalog_ids:
+        return []
+    
+    catalog_records = db.query(CatalogDB).filter(
+        CatalogDB.catalog_id.in_(catalog_ids),
+        CatalogDB.user_id == user_id
+    ).all()
+    stats = catalog_crud.calculate_catalogs_stats(db, [record.catalog_id for record in catalog_records])
+    original_ids = user_catalog_crud.get_original_catalog_ids(db, user_id, [record.catalog_id for record in catalog_records])
+    
+    return [
+        Catalog(**catalog_crud.build_catalog_response(
+            record,
+            stats[record.catalog_id],
+            original_ids.get(record.catalog_id)
+        ))
+        for record in catalog_records
+    ]
+
+
+@router.get("", response_model=SyncResponse)
+def sync_changes(
+    since: int = Query(0, ge=0, description="마지막으로 받은 버전 (처음 동기화는 0)"),
+    limit: int = Query(500, ge=1, le=2000, description="한 번에 받을 변경 수"),
+    user_id: str = Depends(get_current_user_id),
+    db: Session = Depends(get_write_db)  # 첫 동기화 시 기존 데이터의 변경 기록을 생성하므로 쓰기 세션 사용
+):
+    """
+    since 이후 변경된 카탈로그/아이템과 삭제 기록 조회
+    - 같은 엔티티가 여러 번 바뀌었으면 최신 상태 한 번만 전달
+    - 카탈로그는 아이템 수/보유 수가 바뀌어도 변경으로 전달 (통계 갱신)
+    - since가 서버 버전보다 크면(데이터 초기화 등) reset=true - 로컬 캐시를 비우고 since=0부터 다시 요청
+    """
+    try:
+        state = change_log_crud.get_sync_state(db, user_id)
+        if state is None or not state.backfilled:
+            change_log_crud.backfill_user_changes(db, user_id)
+            state = change_log_crud.get_sync_state(db, user_id)
+        
+        current_version = state.version
+        if since > current_version:
+            return SyncResponse(since=since, version=0, current_version=current_version, reset=True)
+        
+        changes, has_more = change_log_crud.get_changes(db, user_id, since, limit)
+        
+        upserted = {change_log_crud.ENTITY_CATALOG: [], change_log_crud.ENTITY_ITEM: []}
+        deleted = []
+        for change in changes:
+            if change.deleted:
+                deleted.append(change)
+            else:
+                upserted[change.entity_type].append(change)
+        
+        catalogs = _build_catalogs(db, user_id, [change.entity_id for change in upserted[change_log_crud.ENTITY_CATALOG]])
+        
+        # 참조 모드로 공유 중인 원본 아이템은 기록된 저장 카탈로그 ID로 전달
+        item_catalog_ids = {change.entity_id: change.catalog_id for change in upserted[change_log_crud.ENTITY_ITEM]}
+        items = [
+            Item(**item_crud.build_item_response(item_record, owned, item_catalog_ids.get(item_record.item_id)))
+            for item_record, owned in item_crud.get_items_with_owned(db, list(item_catalog_ids), user_id)
+        ]
+        
+        # 기록은 있지만 행이 사라진 엔티티(기록 없이 함께 삭제된 경우)는 삭제로 전달
+        found_ids = {catalog.catalog_id for catalog in catalogs} | {item.item_id for item in items}
+        deleted.extend(
+            change for entity_changes in upserted.values() for change in entity_changes
+            if change.entity_id not in found_ids
+        )
+        
+        return SyncResponse(
+            since=since,
+            version=changes[-1].version if changes else since,
+            current_version=current_version,
+            has_more=has_more,
+            catalogs=catalogs,
+            items=items,
+            deleted=[
+                SyncTombstone(
+                    entity_type=change.entity_type,
+                    entity_id=change.entity_id,
+                    catalog_id=change.catalog_id,
+                    version=change.version
+                )
+                for change in sorted(deleted, key=lambda change: change.version)
+            ]
+        )
+        
+    except Exception as e:
+        db.rollback()
+        logger.error(f"동기화 실패: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"동기화 실패: {str(e)}")
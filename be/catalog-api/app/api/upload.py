@@ -1,102 +1,761 @@
-from fastapi import APIRouter, HTTPException, Depends, UploadFile, File
+from fastapi import APIRouter, HTTPException, Depends, Header, Request, Response
+from python_multipart.exceptions import MultipartParseError
+from python_multipart.multipart import MultipartParser, parse_options_header
+from starlette.concurrency import run_in_threadpool
+from starlette.requests import ClientDisconnect
+from sqlalchemy.orm import Session
+from contextlib import asynccontextmanager
 from datetime import datetime
+import asyncio
+import hashlib
 import uuid
 import os
+import weakref
 from app.core.config import get_kst_now, settings
-import shutil
 from pathlib import Path
+from typing import Optional, Tuple
 
-from app.schemas import UploadResponse, ErrorResponse
+try:
+    import fcntl
+except ImportError:
+    # Windows - 프로세스 간 잠금 없이 워커 안의 asyncio 잠금만 사용 (단일 프로세스 개발용)
+    fcntl = None
+
+from app.schemas import (
+    UploadResponse, PresignedUploadRequest, ConfirmUploadRequest,
+    UploadSessionCreate, UploadSessionStatus, ErrorResponse
+)
+from app.models import get_db
 from app.core.security import get_current_user_id
+from app.core.storage import StorageBackend, get_storage, upload_session_path
+from app.crud import image_blob as image_blob_crud
+from app.crud import uploaded_object as uploaded_object_crud
+from app.crud import upload_session as upload_session_crud
+from app.core.images import CAS_PREFIX, schedule_variants, variant_path, variant_urls
 
 router = APIRouter()
 
-@router.post("/file", response_model=UploadResponse)
+# 업로드 허용 확장자
+ALLOWED_EXTENSIONS = ['.jpg', '.jpeg', '.png', '.gif', '.webp']
+
+# 업로드 중인 파일을 저장소로 옮기기 전에 임시로 두는 로컬 경로 (UPLOAD_DIR 기준)
+STAGING_PREFIX = "images/.staging"
+
+# /file 업로드 요청 본문 문서 (본문을 직접 파싱하므로 FastAPI가 스키마를 만들지 않음)
+FILE_UPLOAD_OPENAPI = {
+    "requestBody": {
+        "required": True,
+        "content": {
+            "multipart/form-data": {
+                "schema": {
+                    "type": "object",
+                    "required": ["file"],
+                    "properties": {"file": {"type": "string", "format": "binary"}}
+                }
+            }
+        }
+    }
+}
+
+# 이어받기 업로드 청크 요청의 Content-Type (tus 프로토콜과 동일)
+CHUNK_CONTENT_TYPE = "application/offset+octet-stream"
+
+# 세션별 청크 쓰기 잠금 - 같은 워커에 동시에 들어온 PATCH가 부분 파일을 함께 쓰지 않도록 함
+# (다른 워커 프로세스와는 부분 파일의 flock으로 조정, locked_part_file 참고)
+_session_locks = weakref.WeakValueDictionary()
+
+def _session_lock(session_id: str) -> asyncio.Lock:
+    """세션별 잠금 조회 (사용 중인 잠금만 유지)"""
+    lock = _session_locks.get(session_id)
+    if lock is None:
+        lock = asyncio.Lock()
+        _session_locks[session_id] = lock
+    return lock
+
+def _write_chunk(buffer, hasher, chunk: bytes) -> None:
+    """버퍼에 청크 기록 및 해시 갱신 (스레드 풀에서 실행)"""
+    buffer.write(chunk)
+    hasher.update(chunk)
+
+def _hash_file(file_path: Path) -> str:
+    """파일 SHA-256 계산 (스레드 풀에서 실행)"""
+    hasher = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        while True:
+            chunk = f.read(settings.UPLOAD_CHUNK_SIZE)
+            if not chunk:
+                break
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
+def _file_size(file_path: Path) -> int:
+    """부분 파일 크기 = 현재까지 받은 바이트 수 (없으면 0)"""
+    try:
+        return file_path.stat().st_size
+    except FileNotFoundError:
+        return 0
+
+def _open_locked_part_file(part_path: Path):
+    """
+    부분 파일을 열고 프로세스 간 배타 잠금(flock) 획득 (스레드 풀에서 실행)
+    - 다른 워커 프로세스가 잠금을 잡고 있으면 기다리지 않고 None
+    - 잠금을 잡는 사이 완료/취소로 경로의 파일이 옮겨지거나 삭제되었으면 FileNotFoundError
+    """
+    buffer = open(part_path, "r+b")
+    try:
+        if fcntl is not None:
+            try:
+                fcntl.flock(buffer.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                buffer.close()
+                return None
+        
+        opened = os.fstat(buffer.fileno())
+        current = os.stat(part_path)
+        if (opened.st_dev, opened.st_ino) != (current.st_dev, current.st_ino):
+            raise FileNotFoundError(part_path)
+    except BaseException:
+        buffer.close()
+        raise
+    
+    return buffer
+
+@asynccontextmanager
+async def locked_part_file(session_id: str, missing_ok: bool = False):
+    """
+    세션 잠금을 잡은 상태로 부분 파일 제공 (with 블록이 끝나면 파일을 닫아 잠금 해제)
+    - 같은 워커의 요청은 asyncio 잠금으로 차례로 처리
+    - serve.py의 다른 워커가 같은 세션을 처리 중이면 409 (HEAD로 오프셋을 다시 확인)
+    - 부분 파일이 없으면 404 (missing_ok이면 None 제공)
+    """
+    part_path = upload_session_path(session_id)
+    async with _session_lock(session_id):
+        try:
+            buffer = await run_in_threadpool(_open_locked_part_file, part_path)
+        except FileNotFoundError:
+            if missing_ok:
+                yield None
+                return
+            raise HTTPException(status_code=404, detail="업로드 세션을 찾을 수 없거나 만료되었습니다")
+        
+        if buffer is None:
+            offset = await run_in_threadpool(_file_size, part_path)
+            raise HTTPException(
+                status_code=409,
+                detail="다른 요청이 이 업로드 세션을 처리 중입니다",
+                headers={"Upload-Offset": str(offset)}
+            )
+        
+        try:
+            yield buffer
+        finally:
+            await run_in_threadpool(buffer.close)
+
+def _create_part_file(part_path: Path) -> None:
+    """빈 부분 파일 생성 (스레드 풀에서 실행)"""
+    part_path.parent.mkdir(parents=True, exist_ok=True)
+    part_path.touch()
+
+def _discard_temp_file(buffer, temp_path: Path) -> None:
+    """실패한 업로드의 임시 파일 정리 (스레드 풀에서 실행)"""
+    if not buffer.closed:
+        buffer.close()
+    temp_path.unlink(missing_ok=True)
+
+def _delete_stored_file(storage: StorageBackend, key: str) -> None:
+    """저장소 파일과 로컬 리사이즈 버전 삭제 (스레드 풀에서 실행)"""
+    storage.delete(key)
+    local_path = storage.local_path(key)
+    if local_path:
+        for size in settings.IMAGE_VARIANT_SIZES:
+            variant_path(local_path, size).unlink(missing_ok=True)
+
+def validate_extension(filename: str) -> str:
+    """파일 확장자 검증 후 소문자 확장자 반환"""
+    file_extension = Path(filename).suffix.lower()
+    
+    if file_extension not in ALLOWED_EXTENSIONS:
+        raise HTTPException(
+            status_code=400, 
+            detail=f"지원하지 않는 파일 형식입니다. 허용된 형식: {', '.join(ALLOWED_EXTENSIONS)}"
+        )
+    
+    return file_extension
+
+def new_upload_key(user_id: str, file_extension: str) -> str:
+    """새 업로드 파일 키 생성 (images/사용자ID/년/월/일/UUID.확장자) - 한국 시간 기준"""
+    date_prefix = get_kst_now().strftime("%Y/%m/%d")
+    return f"images/{user_id}/{date_prefix}/{uuid.uuid4()}{file_extension}"
+
+def cas_relative_path(sha256: str, file_extension: str) -> str:
+    """SHA-256 기반 저장 경로 (UPLOAD_DIR 기준, 예: images/cas/ab/cd/abcd....jpg)"""
+    return f"{CAS_PREFIX}/{sha256[:2]}/{sha256[2:4]}/{sha256}{file_extension}"
+
+def build_upload_response(storage: StorageBackend, key: str, upload_url: str = "") -> UploadResponse:
+    """업로드 응답 구성 (로컬 저장소면 썸네일 URL 포함)"""
+    file_url = storage.public_url(key)
+    local_path = storage.local_path(key)
+    
+    return UploadResponse(
+        upload_url=upload_url,
+        file_url=file_url,
+        variants=variant_urls(file_url, local_path) if local_path else {}
+    )
+
+def schedule_local_variants(storage: StorageBackend, key: str) -> None:
+    """로컬 저장소 파일이면 썸네일 생성을 백그라운드 프로세스 풀에 등록"""
+    local_path = storage.local_path(key)
+    if local_path:
+        schedule_variants(local_path)
+
+class _MultipartFileField:
+    """
+    multipart 본문에서 파일 필드 하나를 꺼내는 python-multipart 콜백 상태
+    - 파트 헤더를 받으면 filename/Content-Type 기록, 대상 파트의 데이터는 chunks에 쌓아 두고 호출 측이 꺼내 감
+    """
+    
+    def __init__(self, field_name: str):
+        self.field_name = field_name.encode()
+        self.filename: Optional[str] = None
+        self.content_type: Optional[str] = None
+        self.chunks = []
+        self.finished = False
+        self._headers = {}
+        self._header_field = b""
+        self._header_value = b""
+        self._in_target = False
+    
+    def callbacks(self) -> dict:
+        return {
+            "on_part_begin": self._on_part_begin,
+            "on_header_field": self._on_header_field,
+            "on_header_value": self._on_header_value,
+            "on_header_end": self._on_header_end,
+            "on_headers_finished": self._on_headers_finished,
+            "on_part_data": self._on_part_data,
+            "on_part_end": self._on_part_end,
+        }
+    
+    def _on_part_begin(self) -> None:
+        self._headers = {}
+    
+    def _on_header_field(self, data: bytes, start: int, end: int) -> None:
+        self._header_field += data[start:end]
+    
+    def _on_header_value(self, data: bytes, start: int, end: int) -> None:
+        self._header_value += data[start:end]
+    
+    def _on_header_end(self) -> None:
+        self._headers[self._header_field.lower()] = self._header_value
+        self._header_field = b""
+        self._header_value = b""
+    
+    def _on_headers_finished(self) -> None:
+        _, options = parse_options_header(self._headers.get(b"content-disposition", b""))
+        self._in_target = (
+            self.filename is None
+            and options.get(b"name") == self.field_name
+            and b"filename" in options
+        )
+        if self._in_target:
+            self.filename = options[b"filename"].decode("utf-8", "replace")
+            content_type = self._headers.get(b"content-type")
+            self.content_type = content_type.decode("latin-1") if content_type else None
+    
+    def _on_part_data(self, data: bytes, start: int, end: int) -> None:
+        if self._in_target:
+            self.chunks.append(bytes(data[start:end]))
+    
+    def _on_part_end(self) -> None:
+        if self._in_target:
+            self._in_target = False
+            self.finished = True
+
+def _too_large() -> HTTPException:
+    return HTTPException(
+        status_code=413,
+        detail=f"파일 크기가 너무 큽니다. 최대 {settings.MAX_UPLOAD_SIZE} 바이트까지 업로드할 수 있습니다"
+    )
+
+async def receive_upload_stream(request: Request, field_name: str = "file") -> Tuple[Path, str, Optional[str], int, str]:
+    """
+    multipart/form-data 요청 본문을 받는 대로 파싱하여 파일 필드를 로컬 임시 경로에 바로 저장
+    - UploadFile(File(...))은 Starlette가 본문 전체를 임시 파일에 받은 뒤 핸들러를 실행하므로
+      크기 제한이 다 받은 뒤에야 적용되고 디스크에 두 번 기록됨
+    - 누적 크기가 MAX_UPLOAD_SIZE를 넘는 즉시 수신 중단 (413, Content-Length 없는 chunked 요청 포함)
+    - 파일 파트 헤더를 받으면 확장자를 바로 검증하여 허용하지 않는 형식이면 본문을 더 받지 않음 (400)
+    - 디스크 I/O는 스레드 풀에서 실행하고 저장하면서 SHA-256을 함께 계산
+    - (임시 경로, 확장자, Content-Type, 바이트 수, SHA-256) 반환
+    """
+    content_type, options = parse_options_header(request.headers.get("content-type", ""))
+    boundary = options.get(b"boundary")
+    if content_type != b"multipart/form-data" or not boundary:
+        raise HTTPException(status_code=400, detail=f"multipart/form-data 형식의 {field_name} 필드가 필요합니다")
+    
+    field = _MultipartFileField(field_name)
+    parser = MultipartParser(boundary, field.callbacks())
+    staging_path: Optional[Path] = None
+    buffer = None
+    hasher = hashlib.sha256()
+    size = 0
+    
+    async def flush_chunks() -> None:
+        nonlocal size
+        while field.chunks:
+            chunk = field.chunks.pop(0)
+            size += len(chunk)
+            if size > settings.MAX_UPLOAD_SIZE:
+                raise _too_large()
+            await run_in_threadpool(_write_chunk, buffer, hasher, chunk)
+    
+    try:
+        async for body_chunk in request.stream():
+            try:
+                parser.write(body_chunk)
+            except MultipartParseError:
+                raise HTTPException(status_code=400, detail="multipart 본문 형식이 올바르지 않습니다")
+            
+            if buffer is None and field.filename is not None:
+                file_extension = validate_extension(field.filename)
+                staging_dir = Path(settings.UPLOAD_DIR) / STAGING_PREFIX
+                await run_in_threadpool(staging_dir.mkdir, parents=True, exist_ok=True)
+                staging_path = staging_dir / f"{uuid.uuid4()}{file_extension}"
+                buffer = await run_in_threadpool(open, staging_path, "wb")
+            if buffer is not None:
+                await flush_chunks()
+            if field.finished:
+                break
+        
+        if buffer is None or not field.finished:
+            raise HTTPException(status_code=400, detail=f"업로드할 파일({field_name} 필드)이 없습니다")
+        
+        await run_in_threadpool(buffer.close)
+    except BaseException:
+        if buffer is not None:
+            await run_in_threadpool(_discard_temp_file, buffer, staging_path)
+        raise
+    
+    return staging_path, file_extension, field.content_type, size, hasher.hexdigest()
+
+async def store_content_addressed(
+    staging_path: Path,
+    size: int,
+    sha256: str,
+    file_extension: str,
+    content_type: Optional[str],
+    user_id: str,
+    db: Session
+) -> UploadResponse:
+    """
+    내용 주소 저장 방식 업로드
+    - 임시 경로의 파일을 SHA-256 기반 키로 저장소에 이동
+    - 같은 내용이 이미 있으면 새 파일은 버리고 참조 수만 증가
+    - URL이 내용에 따라 고정되므로 영구 캐시 가능
+    """
+    storage = get_storage()
+    
+    existing = image_blob_crud.get_blob(db, sha256)
+    key = existing.file_path if existing else cas_relative_path(sha256, file_extension)
+    
+    is_new_content = not await run_in_threadpool(storage.exists, key)
+    if is_new_content:
+        await run_in_threadpool(storage.store, staging_path, key, content_type)
+    else:
+        await run_in_threadpool(staging_path.unlink, missing_ok=True)
+    
+    blob = image_blob_crud.add_blob_reference(db, sha256, user_id, key, size)
+    
+    # 새로 저장된 내용만 썸네일 생성
+    if is_new_content:
+        schedule_local_variants(storage, blob.file_path)
+    
+    return build_upload_response(storage, blob.file_path)
+
+async def store_staged_upload(
+    staging_path: Path,
+    size: int,
+    sha256: Optional[str],
+    file_extension: str,
+    content_type: Optional[str],
+    user_id: str,
+    db: Session
+) -> UploadResponse:
+    """
+    로컬 임시 경로에 저장 완료된 업로드 파일을 저장소로 이동 (일반 업로드/이어받기 업로드 공통)
+    - UPLOAD_STORAGE_LAYOUT에 따라 UUID 경로 또는 내용 주소 경로 사용
+    - sha256이 없으면(이어받기 업로드) 내용 주소 저장 시에만 파일을 읽어 계산
+    """
+    if settings.UPLOAD_STORAGE_LAYOUT == "cas":
+        if sha256 is None:
+            sha256 = await run_in_threadpool(_hash_file, staging_path)
+        return await store_content_addressed(staging_path, size, sha256, file_extension, content_type, user_id, db)
+    
+    storage = get_storage()
+    key = new_upload_key(user_id, file_extension)
+    await run_in_threadpool(storage.store, staging_path, key, content_type)
+    
+    # 썸네일 생성은 백그라운드 프로세스 풀에 맡기고 바로 응답
+    schedule_local_variants(storage, key)
+    
+    return build_upload_response(storage, key)
+
+@router.post("/file", response_model=UploadResponse, openapi_extra=FILE_UPLOAD_OPENAPI)
 async def upload_file(
-    file: UploadFile = File(...),
+    request: Request,
+    user_id: str = Depends(get_current_user_id),
+    db: Session = Depends(get_db)
+):
+    """
+    파일 업로드 (API 서버 경유, 저장 위치는 STORAGE_BACKEND, 경로 방식은 UPLOAD_STORAGE_LAYOUT)
+    - multipart/form-data의 file 필드, 본문을 받는 대로 저장하며 크기 제한 적용
+    """
+    try:
+        # 파일 저장 (청크 단위, 크기 제한 적용) 후 저장소로 이동
+        staging_path, file_extension, content_type, size, sha256 = await receive_upload_stream(request)
+        return await store_staged_upload(staging_path, size, sha256, file_extension, content_type, user_id, db)
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"파일 업로드 오류: {e}")
+
+@router.post("/presign", response_model=UploadResponse)
+async def create_presigned_upload(
+    request: PresignedUploadRequest,
     user_id: str = Depends(get_current_user_id)
 ):
-    """파일 업로드 (로컬 파일 시스템)"""
+    """
+    직접 업로드용 사전 서명 URL 발급 (S3 저장소 전용)
+    - 클라이언트는 upload_url로 파일을 PUT (Content-Type은 요청한 값과 동일해야 함)
+    - 업로드 후 /confirm 호출로 완료 처리, 이후 file_url 사용
+    """
     try:
-        # 파일 확장자 검증
-        allowed_extensions = ['.jpg', '.jpeg', '.png', '.gif', '.webp']
-        file_extension = Path(file.filename).suffix.lower()
+        storage = get_storage()
+        if not storage.supports_presigned_upload:
+            raise HTTPException(status_code=400, detail="현재 저장소는 직접 업로드를 지원하지 않습니다. /file 업로드를 사용하세요")
+        
+        file_extension = validate_extension(request.filename)
         
-        if file_extension not in allowed_extensions:
+        if request.size > settings.MAX_UPLOAD_SIZE:
             raise HTTPException(
-                status_code=400, 
-                detail=f"지원하지 않는 파일 형식입니다. 허용된 형식: {', '.join(allowed_extensions)}"
+                status_code=413,
+                detail=f"파일 크기가 너무 큽니다. 최대 {settings.MAX_UPLOAD_SIZE} 바이트까지 업로드할 수 있습니다"
             )
         
-        # 파일명 생성 (사용자ID/년월일/UUID.확장자) - 한국 시간 기준
-        now = get_kst_now()
-        date_prefix = now.strftime("%Y/%m/%d")
-        file_id = str(uuid.uuid4())
+        key = new_upload_key(user_id, file_extension)
+        upload_url = await run_in_threadpool(storage.presign_upload, key, request.content_type)
         
-        # 저장 경로 생성
-        upload_dir = Path(settings.UPLOAD_DIR) / "images" / user_id / date_prefix
-        upload_dir.mkdir(parents=True, exist_ok=True)
+        return build_upload_response(storage, key, upload_url=upload_url)
         
-        # 파일 저장
-        filename = f"{file_id}{file_extension}"
-        file_path = upload_dir / filename
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"업로드 URL 발급 오류: {e}")
+
+@router.post("/confirm", response_model=UploadResponse)
+async def confirm_presigned_upload(
+    request: ConfirmUploadRequest,
+    user_id: str = Depends(get_current_user_id),
+    db: Session = Depends(get_db)
+):
+    """
+    직접 업로드 완료 확인
+    - 저장소에 파일이 실제로 올라왔는지, 크기 제한을 지키는지 확인 후 기록
+    - 크기 제한을 넘으면 파일 삭제 후 413
+    """
+    try:
+        storage = get_storage()
+        key = storage.key_from_url(request.file_url)
         
-        with open(file_path, "wb") as buffer:
-            shutil.copyfileobj(file.file, buffer)
+        if not key or not key.startswith(f"images/{user_id}/"):
+            raise HTTPException(status_code=403, detail="파일 접근 권한이 없습니다")
         
-        # 파일 URL 생성 (상대 경로)
-        file_url = f"/uploads/images/{user_id}/{date_prefix}/{filename}"
+        size = await run_in_threadpool(storage.size, key)
+        if size is None:
+            raise HTTPException(status_code=404, detail="업로드된 파일을 찾을 수 없습니다")
         
-        return UploadResponse(
-            upload_url="",  # 로컬 업로드에서는 사용하지 않음
-            file_url=file_url
-        )
+        if size > settings.MAX_UPLOAD_SIZE:
+            await run_in_threadpool(storage.delete, key)
+            raise HTTPException(
+                status_code=413,
+                detail=f"파일 크기가 너무 큽니다. 최대 {settings.MAX_UPLOAD_SIZE} 바이트까지 업로드할 수 있습니다"
+            )
         
+        uploaded_object_crud.record_uploaded_object(db, key, user_id, size)
+        
+        return build_upload_response(storage, key)
+        
+    except HTTPException:
+        raise
     except Exception as e:
-        raise HTTPException(status_code=500, detail=f"파일 업로드 오류: {e}")
+        raise HTTPException(status_code=500, detail=f"업로드 확인 오류: {e}")
 
 @router.delete("/file")
 async def delete_file(
     file_url: str,
-    user_id: str = Depends(get_current_user_id)
+    user_id: str = Depends(get_current_user_id),
+    db: Session = Depends(get_db)
 ):
-    """로컬 파일 삭제"""
+    """파일 삭제 (내용 주소 저장 파일은 참조 수가 0이 될 때 삭제)"""
     try:
-        # URL 검증
-        if not file_url.startswith(f"/uploads/images/{user_id}/"):
-            raise HTTPException(status_code=403, detail="파일 삭제 권한이 없습니다")
+        storage = get_storage()
+        # 정규화한 키 (절대 경로나 .. 구간이 있으면 None이므로 아래 접두사 검사를 우회할 수 없음)
+        key = storage.key_from_url(file_url)
         
-        # 파일 경로 생성
-        file_path = Path(settings.UPLOAD_DIR) / file_url.lstrip("/uploads/")
+        if not key:
+            raise HTTPException(status_code=403, detail="파일 삭제 권한이 없습니다")
         
-        # 파일 존재 확인 및 삭제
-        if file_path.exists():
-            file_path.unlink()
+        # 내용 주소 저장 파일 - 사용자 참조를 제거하고 마지막 참조일 때만 파일 삭제
+        if key.startswith(f"{CAS_PREFIX}/"):
+            remaining = image_blob_crud.release_blob_reference(db, Path(key).stem, user_id)
+            if remaining is None:
+                raise HTTPException(status_code=403, detail="파일 삭제 권한이 없습니다")
+            
+            if remaining == 0:
+                await run_in_threadpool(_delete_stored_file, storage, key)
             return {"message": "파일이 성공적으로 삭제되었습니다"}
-        else:
+        
+        # 본인이 업로드한 파일인지 확인
+        if not key.startswith(f"images/{user_id}/"):
+            raise HTTPException(status_code=403, detail="파일 삭제 권한이 없습니다")
+        
+        # 파일 존재 확인 및 삭제 (리사이즈 버전 포함)
+        if not await run_in_threadpool(storage.exists, key):
             raise HTTPException(status_code=404, detail="파일을 찾을 수 없습니다")
         
+        await run_in_threadpool(_delete_stored_file, storage, key)
+        uploaded_object_crud.delete_uploaded_object(db, key)
+        
+        return {"message": "파일이 성공적으로 삭제되었습니다"}
+        
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"파일 삭제 오류: {e}")
 
-# 정적 파일 서빙을 위한 엔드포인트 (개발용)
-@router.get("/images/{user_id}/{year}/{month}/{day}/{filename}")
-async def serve_image(
-    user_id: str,
-    year: str,
-    month: str,
-    day: str,
-    filename: str
+def _part_file_size(buffer) -> int:
+    """열린 부분 파일의 크기 (스레드 풀에서 실행)"""
+    return os.fstat(buffer.fileno()).st_size
+
+def _truncate_part_file(buffer, offset: int) -> None:
+    """이번 요청에서 쓴 데이터를 되돌림 (스레드 풀에서 실행)"""
+    buffer.flush()
+    buffer.truncate(offset)
+
+async def append_request_body(request: Request, buffer, offset: int, upload_length: int) -> int:
+    """
+    요청 바디를 잠금을 잡은 부분 파일(locked_part_file) 끝에 이어 쓰고 새 오프셋 반환
+    - 받은 데이터를 UPLOAD_CHUNK_SIZE 단위로 모아 스레드 풀에서 기록 (메모리에 전체를 올리지 않음)
+    - 중간에 연결이 끊기면 그때까지 받은 데이터는 유지하여 다음 요청에서 이어받기
+    - 전체 파일 크기를 넘으면 이번 요청에서 쓴 데이터를 되돌리고 413
+    """
+    await run_in_threadpool(buffer.seek, offset)
+    pending = bytearray()
+    received = offset
+    
+    try:
+        try:
+            async for chunk in request.stream():
+                received += len(chunk)
+                if received > upload_length:
+                    raise HTTPException(
+                        status_code=413,
+                        detail=f"업로드 세션 크기({upload_length} 바이트)를 넘는 데이터입니다"
+                    )
+                
+                pending += chunk
+                if len(pending) >= settings.UPLOAD_CHUNK_SIZE:
+                    await run_in_threadpool(buffer.write, pending)
+                    pending.clear()
+        except ClientDisconnect:
+            pass
+        
+        if pending:
+            await run_in_threadpool(buffer.write, pending)
+        await run_in_threadpool(buffer.flush)
+    except HTTPException:
+        await run_in_threadpool(_truncate_part_file, buffer, offset)
+        raise
+    
+    return await run_in_threadpool(_part_file_size, buffer)
+
+def build_session_status(db_session, offset: int) -> UploadSessionStatus:
+    """이어받기 업로드 세션 상태 응답 구성"""
+    return UploadSessionStatus(
+        session_id=db_session.id,
+        offset=offset,
+        size=db_session.upload_length,
+        expires_at=db_session.expires_at
+    )
+
+def get_session_or_404(db: Session, session_id: str, user_id: str):
+    """본인의 유효한 업로드 세션 조회 (없거나 만료되면 404)"""
+    db_session = upload_session_crud.get_active_session(db, session_id, user_id)
+    if not db_session:
+        raise HTTPException(status_code=404, detail="업로드 세션을 찾을 수 없거나 만료되었습니다")
+    return db_session
+
+@router.post("/sessions", response_model=UploadSessionStatus, status_code=201)
+async def create_upload_session(
+    request: UploadSessionCreate,
+    user_id: str = Depends(get_current_user_id),
+    db: Session = Depends(get_db)
 ):
-    """업로드된 이미지 파일 서빙"""
+    """
+    이어받기 업로드 세션 생성 (tus 방식)
+    1. POST /sessions 로 세션 생성
+    2. PATCH /sessions/{id} 로 Upload-Offset 위치부터 청크 전송 (Content-Type: application/offset+octet-stream)
+    3. 연결이 끊기면 HEAD /sessions/{id} 의 Upload-Offset부터 다시 전송
+    4. 모두 보내면 POST /sessions/{id}/complete 로 완료 (일반 업로드와 같은 경로/URL 규칙으로 저장)
+    """
     try:
-        file_path = Path(settings.UPLOAD_DIR) / "images" / user_id / year / month / day / filename
+        validate_extension(request.filename)
         
-        if not file_path.exists():
-            raise HTTPException(status_code=404, detail="파일을 찾을 수 없습니다")
+        if request.size > settings.MAX_UPLOAD_SIZE:
+            raise HTTPException(
+                status_code=413,
+                detail=f"파일 크기가 너무 큽니다. 최대 {settings.MAX_UPLOAD_SIZE} 바이트까지 업로드할 수 있습니다"
+            )
+        
+        db_session = upload_session_crud.create_upload_session(
+            db, user_id, request.filename, request.content_type, request.size
+        )
+        await run_in_threadpool(_create_part_file, upload_session_path(db_session.id))
+        
+        return build_session_status(db_session, 0)
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"업로드 세션 생성 오류: {e}")
+
+@router.head("/sessions/{session_id}")
+async def get_upload_offset(
+    session_id: str,
+    user_id: str = Depends(get_current_user_id),
+    db: Session = Depends(get_db)
+):
+    """현재까지 받은 바이트 수 조회 (Upload-Offset 헤더, 이어받기 시작 위치)"""
+    db_session = get_session_or_404(db, session_id, user_id)
+    offset = await run_in_threadpool(_file_size, upload_session_path(session_id))
+    
+    return Response(
+        status_code=200,
+        headers={
+            "Upload-Offset": str(offset),
+            "Upload-Length": str(db_session.upload_length),
+            "Cache-Control": "no-store"
+        }
+    )
+
+@router.get("/sessions/{session_id}", response_model=UploadSessionStatus)
+async def get_upload_session(
+    session_id: str,
+    user_id: str = Depends(get_current_user_id),
+    db: Session = Depends(get_db)
+):
+    """업로드 세션 상태 조회 (HEAD와 같은 정보를 JSON으로 반환)"""
+    db_session = get_session_or_404(db, session_id, user_id)
+    offset = await run_in_threadpool(_file_size, upload_session_path(session_id))
+    
+    return build_session_status(db_session, offset)
+
+@router.patch("/sessions/{session_id}", status_code=204)
+async def upload_session_chunk(
+    session_id: str,
+    request: Request,
+    upload_offset: int = Header(..., ge=0, description="이 청크의 시작 위치 (현재 서버 오프셋과 같아야 함)"),
+    content_type: str = Header(None),
+    user_id: str = Depends(get_current_user_id),
+    db: Session = Depends(get_db)
+):
+    """
+    청크 전송 - Upload-Offset 위치부터 요청 바디를 이어 씀
+    - 오프셋이 서버와 다르면 409 (HEAD로 현재 오프셋을 다시 확인)
+    - 응답의 Upload-Offset 헤더가 다음 청크의 시작 위치
+    """
+    try:
+        if not content_type or not content_type.startswith(CHUNK_CONTENT_TYPE):
+            raise HTTPException(status_code=415, detail=f"Content-Type은 {CHUNK_CONTENT_TYPE} 이어야 합니다")
+        
+        db_session = get_session_or_404(db, session_id, user_id)
+        
+        async with locked_part_file(session_id) as buffer:
+            offset = await run_in_threadpool(_part_file_size, buffer)
+            if upload_offset != offset:
+                raise HTTPException(
+                    status_code=409,
+                    detail=f"Upload-Offset이 서버 오프셋({offset})과 다릅니다",
+                    headers={"Upload-Offset": str(offset)}
+                )
+            
+            new_offset = await append_request_body(request, buffer, offset, db_session.upload_length)
+        
+        upload_session_crud.touch_session(db, db_session)
+        
+        return Response(
+            status_code=204,
+            headers={
+                "Upload-Offset": str(new_offset),
+                "Upload-Length": str(db_session.upload_length)
+            }
+        )
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"청크 업로드 오류: {e}")
+
+@router.post("/sessions/{session_id}/complete", response_model=UploadResponse)
+async def complete_upload_session(
+    session_id: str,
+    user_id: str = Depends(get_current_user_id),
+    db: Session = Depends(get_db)
+):
+    """업로드 완료 - 모든 바이트를 받았으면 일반 업로드와 같은 방식으로 저장소에 저장하고 세션 종료"""
+    try:
+        db_session = get_session_or_404(db, session_id, user_id)
+        part_path = upload_session_path(session_id)
+        
+        async with locked_part_file(session_id) as buffer:
+            offset = await run_in_threadpool(_part_file_size, buffer)
+            if offset != db_session.upload_length:
+                raise HTTPException(
+                    status_code=409,
+                    detail=f"아직 모든 데이터를 받지 않았습니다 ({offset}/{db_session.upload_length} 바이트)",
+                    headers={"Upload-Offset": str(offset)}
+                )
+            
+            file_extension = validate_extension(db_session.filename)
+            response = await store_staged_upload(
+                part_path, offset, None, file_extension, db_session.content_type, user_id, db
+            )
+            upload_session_crud.delete_session(db, session_id)
+        
+        return response
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"업로드 완료 처리 오류: {e}")
+
+@router.delete("/sessions/{session_id}")
+async def cancel_upload_session(
+    session_id: str,
+    user_id: str = Depends(get_current_user_id),
+    db: Session = Depends(get_db)
+):
+    """업로드 취소 - 세션과 부분 파일 삭제"""
+    try:
+        get_session_or_404(db, session_id, user_id)
+        
+        async with locked_part_file(session_id, missing_ok=True):
+            upload_session_crud.delete_session(db, session_id)
+            await run_in_threadpool(upload_session_path(session_id).unlink, missing_ok=True)
         
-        from fastapi.responses import FileResponse
-        return FileResponse(file_path)
+        return {"message": "업로드가 취소되었습니다"}
         
+    except HTTPException:
+        raise
     except Exception as e:
-        raise HTTPException(status_code=500, detail=f"파일 서빙 오류: {e}")
\ No newline at end of file
+        raise HTTPException(status_code=500, detail=f"업로드 취소 오류: {e}")
@@ -4,7 +4,7 @@
 - 다른 사용자의 카탈로그를 내 카탈로그로 저장
 - 사용자별 아이템 보유 상태 관리
 """
-from fastapi import APIRouter, HTTPException, Depends
+from fastapi import APIRouter, HTTPException, Depends, Query
 from typing import List
 from datetime import datetime
 import uuid
@@ -12,9 +12,10 @@ import logging
 from sqlalchemy.orm import Session
 from sqlalchemy import and_
 
-from app.schemas import Catalog, UserCatalogSave, UserCatalog
-from app.models import get_db, CatalogDB, UserCatalogDB, UserItemStatusDB, ItemDB
+from app.schemas import Catalog, UserCatalogSave, UserCatalog, CollectionSummary, CheckSavedRequest, CheckSavedResult, CheckSavedResponse, SavedCatalogSyncResult
+from app.models import get_db, get_read_db, CatalogDB, UserCatalogDB, UserItemStatusDB, ItemDB
 from app.core.security import get_current_user_id
+from app.core.write_queue import run_write
 from app.crud import catalog as catalog_crud
 from app.crud import user_catalog as user_catalog_crud
 
@@ -48,9 +49,12 @@ async def get_my_catalogs(
             CatalogDB.user_id == user_id
         ).order_by(CatalogDB.created_at.desc()).all()
         
+        # 모두 내 카탈로그이므로 소유자 기준 통계를 한 번에 집계
+        catalog_stats = catalog_crud.calculate_catalogs_stats(db, [catalog_record.catalog_id for catalog_record, _ in catalog_query])
+        
         result_catalogs = []
         for catalog_record, original_catalog_id in catalog_query:
-            stats = catalog_crud.calculate_catalog_stats(db, catalog_record.catalog_id, user_id)
+            stats = catalog_stats[catalog_record.catalog_id]
             catalog_data = catalog_crud.build_catalog_response(catalog_record, stats, original_catalog_id)
             result_catalogs.append(Catalog(**catalog_data))
         
@@ -59,6 +63,25 @@ async def get_my_catalogs(
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"데이터베이스 오류: {e}")
 
+@router.get("/summary", response_model=CollectionSummary)
+def get_collection_summary(
+    recent_limit: int = Query(5, ge=0, le=50, description="최근 수집이 진행된 카탈로그 개수"),
+    user_id: str = Depends(get_current_user_id),
+    db: Session = Depends(get_db)
+):
+    """
+    내 수집 현황 요약 (홈 대시보드용)
+    - 전체 카탈로그/아이템/보유 수와 수집률, 카테고리별 통계, 최근 수집이 진행된 카탈로그
+    - my-catalogs를 받아 클라이언트에서 합산하는 대신 집계 쿼리 2개로 계산
+    """
+    try:
+        summary = user_catalog_crud.get_collection_summary(db, user_id, recent_limit)
+        return CollectionSummary(**summary)
+        
+    except Exception as e:
+        logger.error(f"수집 현황 요약 실패: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"수집 현황 요약 실패: {str(e)}")
+
 @router.post("/save-catalog")
 async def save_catalog(
     request: UserCatalogSave,
@@ -67,6 +90,7 @@ async def save_catalog(
 ):
     """
     다른 사용자의 카탈로그를 복사하여 내 카탈로그로 저장
+    - mode=reference이면 아이템을 복사하지 않고 원본 아이템을 공유 (수정한 아이템만 복사)
     """
     try:
         logger.info(f"사용자 {user_id}가 카탈로그 {request.catalog_id} 저장 요청")
@@ -91,16 +115,19 @@ async def save_catalog(
             raise HTTPException(status_code=400, detail="이미 저장된 카탈로그입니다")
         
         # 카탈로그 복사
-        result = user_catalog_crud.save_catalog(db, user_id, request.catalog_id)
+        result = await run_write(db, user_catalog_crud.save_catalog, user_id, request.catalog_id, request.mode)
         
         logger.info(f"사용자 {user_id}가 카탈로그 {request.catalog_id}를 {result['copied_catalog_id']}로 복사 완료")
         
         return {
             "message": "카탈로그가 성공적으로 저장되었습니다",
             "copied_catalog_id": result["copied_catalog_id"],
-            "original_catalog_id": result["original_catalog_id"]
+            "original_catalog_id": result["original_catalog_id"],
+            "mode": result["mode"]
         }
         
+    except HTTPException:
+        raise
     except Exception as e:
         db.rollback()
         logger.error(f"카탈로그 저장 실패: {str(e)}")
@@ -136,6 +163,76 @@ async def unsave_catalog(
         logger.error(f"카탈로그 삭제 실패: {str(e)}")
         raise HTTPException(status_code=500, detail=f"카탈로그 삭제 실패: {str(e)}")
 
+def _get_saved_catalog_ref(db: Session, user_id: str, copied_catalog_id: str) -> UserCatalogDB:
+    """동기화할 저장 기록 조회 - 내가 저장한 복사본이 아니거나 원본이 삭제되었으면 404"""
+    ref = user_catalog_crud.get_user_catalog_by_copy(db, user_id, copied_catalog_id)
+    if not ref:
+        raise HTTPException(status_code=404, detail="저장한 카탈로그를 찾을 수 없습니다")
+    
+    if not catalog_crud.get_catalog(db, ref.original_catalog_id):
+        raise HTTPException(status_code=404, detail="원본 카탈로그가 삭제되었습니다")
+    
+    return ref
+
+@router.get("/sync-saved/{copied_catalog_id}", response_model=SavedCatalogSyncResult)
+def preview_saved_catalog_sync(
+    copied_catalog_id: str,
+    user_id: str = Depends(get_current_user_id),
+    db: Session = Depends(get_db)
+):
+    """
+    저장한 카탈로그에 반영될 원본 변경 미리보기 (반영하지 않음)
+    """
+    try:
+        ref = _get_saved_catalog_ref(db, user_id, copied_catalog_id)
+        counts = user_catalog_crud.preview_saved_catalog_sync(db, ref.original_catalog_id, copied_catalog_id)
+        
+        return SavedCatalogSyncResult(
+            copied_catalog_id=copied_catalog_id,
+            original_catalog_id=ref.original_catalog_id,
+            applied=False,
+            **counts
+        )
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"저장한 카탈로그 변경 확인 실패: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"저장한 카탈로그 변경 확인 실패: {str(e)}")
+
+@router.post("/sync-saved/{copied_catalog_id}", response_model=SavedCatalogSyncResult)
+async def sync_saved_catalog(
+    copied_catalog_id: str,
+    user_id: str = Depends(get_current_user_id),
+    db: Session = Depends(get_db)
+):
+    """
+    저장한 카탈로그를 원본과 동기화
+    - 다시 저장(전체 복사)하지 않고 원본에서 추가/수정/삭제된 아이템만 반영
+    - 유지되는 아이템의 보유 상태, 사용자가 직접 추가/수정/삭제한 아이템은 그대로 유지
+    """
+    try:
+        ref = _get_saved_catalog_ref(db, user_id, copied_catalog_id)
+        counts = await run_write(
+            db, user_catalog_crud.sync_saved_catalog, user_id, ref.original_catalog_id, copied_catalog_id
+        )
+        
+        logger.info(f"사용자 {user_id}의 저장 카탈로그 {copied_catalog_id} 동기화: {counts}")
+        
+        return SavedCatalogSyncResult(
+            copied_catalog_id=copied_catalog_id,
+            original_catalog_id=ref.original_catalog_id,
+            applied=True,
+            **counts
+        )
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        db.rollback()
+        logger.error(f"저장한 카탈로그 동기화 실패: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"저장한 카탈로그 동기화 실패: {str(e)}")
+
 @router.get("/check-ownership/{catalog_id}")
 async def check_catalog_ownership(
     catalog_id: str,
@@ -188,6 +285,35 @@ async def check_catalog_saved(
         logger.error(f"저장 여부 확인 실패: {str(e)}")
         raise HTTPException(status_code=500, detail=f"저장 여부 확인 실패: {str(e)}")
 
+@router.post("/check-saved", response_model=CheckSavedResponse)
+def check_catalogs_saved(
+    request: CheckSavedRequest,
+    user_id: str = Depends(get_current_user_id),
+    db: Session = Depends(get_read_db)  # 조회만 하므로 POST여도 읽기 전용 세션 사용
+):
+    """
+    여러 카탈로그의 저장 여부 한 번에 확인 (원본 카탈로그 ID 목록 기준)
+    - 카드마다 GET /check-saved/{id}를 호출하지 않고 화면에 보이는 카탈로그를 한 번에 확인 (IN 쿼리 한 번)
+    """
+    try:
+        saved_catalogs = user_catalog_crud.get_saved_catalog_map(db, user_id, request.catalog_ids)
+        
+        return CheckSavedResponse(
+            user_id=user_id,
+            results=[
+                CheckSavedResult(
+                    original_catalog_id=catalog_id,
+                    is_saved=catalog_id in saved_catalogs,
+                    copied_catalog_id=saved_catalogs.get(catalog_id)
+                )
+                for catalog_id in request.catalog_ids
+            ]
+        )
+        
+    except Exception as e:
+        logger.error(f"저장 여부 일괄 확인 실패: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"저장 여부 일괄 확인 실패: {str(e)}")
+
 
 
 @router.get("/debug/user-info")
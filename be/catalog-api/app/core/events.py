@@ -0,0 +1,266 @@
+"""
+Catalog-API 실시간 변경 알림 (pub/sub)
+- 쓰기 작업이 남긴 이벤트를 커밋 후 대상 사용자의 구독자(WebSocket 연결, /api/events/ws)에게 전달
+- 구독자 관리는 항상 프로세스 안에서 (사용자 ID → 연결별 asyncio.Queue)
+- 프로세스 간 전달 방식은 EVENTS_BACKEND로 선택
+  - memory: 같은 프로세스의 구독자에게만 전달 (단일 워커)
+  - redis: Redis pub/sub 채널로 발행하고 워커마다 채널을 구독하여 자기 프로세스의 구독자에게 전달 (멀티 워커, redis 패키지 필요)
+- 쓰기 작업은 스레드 풀/쓰기 조정기 스레드에서 실행되므로 발행은 스레드 안전하게 이벤트 루프로 넘김
+- 연결의 대기 이벤트가 EVENTS_QUEUE_SIZE를 넘으면 쌓인 이벤트를 버리고 resync 이벤트 하나만 전달
+  (클라이언트는 /api/sync로 변경분을 다시 받음)
+"""
+import asyncio
+import json
+import logging
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+
+logger = logging.getLogger("API_COMMUNICATION")
+
+# 이벤트 종류
+CATALOG_CREATED = "catalog.created"
+CATALOG_UPDATED = "catalog.updated"
+CATALOG_DELETED = "catalog.deleted"
+ITEM_CREATED = "item.created"
+ITEM_UPDATED = "item.updated"
+ITEM_DELETED = "item.deleted"
+ITEM_OWNED = "item.owned"
+RESYNC = "resync"
+
+# 커밋 후 발행할 이벤트를 모아 두는 세션 info 키
+PENDING_EVENTS_KEY = "pending_events"
+# 세션 커밋 시 바로 발행하지 않고 호출한 쪽(쓰기 조정기)이 실제 커밋 후 발행
+DEFER_EVENTS_KEY = "defer_events"
+
+# 대기 이벤트: (사용자 ID, 이벤트)
+PendingEvent = Tuple[str, Dict[str, Any]]
+
+
+def _isoformat(value) -> Optional[str]:
+    return value.isoformat() if value is not None else None
+
+
+def catalog_event(event_type: str, catalog_record) -> Dict[str, Any]:
+    """카탈로그 이벤트 (삭제 이벤트는 ID만)"""
+    payload: Dict[str, Any] = {"type": event_type, "catalog_id": catalog_record.catalog_id}
+    if event_type != CATALOG_DELETED:
+        payload["catalog"] = {
+            "title": catalog_record.title,
+            "description": catalog_record.description,
+            "category": catalog_record.category,
+            "tags": catalog_record.tags or [],
+            "visibility": catalog_record.visibility,
+            "thumbnail_url": catalog_record.thumbnail_url,
+            "updated_at": _isoformat(catalog_record.updated_at),
+        }
+    return payload
+
+
+def item_event(event_type: str, item_record) -> Dict[str, Any]:
+    """아이템 이벤트 (삭제 이벤트는 ID만, 보유 여부는 item.owned 이벤트로 따로 전달)"""
+    payload: Dict[str, Any] = {
+        "type": event_type,
+        "catalog_id": item_record.catalog_id,
+        "item_id": item_record.item_id,
+    }
+    if event_type != ITEM_DELETED:
+        payload["item"] = {
+            "name": item_record.name,
+            "description": item_record.description,
+            "image_url": item_record.image_url,
+            "user_fields": item_record.user_fields or {},
+            "created_at": _isoformat(item_record.created_at),
+            "updated_at": _isoformat(item_record.updated_at),
+        }
+    return payload
+
+
+def owned_event(item_record, owned: bool) -> Dict[str, Any]:
+    """보유 상태 변경 이벤트"""
+    return {
+        "type": ITEM_OWNED,
+        "catalog_id": item_record.catalog_id,
+        "item_id": item_record.item_id,
+        "owned": owned,
+    }
+
+
+class EventHub:
+    """프로세스 안의 구독자 관리 - 사용자별 연결 큐에 이벤트 전달 (이벤트 루프 스레드에서만 호출)"""
+    
+    def __init__(self, queue_size: int):
+        self.queue_size = max(1, queue_size)
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self._subscribers: Dict[str, Set[asyncio.Queue]] = {}
+    
+    def subscribe(self, user_id: str) -> asyncio.Queue:
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        self._subscribers.setdefault(user_id, set()).add(queue)
+        return queue
+    
+    def unsubscribe(self, user_id: str, queue: asyncio.Queue) -> None:
+        queues = self._subscribers.get(user_id)
+        if queues is None:
+            return
+        queues.discard(queue)
+        if not queues:
+            del self._subscribers[user_id]
+    
+    def subscriber_count(self) -> int:
+        return sum(len(queues) for queues in self._subscribers.values())
+    
+    def deliver(self, user_id: str, payload: Dict[str, Any]) -> None:
+        """사용자의 모든 연결에 전달 - 가득 찬 큐는 비우고 resync 이벤트로 대체"""
+        for queue in self._subscribers.get(user_id, ()):
+            try:
+                queue.put_nowait(payload)
+            except asyncio.QueueFull:
+                while not queue.empty():
+                    queue.get_nowait()
+                queue.put_nowait({"type": RESYNC})
+    
+    def deliver_threadsafe(self, user_id: str, payload: Dict[str, Any]) -> None:
+        """다른 스레드에서 호출 가능한 전달 (이벤트 루프에 예약)"""
+        if self.loop is not None and not self.loop.is_closed():
+            self.loop.call_soon_threadsafe(self.deliver, user_id, payload)
+
+
+class EventBackend(ABC):
+    """프로세스 간 이벤트 전달 인터페이스 (publish는 각 백엔드에서 구현)"""
+    
+    async def start(self, hub: EventHub) -> None:
+        self.hub = hub
+    
+    async def stop(self) -> None:
+        pass
+    
+    @abstractmethod
+    def publish(self, user_id: str, payload: Dict[str, Any]) -> None:
+        """이벤트 발행 (어느 스레드에서나 호출 가능)"""
+
+
+class MemoryEventBackend(EventBackend):
+    """같은 프로세스의 구독자에게만 전달"""
+    
+    def publish(self, user_id: str, payload: Dict[str, Any]) -> None:
+        self.hub.deliver_threadsafe(user_id, payload)
+
+
+class RedisEventBackend(EventBackend):
+    """Redis pub/sub으로 모든 워커에 전달 - 채널 이름은 EVENTS_REDIS_CHANNEL_PREFIX + 사용자 ID"""
+    
+    def __init__(self):
+        try:
+            import redis.asyncio as redis
+        except ImportError:
+            raise RuntimeError("Redis 이벤트 백엔드를 사용하려면 redis를 설치해야 합니다 (pip install redis)")
+        
+        self.prefix = settings.EVENTS_REDIS_CHANNEL_PREFIX
+        self.client = redis.from_url(settings.EVENTS_REDIS_URL)
+        self._listener: Optional[asyncio.Task] = None
+    
+    async def start(self, hub: EventHub) -> None:
+        await super().start(hub)
+        pubsub = self.client.pubsub(ignore_subscribe_messages=True)
+        await pubsub.psubscribe(f"{self.prefix}*")
+        self._listener = asyncio.create_task(self._listen(pubsub))
+    
+    async def stop(self) -> None:
+        if self._listener is not None:
+            self._listener.cancel()
+        await self.client.aclose()
+    
+    async def _listen(self, pubsub) -> None:
+        """구독한 채널의 메시지를 이 프로세스의 구독자에게 전달"""
+        try:
+            async for message in pubsub.listen():
+                channel = message["channel"]
+                if isinstance(channel, bytes):
+                    channel = channel.decode("utf-8")
+                try:
+                    self.hub.deliver(channel[len(self.prefix):], json.loads(message["data"]))
+                except (ValueError, TypeError) as e:
+                    logger.warning(f"⚠️ 잘못된 이벤트 메시지 무시: {e}")
+        finally:
+            await pubsub.aclose()
+    
+    def publish(self, user_id: str, payload: Dict[str, Any]) -> None:
+        loop = self.hub.loop
+        if loop is None or loop.is_closed():
+            return
+        message = json.dumps(payload, ensure_ascii=False)
+        future = asyncio.run_coroutine_threadsafe(self.client.publish(f"{self.prefix}{user_id}", message), loop)
+        future.add_done_callback(_log_publish_error)
+
+
+def _log_publish_error(future) -> None:
+    if not future.cancelled() and future.exception() is not None:
+        logger.warning(f"⚠️ 이벤트 발행 실패: {future.exception()}")
+
+
+# 앱 전체에서 공유하는 구독자 관리/백엔드 (서버 시작 시 생성)
+_hub: Optional[EventHub] = None
+_backend: Optional[EventBackend] = None
+
+
+async def start_event_bus() -> None:
+    """서버 시작 시 이벤트 전달 시작 (lifespan 안에서 호출)"""
+    global _hub, _backend
+    if _hub is not None:
+        return
+    hub = EventHub(settings.EVENTS_QUEUE_SIZE)
+    hub.loop = asyncio.get_running_loop()
+    backend = RedisEventBackend() if settings.EVENTS_BACKEND == "redis" else MemoryEventBackend()
+    await backend.start(hub)
+    _hub, _backend = hub, backend
+
+
+async def stop_event_bus() -> None:
+    """서버 종료 시 이벤트 전달 중지"""
+    global _hub, _backend
+    if _backend is not None:
+        await _backend.stop()
+    _hub, _backend = None, None
+
+
+def get_event_hub() -> Optional[EventHub]:
+    return _hub
+
+
+def publish(user_id: str, payload: Dict[str, Any]) -> None:
+    """이벤트 즉시 발행 (이벤트 전달이 시작되지 않았으면 무시)"""
+    if _backend is not None:
+        _backend.publish(user_id, payload)
+
+
+def publish_all(pending: List[PendingEvent]) -> None:
+    for user_id, payload in pending:
+        publish(user_id, payload)
+
+
+def publish_after_commit(db: Session, user_id: Optional[str], payload: Dict[str, Any]) -> None:
+    """세션이 커밋된 뒤 발행할 이벤트 등록 (롤백되면 버림, user_id가 없으면 무시)"""
+    if user_id is not None:
+        db.info.setdefault(PENDING_EVENTS_KEY, []).append((user_id, payload))
+
+
+def take_pending_events(db: Session) -> List[PendingEvent]:
+    """세션에 등록된 이벤트를 꺼냄 (쓰기 조정기가 묶음 커밋 후 발행)"""
+    return db.info.pop(PENDING_EVENTS_KEY, [])
+
+
+@event.listens_for(Session, "after_commit")
+def _publish_pending_events(session: Session) -> None:
+    if not session.info.get(DEFER_EVENTS_KEY):
+        publish_all(take_pending_events(session))
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_pending_events(session: Session) -> None:
+    if not session.info.get(DEFER_EVENTS_KEY):
+        session.info.pop(PENDING_EVENTS_KEY, None)
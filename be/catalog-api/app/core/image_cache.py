@@ -0,0 +1,255 @@
+"""
+Catalog-API 이미지 형식 변환 캐시
+- Accept 헤더에 따라 업로드 이미지(JPEG/PNG)를 WebP/AVIF로 변환하여 제공
+- 변환은 첫 요청 시 이미지 처리 프로세스 풀에서 실행하고, 결과는 디스크 캐시(UPLOAD_DIR/.cache)에 저장
+- 캐시는 전체 크기 상한(IMAGE_TRANSCODE_CACHE_MAX_BYTES)을 넘으면 가장 오래 사용하지 않은 파일부터 삭제 (LRU)
+- 원본 파일은 변경하지 않음
+"""
+import asyncio
+import hashlib
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from starlette.concurrency import run_in_threadpool
+
+from app.core.config import settings
+from app.core.images import get_image_executor, transcode_image
+
+logger = logging.getLogger("API_COMMUNICATION")
+
+# 형식 변환 캐시 폴더 (UPLOAD_DIR 기준)
+TRANSCODE_CACHE_DIR = ".cache"
+
+# 변환 대상 확장자 (GIF는 애니메이션 보존, WebP는 이미 압축 형식이므로 원본 사용)
+TRANSCODABLE_EXTENSIONS = {".jpg", ".jpeg", ".png"}
+
+# 형식별 MIME 타입, Pillow 저장 형식, 파일 확장자, 압축 품질
+TRANSCODE_FORMATS = {
+    "avif": {"media_type": "image/avif", "pillow_format": "AVIF", "extension": ".avif", "quality": 55},
+    "webp": {"media_type": "image/webp", "pillow_format": "WEBP", "extension": ".webp", "quality": 80},
+}
+
+
+def _accepted_media_types(accept_header: str) -> Dict[str, float]:
+    """Accept 헤더를 {MIME 타입: q 값} 형태로 변환"""
+    accepted = {}
+    for part in accept_header.split(","):
+        media_type, *params = [token.strip() for token in part.split(";")]
+        if not media_type:
+            continue
+        quality = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        accepted[media_type.lower()] = quality
+    return accepted
+
+
+def negotiate_format(accept_header: Optional[str], formats: List[str]) -> Optional[str]:
+    """
+    클라이언트가 명시적으로 받을 수 있다고 밝힌 변환 형식 선택
+    - formats 순서(설정한 선호 순서)대로 Accept 헤더에 q > 0으로 포함된 첫 형식
+    - image/* 나 */* 만 보낸 클라이언트는 원본 형식 그대로 제공
+    """
+    if not accept_header:
+        return None
+    
+    accepted = _accepted_media_types(accept_header)
+    for name in formats:
+        if accepted.get(TRANSCODE_FORMATS[name]["media_type"], 0) > 0:
+            return name
+    return None
+
+
+# 설치된 Pillow가 저장할 수 있는 변환 형식 (첫 사용 시 확인)
+_available_formats: Optional[List[str]] = None
+
+
+def available_formats() -> List[str]:
+    """IMAGE_TRANSCODE_FORMATS 중 현재 Pillow 빌드가 지원하는 형식 (선호 순서 유지)"""
+    global _available_formats
+    if _available_formats is None:
+        from PIL import features
+        
+        _available_formats = []
+        for name in settings.IMAGE_TRANSCODE_FORMATS:
+            if name not in TRANSCODE_FORMATS:
+                continue
+            try:
+                if features.check(name):
+                    _available_formats.append(name)
+            except ValueError:
+                continue
+    return _available_formats
+
+
+def is_transcodable(file_path: Path) -> bool:
+    """형식 변환 대상 이미지인지 확인"""
+    return file_path.suffix.lower() in TRANSCODABLE_EXTENSIONS
+
+
+class TranscodeCache:
+    """
+    크기 제한이 있는 디스크 LRU 캐시
+    - 사용 순서는 메모리(OrderedDict)에서 관리하고, 파일 접근 시간(atime)에도 기록하여 서버 재시작 후 복원
+    - 수정 시간(mtime)은 ETag/Last-Modified에 쓰이므로 변경하지 않음
+    - 여러 스레드(스레드 풀)에서 호출되므로 잠금으로 보호
+    """
+    
+    def __init__(self, directory: Path, max_bytes: int):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[str, int]" = OrderedDict()  # 파일 경로 → 크기 (오래된 순)
+        self._total_bytes = 0
+        self._loaded = False
+        self._lock = threading.Lock()
+    
+    def cache_path(self, source: Path, stat_result: os.stat_result, format_name: str) -> Path:
+        """원본 파일(실제 경로, 크기, 수정 시간)과 형식으로 정해지는 캐시 파일 경로"""
+        fingerprint = f"{source}:{stat_result.st_size}:{stat_result.st_mtime_ns}:{format_name}"
+        digest = hashlib.sha256(fingerprint.encode("utf-8")).hexdigest()
+        extension = TRANSCODE_FORMATS[format_name]["extension"]
+        return self.directory / digest[:2] / f"{digest}{extension}"
+    
+    def _load(self) -> None:
+        """디스크의 기존 캐시 파일을 사용 시간 순서로 읽어 들임 (최초 1회)"""
+        if self._loaded:
+            return
+        
+        found = []
+        for root, _, filenames in os.walk(self.directory):
+            for filename in filenames:
+                path = os.path.join(root, filename)
+                if filename.startswith("."):
+                    continue
+                try:
+                    stat_result = os.stat(path)
+                except FileNotFoundError:
+                    continue
+                found.append((stat_result.st_atime, path, stat_result.st_size))
+        
+        for _, path, size in sorted(found):
+            self._entries[path] = size
+            self._total_bytes += size
+        self._loaded = True
+        self._evict()
+    
+    def lookup(self, path: Path) -> bool:
+        """캐시 적중 여부 확인 (적중 시 최근 사용으로 갱신)"""
+        with self._lock:
+            self._load()
+            key = str(path)
+            try:
+                stat_result = path.stat()
+            except FileNotFoundError:
+                # 다른 워커 프로세스가 삭제한 경우
+                self._remove(key)
+                return False
+            
+            if key in self._entries:
+                self._entries.move_to_end(key)
+            else:
+                # 다른 워커 프로세스가 만든 파일
+                self._add(key, stat_result.st_size)
+            
+            os.utime(path, ns=(time.time_ns(), stat_result.st_mtime_ns))
+            return True
+    
+    def add(self, path: Path, size: int) -> None:
+        """새로 만든 캐시 파일 등록 후 상한을 넘으면 오래된 파일 삭제"""
+        with self._lock:
+            self._load()
+            self._add(str(path), size)
+            self._evict(keep=str(path))
+    
+    def _add(self, key: str, size: int) -> None:
+        if key in self._entries:
+            self._total_bytes -= self._entries.pop(key)
+        self._entries[key] = size
+        self._total_bytes += size
+    
+    def _remove(self, key: str) -> None:
+        self._total_bytes -= self._entries.pop(key, 0)
+    
+    def _evict(self, keep: Optional[str] = None) -> None:
+        """전체 크기가 상한 이하가 될 때까지 가장 오래 사용하지 않은 파일 삭제"""
+        while self._total_bytes > self.max_bytes and self._entries:
+            key, size = next(iter(self._entries.items()))
+            if key == keep:
+                break
+            self._entries.popitem(last=False)
+            self._total_bytes -= size
+            try:
+                os.unlink(key)
+            except FileNotFoundError:
+                pass
+
+
+class ImageTranscoder:
+    """
+    형식 변환 요청 처리
+    - 캐시에 있으면 바로 반환, 없으면 프로세스 풀에서 변환 후 캐시에 등록
+    - 같은 파일/형식의 동시 요청은 하나의 변환 작업을 함께 기다림
+    """
+    
+    def __init__(self, cache: TranscodeCache):
+        self.cache = cache
+        self._pending: Dict[str, asyncio.Future] = {}
+    
+    async def get(self, source: Path, stat_result: os.stat_result, format_name: str) -> Optional[Path]:
+        """변환된 캐시 파일 경로 (변환 실패 시 None - 원본으로 응답)"""
+        target = self.cache.cache_path(source, stat_result, format_name)
+        if await run_in_threadpool(self.cache.lookup, target):
+            return target
+        
+        key = str(target)
+        pending = self._pending.get(key)
+        if pending is None:
+            pending = asyncio.ensure_future(self._transcode(source, target, format_name))
+            self._pending[key] = pending
+            pending.add_done_callback(lambda _: self._pending.pop(key, None))
+        
+        try:
+            return await asyncio.shield(pending)
+        except Exception as e:
+            logger.warning(f"⚠️ 이미지 형식 변환 실패 ({format_name}): {source.name} ({e})")
+            return None
+    
+    async def _transcode(self, source: Path, target: Path, format_name: str) -> Path:
+        spec = TRANSCODE_FORMATS[format_name]
+        loop = asyncio.get_running_loop()
+        size = await loop.run_in_executor(
+            get_image_executor(),
+            transcode_image,
+            str(source),
+            str(target),
+            spec["pillow_format"],
+            spec["quality"]
+        )
+        await run_in_threadpool(self.cache.add, target, size)
+        return target
+
+
+# 앱 전체에서 공유하는 변환기 (첫 사용 시 생성)
+_transcoder: Optional[ImageTranscoder] = None
+
+
+def get_transcoder() -> ImageTranscoder:
+    """형식 변환기 반환 (없으면 생성)"""
+    global _transcoder
+    if _transcoder is None:
+        cache = TranscodeCache(
+            Path(settings.UPLOAD_DIR) / TRANSCODE_CACHE_DIR,
+            settings.IMAGE_TRANSCODE_CACHE_MAX_BYTES
+        )
+        _transcoder = ImageTranscoder(cache)
+    return _transcoder
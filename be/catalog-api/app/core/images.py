@@ -0,0 +1,189 @@
+"""
+Catalog-API 이미지 처리 유틸리티
+- 업로드된 이미지의 크기별 리사이즈 버전(썸네일) 생성
+- CPU를 많이 쓰는 리사이즈 작업은 별도 프로세스 풀에서 실행 (요청 처리 경로와 분리)
+- 요청된 크기에 맞는 리사이즈 파일 경로 선택
+"""
+import logging
+import multiprocessing
+import os
+import re
+import tempfile
+from concurrent.futures import Future, ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from app.core.config import settings
+
+logger = logging.getLogger("API_COMMUNICATION")
+
+# 내용 주소 저장(cas) 방식 파일이 저장되는 UPLOAD_DIR 하위 경로
+CAS_PREFIX = "images/cas"
+
+# 리사이즈 대상 확장자 (GIF는 애니메이션 보존을 위해 원본만 사용)
+RESIZABLE_EXTENSIONS = {".jpg", ".jpeg", ".png", ".webp"}
+
+# 리사이즈 전용 프로세스 풀 (첫 사용 시 생성)
+_executor: Optional[ProcessPoolExecutor] = None
+
+
+def get_image_executor() -> ProcessPoolExecutor:
+    """이미지 처리용 프로세스 풀 반환 (없으면 생성)"""
+    global _executor
+    if _executor is None:
+        _executor = ProcessPoolExecutor(
+            max_workers=settings.IMAGE_WORKERS,
+            mp_context=multiprocessing.get_context("spawn")
+        )
+    return _executor
+
+
+def shutdown_image_executor() -> None:
+    """서버 종료 시 프로세스 풀 정리 (대기 중인 작업은 취소)"""
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
+
+
+def is_resizable(file_path: Path) -> bool:
+    """리사이즈 버전을 만드는 이미지 형식인지 확인"""
+    return file_path.suffix.lower() in RESIZABLE_EXTENSIONS
+
+
+def variant_path(file_path: Path, size: int) -> Path:
+    """원본 경로에 대응하는 리사이즈 파일 경로 (예: abc.jpg → abc_512.jpg)"""
+    return file_path.with_name(f"{file_path.stem}_{size}{file_path.suffix}")
+
+
+# 리사이즈 파일명의 크기 접미사 (예: abc_512.jpg)
+_VARIANT_SUFFIX = re.compile(r"^(?P<stem>.+)_(?P<size>\d+)$")
+
+
+def variant_source(file_path: Path) -> Optional[Path]:
+    """리사이즈 파일 경로이면 원본 경로 (설정된 크기의 리사이즈 파일명이 아니면 None)"""
+    match = _VARIANT_SUFFIX.match(file_path.stem)
+    if not match or int(match.group("size")) not in settings.IMAGE_VARIANT_SIZES:
+        return None
+    return file_path.with_name(f"{match.group('stem')}{file_path.suffix}")
+
+
+def variant_urls(file_url: str, file_path: Path) -> Dict[str, str]:
+    """크기별 리사이즈 이미지 URL (리사이즈 대상이 아니면 빈 dict)"""
+    if not is_resizable(file_path):
+        return {}
+    
+    base_url = file_url.rsplit("/", 1)[0]
+    return {
+        str(size): f"{base_url}/{variant_path(file_path, size).name}"
+        for size in settings.IMAGE_VARIANT_SIZES
+    }
+
+
+def generate_variants(file_path: str, sizes: List[int]) -> List[str]:
+    """
+    크기별 리사이즈 이미지 생성 (프로세스 풀 워커에서 실행)
+    - 긴 변 기준으로 비율을 유지하며 축소 (원본보다 크게 늘리지 않음)
+    - 작업마다 고유한 임시 파일에 저장 후 원자적으로 이름 변경 (같은 내용을 동시에 처리해도 서로 덮어쓰지 않음)
+    - 생성된 파일 경로 목록 반환
+    """
+    # 워커 프로세스에서만 필요한 무거운 모듈은 지연 로딩
+    from PIL import Image, ImageOps
+    
+    source = Path(file_path)
+    created = []
+    
+    with Image.open(source) as original:
+        image_format = original.format
+        image = ImageOps.exif_transpose(original)
+        
+        for size in sorted(sizes, reverse=True):
+            target = variant_path(source, size)
+            if target.exists():
+                continue
+            
+            resized = image.copy()
+            resized.thumbnail((size, size), Image.LANCZOS)
+            if image_format == "JPEG" and resized.mode not in ("RGB", "L"):
+                resized = resized.convert("RGB")
+            
+            with tempfile.NamedTemporaryFile(dir=target.parent, prefix=f".{target.name}.", suffix=".tmp", delete=False) as temp_file:
+                temp_target = Path(temp_file.name)
+                try:
+                    resized.save(temp_file, format=image_format, quality=85, optimize=True)
+                except Exception:
+                    temp_file.close()
+                    temp_target.unlink(missing_ok=True)
+                    raise
+            os.replace(temp_target, target)
+            created.append(str(target))
+    
+    return created
+
+
+def _log_variant_result(future: Future) -> None:
+    """리사이즈 작업 실패 시 로그 기록 (요청 처리에는 영향 없음)"""
+    if future.cancelled():
+        return
+    error = future.exception()
+    if error is not None:
+        logger.warning(f"⚠️ 리사이즈 이미지 생성 실패: {error}")
+
+
+def schedule_variants(file_path: Path) -> Optional[Future]:
+    """업로드된 이미지의 리사이즈 작업을 백그라운드 프로세스 풀에 등록"""
+    if not is_resizable(file_path) or not settings.IMAGE_VARIANT_SIZES:
+        return None
+    
+    future = get_image_executor().submit(generate_variants, str(file_path), settings.IMAGE_VARIANT_SIZES)
+    future.add_done_callback(_log_variant_result)
+    return future
+
+
+def expected_variant(file_path: Path, size: Optional[int]) -> Optional[Path]:
+    """요청 크기에 대응하는 리사이즈 파일 경로 (size 이상인 버전 중 가장 작은 것, 해당 버전이 없으면 None)"""
+    if not size or not is_resizable(file_path):
+        return None
+    
+    for variant_size in sorted(settings.IMAGE_VARIANT_SIZES):
+        if variant_size >= size:
+            return variant_path(file_path, variant_size)
+    
+    return None
+
+
+def resolve_variant(file_path: Path, size: Optional[int]) -> Path:
+    """
+    요청 크기에 맞는 파일 선택
+    - size 이상인 리사이즈 버전 중 가장 작은 것
+    - 아직 생성되지 않았거나 size가 가장 큰 버전보다 크면 원본
+    """
+    candidate = expected_variant(file_path, size)
+    return candidate if candidate is not None and candidate.exists() else file_path
+
+
+def transcode_image(source_path: str, target_path: str, image_format: str, quality: int) -> int:
+    """
+    이미지를 다른 형식(WebP/AVIF)으로 변환하여 저장 (프로세스 풀 워커에서 실행)
+    - 원본 파일은 변경하지 않음
+    - 임시 파일에 저장 후 원자적으로 이름 변경
+    - 저장된 파일 크기 반환
+    """
+    from PIL import Image, ImageOps
+    
+    target = Path(target_path)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    temp_target = target.with_name(f".{target.name}.{os.getpid()}.tmp")
+    
+    with Image.open(source_path) as original:
+        image = ImageOps.exif_transpose(original)
+        if image.mode not in ("RGB", "RGBA"):
+            image = image.convert("RGBA" if "A" in image.getbands() or "transparency" in image.info else "RGB")
+        
+        try:
+            image.save(temp_target, format=image_format, quality=quality)
+            os.replace(temp_target, target)
+        finally:
+            temp_target.unlink(missing_ok=True)
+    
+    return target.stat().st_size
@@ -0,0 +1,173 @@
+"""
+Catalog-API 이벤트 루프 지연 모니터
+- 이벤트 루프에서 LOOP_MONITOR_INTERVAL_MS마다 깨어나는 작업이 예정 시각보다 늦게 실행된 시간(스케줄링 지연)을 계속 기록
+- async 라우트 안의 동기 작업(동기 SQLAlchemy, requests, 파일 복사, 동기 로깅 등)이 루프를 막으면 지연이 커짐
+- 감시 스레드가 루프의 마지막 응답 시각을 확인하여 LOOP_STALL_THRESHOLD_MS를 넘게 멈추면
+  그 순간 루프 스레드의 스택(루프를 막고 있는 코루틴의 동기 호출)을 로그에 기록
+- 최근 지연 샘플의 백분위수와 최근 멈춤 기록은 snapshot()으로 조회 (/metrics/loop-lag)
+"""
+import asyncio
+import logging
+import os
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from typing import Deque, Dict, List, Optional
+
+from app.core.config import settings
+
+logger = logging.getLogger("API_COMMUNICATION")
+
+# 앱 코드 경로 (멈춤 원인 프레임 표시용)
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 보관할 최근 멈춤 기록 수
+MAX_STALL_RECORDS = 50
+
+
+def _percentile(ordered: List[float], pct: float) -> float:
+    """정렬된 샘플의 최근접 순위(nearest-rank) 백분위수"""
+    if not ordered:
+        return 0.0
+    rank = max(0, min(len(ordered) - 1, int(round(pct / 100 * len(ordered) + 0.5)) - 1))
+    return ordered[rank]
+
+
+def _blocking_frame(frame) -> Optional[str]:
+    """스택에서 가장 안쪽의 앱 코드 프레임 (파일:줄 함수) - 어떤 핸들러가 루프를 막았는지 표시"""
+    while frame is not None:
+        filename = frame.f_code.co_filename
+        if filename.startswith(APP_DIR):
+            return f"{os.path.relpath(filename, os.path.dirname(APP_DIR))}:{frame.f_lineno} {frame.f_code.co_name}"
+        frame = frame.f_back
+    return None
+
+
+class LoopLagMonitor:
+    """
+    이벤트 루프 지연 측정기
+    - 루프 작업(_measure): 주기마다 지연 샘플 기록 및 마지막 응답 시각 갱신
+    - 감시 스레드(_watch): 마지막 응답 시각이 임계값보다 오래되면 루프 스레드 스택 기록 (멈춤 1회당 1번)
+    """
+    
+    def __init__(self, interval: float, stall_threshold: float, window: int):
+        self.interval = interval
+        self.stall_threshold = stall_threshold
+        self.samples: Deque[float] = deque(maxlen=max(1, window))
+        self.stalls: Deque[Dict[str, object]] = deque(maxlen=MAX_STALL_RECORDS)
+        self.stall_count = 0
+        self._heartbeat = time.monotonic()
+        self._loop_thread_id: Optional[int] = None
+        self._task: Optional[asyncio.Task] = None
+        self._watchdog: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self._lock = threading.Lock()
+    
+    def start(self) -> None:
+        """현재 이벤트 루프에서 측정 작업과 감시 스레드 시작 (루프 안에서 호출)"""
+        self._loop_thread_id = threading.get_ident()
+        self._heartbeat = time.monotonic()
+        self._task = asyncio.get_running_loop().create_task(self._measure())
+        self._watchdog = threading.Thread(target=self._watch, name="loop-watchdog", daemon=True)
+        self._watchdog.start()
+    
+    def stop(self) -> None:
+        self._stop.set()
+        if self._task is not None:
+            self._task.cancel()
+        if self._watchdog is not None:
+            self._watchdog.join(timeout=1)
+    
+    async def _measure(self) -> None:
+        while True:
+            expected = time.monotonic() + self.interval
+            await asyncio.sleep(self.interval)
+            now = time.monotonic()
+            lag = max(0.0, now - expected)
+            with self._lock:
+                self.samples.append(lag)
+                self._heartbeat = now
+                # 감시 스레드가 기록한 멈춤이 끝났으면 전체 지연 시간 기록
+                if self.stalls and self.stalls[-1]["lag_ms"] is None and lag >= self.stall_threshold:
+                    self.stalls[-1]["lag_ms"] = round(lag * 1000, 1)
+    
+    def _watch(self) -> None:
+        reported_heartbeat = None
+        check_interval = max(0.01, self.stall_threshold / 4)
+        while not self._stop.wait(check_interval):
+            with self._lock:
+                heartbeat = self._heartbeat
+            stalled_for = time.monotonic() - heartbeat - self.interval
+            if stalled_for < self.stall_threshold or heartbeat == reported_heartbeat:
+                continue
+            reported_heartbeat = heartbeat
+            self._report_stall(stalled_for)
+    
+    def _report_stall(self, stalled_for: float) -> None:
+        """루프 스레드의 현재 스택을 로그와 멈춤 기록에 저장"""
+        frame = sys._current_frames().get(self._loop_thread_id)
+        if frame is None:
+            return
+        
+        blocking = _blocking_frame(frame)
+        stack = "".join(traceback.format_stack(frame))
+        with self._lock:
+            self.stall_count += 1
+            self.stalls.append({
+                "at": time.time(),
+                "detected_after_ms": round(stalled_for * 1000, 1),
+                "lag_ms": None,                 # 루프가 다시 실행되면 전체 지연 시간 기록
+                "blocking_frame": blocking,
+            })
+        logger.warning(
+            f"⚠️ 이벤트 루프가 {stalled_for * 1000:.0f}ms 이상 멈춤 (원인 추정: {blocking or '알 수 없음'})\n{stack}"
+        )
+    
+    def snapshot(self) -> Dict[str, object]:
+        """최근 지연 샘플 백분위수(ms)와 멈춤 기록"""
+        with self._lock:
+            ordered = sorted(self.samples)
+            stalls = list(self.stalls)
+            stall_count = self.stall_count
+        
+        return {
+            "interval_ms": self.interval * 1000,
+            "stall_threshold_ms": self.stall_threshold * 1000,
+            "samples": len(ordered),
+            "p50_ms": round(_percentile(ordered, 50) * 1000, 3),
+            "p95_ms": round(_percentile(ordered, 95) * 1000, 3),
+            "p99_ms": round(_percentile(ordered, 99) * 1000, 3),
+            "max_ms": round(ordered[-1] * 1000, 3) if ordered else 0.0,
+            "stall_count": stall_count,
+            "recent_stalls": stalls,
+        }
+
+
+# 앱 전체에서 공유하는 모니터 (LOOP_MONITOR_ENABLED일 때 서버 시작 시 생성)
+_monitor: Optional[LoopLagMonitor] = None
+
+
+def start_loop_monitor() -> None:
+    """서버 시작 시 이벤트 루프 지연 모니터 시작 (lifespan 안에서 호출)"""
+    global _monitor
+    if settings.LOOP_MONITOR_ENABLED and _monitor is None:
+        _monitor = LoopLagMonitor(
+            settings.LOOP_MONITOR_INTERVAL_MS / 1000,
+            settings.LOOP_STALL_THRESHOLD_MS / 1000,
+            settings.LOOP_LAG_WINDOW
+        )
+        _monitor.start()
+
+
+def stop_loop_monitor() -> None:
+    """서버 종료 시 모니터 중지"""
+    global _monitor
+    if _monitor is not None:
+        _monitor.stop()
+        _monitor = None
+
+
+def get_loop_monitor() -> Optional[LoopLagMonitor]:
+    return _monitor
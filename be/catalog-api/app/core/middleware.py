@@ -2,16 +2,45 @@
 Catalog-API 미들웨어
 - HTTP 요청/응답 로깅
 - Flutter 클라이언트와의 통신 내역을 명확하게 기록
+- 요청별 SQL 쿼리 수/DB 시간 집계 (Server-Timing 헤더, N+1 의심 경고)
+- 선택된 요청의 샘플링 프로파일링
 """
 import time
 import json
+import hmac
 import logging
+import random
 from fastapi import Request
+from fastapi.responses import JSONResponse
+from starlette.concurrency import run_in_threadpool
 from starlette.responses import StreamingResponse, Response
+from app.core.config import settings
+from app.core.query_stats import begin_request, current_stats
+from app.core.profiler import profile_filename, save_profile, start_profiler
 
 # Settings에서 설정한 API 전용 로거 사용
 logger = logging.getLogger("API_COMMUNICATION")
 
+# 바디를 메모리로 읽지 않고 크기만 기록하는 Content-Type (파일 업로드 등)
+STREAMED_BODY_CONTENT_TYPES = ("multipart/form-data", "application/octet-stream", "application/offset+octet-stream")
+
+# multipart 경계/헤더 등 파일 외 부분에 허용하는 여유 크기
+MULTIPART_OVERHEAD = 64 * 1024
+
+
+async def limit_upload_size_middleware(request: Request, call_next):
+    """업로드 크기 제한 미들웨어 - Content-Length가 한도를 넘으면 바디를 받기 전에 거부합니다."""
+    if request.method in ["POST", "PUT", "PATCH"] and request.url.path.startswith("/api/upload"):
+        content_length = request.headers.get("content-length")
+        if content_length and content_length.isdigit():
+            if int(content_length) > settings.MAX_UPLOAD_SIZE + MULTIPART_OVERHEAD:
+                return JSONResponse(
+                    status_code=413,
+                    content={"detail": f"파일 크기가 너무 큽니다. 최대 {settings.MAX_UPLOAD_SIZE} 바이트까지 업로드할 수 있습니다"}
+                )
+
+    return await call_next(request)
+
 
 async def log_requests_middleware(request: Request, call_next):
     """HTTP 요청/응답 로깅 미들웨어 - 모든 API 호출을 자동으로 기록합니다."""
@@ -24,8 +53,10 @@ async def log_requests_middleware(request: Request, call_next):
     # 1) HTTP REQUEST LOGGING
     # -------------------------------------------------------------------------
     body = b""
-    if request.method in ["POST", "PUT", "PATCH"]:
-        # 요청 바디 읽기 (GET은 바디 없음)
+    request_content_type = request.headers.get("content-type", "")
+    streamed_body = request_content_type.startswith(STREAMED_BODY_CONTENT_TYPES)
+    if request.method in ["POST", "PUT", "PATCH"] and not streamed_body:
+        # 요청 바디 읽기 (GET은 바디 없음, 파일 업로드는 메모리에 올리지 않음)
         body = await request.body()
 
     # 요청 헤더에서 중요 정보만 추출
@@ -50,25 +81,23 @@ async def log_requests_middleware(request: Request, call_next):
         logger.warning(f"   Headers: {json.dumps(important_headers, ensure_ascii=False)}")
 
     # 요청 바디 출력
-    if body:
-        content_type = request.headers.get("content-type", "")
-
-        if "multipart/form-data" in content_type:
-            # 파일 업로드의 경우 바이너리 데이터가 포함되므로 크기만 기록
-            logger.warning(f"   [Multipart form data, size: {len(body)} bytes]")
-        else:
+    if streamed_body:
+        # 파일 업로드는 바이너리 데이터가 포함되므로 헤더의 크기만 기록
+        content_length = request.headers.get("content-length", "unknown")
+        logger.warning(f"   [Streamed body ({request_content_type.split(';')[0]}), size: {content_length} bytes]")
+    elif body:
+        try:
+            # JSON 바디를 예쁘게 포맷팅하여 로깅
+            body_json = json.loads(body.decode("utf-8"))
+            body_str = json.dumps(body_json, ensure_ascii=False)
+            logger.warning(f"   {body_str}")
+        except UnicodeDecodeError:
+            logger.warning(f"   [Binary data, size: {len(body)} bytes]")
+        except json.JSONDecodeError:
             try:
-                # JSON 바디를 예쁘게 포맷팅하여 로깅
-                body_json = json.loads(body.decode("utf-8"))
-                body_str = json.dumps(body_json, ensure_ascii=False)
-                logger.warning(f"   {body_str}")
+                logger.warning(f"   {body.decode('utf-8')}")
             except UnicodeDecodeError:
-                logger.warning(f"   [Binary data, size: {len(body)} bytes]")
-            except json.JSONDecodeError:
-                try:
-                    logger.warning(f"   {body.decode('utf-8')}")
-                except UnicodeDecodeError:
-                    logger.warning(f"   [Non-UTF8 data, size: {len(body)} bytes]")
+                logger.warning(f"   [Non-UTF8 data, size: {len(body)} bytes]")
 
     # -------------------------------------------------------------------------
     # 2) ROUTER 실행 (실제 API 처리)
@@ -81,8 +110,10 @@ async def log_requests_middleware(request: Request, call_next):
     process_time = time.time() - start_time  # 처리 시간 계산
 
     # 응답 본문 로깅 준비
+    # JSON 응답만 본문을 모아서 기록 (내보내기/이미지 등 대용량 스트림은 그대로 전달)
     response_body = b""
-    if isinstance(response, StreamingResponse):
+    content_type = response.headers.get("content-type", "")
+    if isinstance(response, StreamingResponse) and content_type.startswith("application/json"):
         response_body_parts = []
         async for chunk in response.body_iterator:
             response_body_parts.append(chunk)
@@ -98,6 +129,11 @@ async def log_requests_middleware(request: Request, call_next):
 
     logger.warning("📥 [CATALOG-API → CLIENT] RESPONSE")
     logger.warning(f"   Status: {response.status_code}")
+    
+    # SQL 쿼리 집계 (SQL_STATS_ENABLED일 때만)
+    query_stats = current_stats()
+    if query_stats is not None:
+        logger.warning(f"   SQL: {query_stats.count} queries, {query_stats.duration * 1000:.1f}ms")
 
     # 응답 본문 로깅 (JSON인 경우)
     if response_body:
@@ -111,3 +147,75 @@ async def log_requests_middleware(request: Request, call_next):
     logger.warning("=" * 80 + "\n")
 
     return response
+
+
+def route_template(request: Request) -> str:
+    """요청 경로의 경로 파라미터 값을 이름으로 바꾼 라우트 형태 (/api/items/{item_id} 등, 로그 집계용)"""
+    path = request.url.path
+    for name, value in request.scope.get("path_params", {}).items():
+        path = path.replace(str(value), "{" + name + "}")
+    return path
+
+
+async def query_stats_middleware(request: Request, call_next):
+    """
+    요청별 SQL 쿼리 집계 미들웨어
+    - 요청마다 쿼리 통계를 시작하고, 응답에 Server-Timing 헤더(db: 쿼리 수/DB 시간, app: 전체 처리 시간) 추가
+    - 같은 형태의 쿼리가 SQL_REPEAT_WARN_THRESHOLD번을 넘게 반복되면 라우트와 쿼리 지문을 경고로 기록 (N+1 의심)
+    - 로깅 미들웨어보다 바깥에 등록하여 로깅 미들웨어도 같은 통계를 기록
+    """
+    start_time = time.perf_counter()
+    stats = begin_request()
+    
+    response = await call_next(request)
+    
+    process_time = time.perf_counter() - start_time
+    response.headers.append(
+        "Server-Timing",
+        f'db;dur={stats.duration * 1000:.1f};desc="{stats.count} queries", app;dur={process_time * 1000:.1f}'
+    )
+    
+    threshold = settings.SQL_REPEAT_WARN_THRESHOLD
+    if threshold > 0:
+        route_path = route_template(request)
+        for shape, count in stats.repeated(threshold):
+            logger.warning(f"⚠️ N+1 의심: {request.method} {route_path} - 같은 형태의 쿼리 {count}회 실행: {shape[:300]}")
+    
+    return response
+
+
+def should_profile(request: Request) -> bool:
+    """프로파일링 대상 요청인지 확인 - X-Profile-Token 헤더가 PROFILE_TOKEN과 일치하거나 PROFILE_SAMPLE_RATE 확률"""
+    token = request.headers.get("x-profile-token")
+    if token and settings.PROFILE_TOKEN and hmac.compare_digest(token, settings.PROFILE_TOKEN):
+        return True
+    return settings.PROFILE_SAMPLE_RATE > 0 and random.random() < settings.PROFILE_SAMPLE_RATE
+
+
+async def profiling_middleware(request: Request, call_next):
+    """
+    요청 프로파일링 미들웨어 (PROFILE_TOKEN 또는 PROFILE_SAMPLE_RATE 설정 시에만 등록)
+    - 대상 요청은 처리하는 동안 스택을 샘플링하여 PROFILE_DIR에 folded stack 파일로 저장
+    - 응답의 X-Profile-File 헤더에 저장 파일명 표시
+    - 라우트 처리에 집중하도록 다른 미들웨어보다 안쪽에 등록
+    """
+    if not should_profile(request):
+        return await call_next(request)
+    
+    start_time = time.perf_counter()
+    profiler = start_profiler()
+    try:
+        response = await call_next(request)
+    finally:
+        profiler.stop()
+    duration_ms = (time.perf_counter() - start_time) * 1000
+    
+    try:
+        filename = profile_filename(request.method, request.url.path, duration_ms)
+        path = await run_in_threadpool(save_profile, profiler, filename)
+        response.headers["X-Profile-File"] = path.name
+        logger.warning(f"🔬 프로파일 저장: {path} ({profiler.sample_count} samples, {duration_ms:.1f}ms)")
+    except OSError as e:
+        logger.warning(f"⚠️ 프로파일 저장 실패: {e}")
+    
+    return response
@@ -0,0 +1,124 @@
+"""
+Catalog-API 요청 단위 샘플링 프로파일러
+- 선택된 요청을 처리하는 동안 별도 스레드가 일정 간격(PROFILE_INTERVAL_MS)으로 스택을 샘플링
+- 대상: 이벤트 루프 스레드(async 라우트) + 실행 중인 스레드 풀 워커(동기 라우트, 의존성), 대기 중인 워커는 제외
+- 결과는 folded stack 형식(`스레드;함수;함수 횟수`)으로 PROFILE_DIR에 저장 - flamegraph.pl, speedscope 등에서 바로 사용
+- 저장 파일 수는 PROFILE_MAX_FILES개로 제한 (오래된 파일부터 삭제)
+- 다른 요청과 같은 스레드 풀을 공유하므로, 동시에 처리 중인 요청의 스택이 함께 기록될 수 있음
+"""
+import os
+import re
+import sys
+import threading
+from collections import Counter
+from datetime import datetime
+from pathlib import Path
+from typing import List, Optional
+
+from app.core.config import settings
+
+# 스레드 풀 워커 스레드 이름 (anyio)
+WORKER_THREAD_PREFIX = "AnyIO worker thread"
+
+# 작업을 기다리는 워커 스레드의 최상위 프레임 (샘플에서 제외)
+IDLE_FUNCTIONS = {"wait", "get", "_wait_for_tstate_lock", "select"}
+
+# 파일명에 쓸 수 없는 문자
+_UNSAFE_FILENAME = re.compile(r"[^A-Za-z0-9_.-]+")
+
+
+def _frame_label(frame) -> str:
+    """프레임 표시 이름 - 함수명 (파일명:함수 시작 줄), folded 형식 구분자(;)는 쉼표로 변경"""
+    code = frame.f_code
+    filename = os.path.basename(code.co_filename)
+    return f"{code.co_name} ({filename}:{code.co_firstlineno})".replace(";", ",")
+
+
+def _stack_labels(frame) -> List[str]:
+    """프레임에서 호출 순서(바깥 → 안쪽)대로 표시 이름 목록"""
+    labels = []
+    while frame is not None:
+        labels.append(_frame_label(frame))
+        frame = frame.f_back
+    labels.reverse()
+    return labels
+
+
+class SamplingProfiler:
+    """요청 하나를 처리하는 동안 스택을 샘플링하여 folded stack 횟수 집계"""
+    
+    def __init__(self, loop_thread_id: int, interval: float):
+        self.loop_thread_id = loop_thread_id
+        self.interval = interval
+        self.samples: Counter = Counter()
+        self.sample_count = 0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+    
+    def start(self) -> None:
+        self._thread = threading.Thread(target=self._run, name="request-profiler", daemon=True)
+        self._thread.start()
+    
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+    
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self._sample()
+    
+    def _sample(self) -> None:
+        frames = sys._current_frames()
+        self.sample_count += 1
+        
+        loop_frame = frames.get(self.loop_thread_id)
+        if loop_frame is not None:
+            self.samples[";".join(["event-loop", *_stack_labels(loop_frame)])] += 1
+        
+        for thread in threading.enumerate():
+            if not thread.name.startswith(WORKER_THREAD_PREFIX):
+                continue
+            frame = frames.get(thread.ident)
+            if frame is None or frame.f_code.co_name in IDLE_FUNCTIONS:
+                continue
+            self.samples[";".join(["worker", *_stack_labels(frame)])] += 1
+    
+    def folded(self) -> str:
+        """folded stack 형식 문자열 (한 줄에 `스택 횟수`)"""
+        return "".join(f"{stack} {count}\n" for stack, count in self.samples.most_common())
+
+
+def profile_filename(method: str, path: str, duration_ms: float) -> str:
+    """저장 파일명 - 시간_메서드_경로_처리시간ms.folded"""
+    timestamp = datetime.now().strftime("%Y%m%d-%H%M%S-%f")
+    slug = _UNSAFE_FILENAME.sub("_", path.strip("/"))[:80] or "root"
+    return f"{timestamp}_{method}_{slug}_{duration_ms:.0f}ms.folded"
+
+
+def save_profile(profiler: SamplingProfiler, filename: str) -> Path:
+    """프로파일 결과 저장 후 PROFILE_MAX_FILES를 넘는 오래된 파일 삭제 (동기 함수)"""
+    directory = Path(settings.PROFILE_DIR)
+    directory.mkdir(parents=True, exist_ok=True)
+    target = directory / filename
+    target.write_text(profiler.folded(), encoding="utf-8")
+    
+    profiles = sorted(directory.glob("*.folded"), key=lambda path: path.stat().st_mtime)
+    for old in profiles[:max(0, len(profiles) - settings.PROFILE_MAX_FILES)]:
+        try:
+            old.unlink()
+        except FileNotFoundError:
+            pass
+    return target
+
+
+def profiling_enabled() -> bool:
+    """프로파일링 사용 여부 - 토큰 헤더 또는 표본 비율 중 하나라도 설정된 경우"""
+    return bool(settings.PROFILE_TOKEN) or settings.PROFILE_SAMPLE_RATE > 0
+
+
+def start_profiler() -> SamplingProfiler:
+    """현재 스레드(이벤트 루프)를 기준으로 프로파일러 시작"""
+    profiler = SamplingProfiler(threading.get_ident(), settings.PROFILE_INTERVAL_MS / 1000)
+    profiler.start()
+    return profiler
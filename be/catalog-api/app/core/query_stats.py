@@ -0,0 +1,88 @@
+"""
+Catalog-API 요청별 SQL 쿼리 통계
+- SQLAlchemy before/after_cursor_execute 이벤트로 요청마다 쿼리 수와 DB 실행 시간 집계
+- 같은 형태(리터럴/파라미터를 ?로 바꾼 지문)의 쿼리가 한 요청에서 반복된 횟수를 기록하여 N+1 패턴 감지
+- 요청 범위는 ContextVar로 구분 (동기 라우트가 실행되는 스레드 풀에도 컨텍스트가 복사되어 같은 통계 객체에 기록)
+- 요청 밖에서 실행되는 쿼리(쓰기 조정기 스레드, 백그라운드 작업 등)는 집계하지 않음
+"""
+import re
+import time
+from collections import Counter
+from contextvars import ContextVar
+from typing import List, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+# 지문 정규화 패턴 - 문자열/숫자 리터럴, 파라미터 자리표시자, IN 목록, 공백
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"\b\d+(?:\.\d+)?\b")
+_PLACEHOLDER = re.compile(r"%\(\w+\)s|%s|:\w+|\$\d+|\?")
+_PLACEHOLDER_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def fingerprint(statement: str) -> str:
+    """쿼리 형태 지문 - 값만 다른 같은 쿼리가 같은 문자열이 되도록 정규화"""
+    normalized = _STRING_LITERAL.sub("?", statement)
+    normalized = _PLACEHOLDER.sub("?", normalized)
+    normalized = _NUMBER_LITERAL.sub("?", normalized)
+    normalized = _PLACEHOLDER_LIST.sub("(?+)", normalized)
+    return _WHITESPACE.sub(" ", normalized).strip()
+
+
+class RequestQueryStats:
+    """한 요청의 쿼리 수, DB 실행 시간(초), 쿼리 형태별 실행 횟수"""
+    
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0
+        self.fingerprints: Counter = Counter()
+    
+    def record(self, statement: str, duration: float) -> None:
+        self.count += 1
+        self.duration += duration
+        self.fingerprints[fingerprint(statement)] += 1
+    
+    def repeated(self, threshold: int) -> List[Tuple[str, int]]:
+        """threshold번을 넘게 반복된 쿼리 형태 (많이 반복된 순)"""
+        return [(shape, count) for shape, count in self.fingerprints.most_common() if count > threshold]
+
+
+# 현재 요청의 쿼리 통계 (요청 밖에서는 None)
+_current_stats: ContextVar[Optional[RequestQueryStats]] = ContextVar("request_query_stats", default=None)
+
+
+def begin_request() -> RequestQueryStats:
+    """현재 컨텍스트(요청)에 새 통계 객체 연결"""
+    stats = RequestQueryStats()
+    _current_stats.set(stats)
+    return stats
+
+
+def current_stats() -> Optional[RequestQueryStats]:
+    """현재 요청의 쿼리 통계 (집계 중이 아니면 None)"""
+    return _current_stats.get()
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if _current_stats.get() is not None:
+        conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    stats = _current_stats.get()
+    if stats is None:
+        return
+    start_times = conn.info.get("query_start_time")
+    if not start_times:
+        return
+    stats.record(statement, time.perf_counter() - start_times.pop())
+
+
+def install_query_hooks(*engines: Engine) -> None:
+    """엔진에 쿼리 집계 이벤트 등록 (같은 엔진은 한 번만)"""
+    for target in engines:
+        if not event.contains(target, "before_cursor_execute", _before_cursor_execute):
+            event.listen(target, "before_cursor_execute", _before_cursor_execute)
+            event.listen(target, "after_cursor_execute", _after_cursor_execute)
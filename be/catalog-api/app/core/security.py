@@ -121,3 +121,13 @@ def verify_token(token: str) -> str:
         raise HTTPException(status_code=401, detail="토큰이 만료되었습니다")
     except jwt.PyJWTError as e:
         raise HTTPException(status_code=401, detail=f"토큰 검증에 실패했습니다: {str(e)}")
+
+
+def warm_up_jwt() -> None:
+    """
+    JWT 설정 미리 확인 (서버 시작 시 호출)
+    - 테스트 토큰을 한 번 발급/검증하여 알고리즘 객체 생성 등 첫 호출 비용을 시작 단계에서 처리
+    - 시크릿 키/알고리즘 설정이 잘못되었으면 첫 요청이 아니라 서버 시작 시 예외 발생
+    """
+    token = jwt.encode({"sub": "warmup"}, settings.JWT_SECRET_KEY, algorithm=settings.JWT_ALGORITHM)
+    jwt.decode(token, settings.JWT_SECRET_KEY, algorithms=[settings.JWT_ALGORITHM])
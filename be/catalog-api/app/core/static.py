@@ -0,0 +1,134 @@
+"""
+Catalog-API 업로드 이미지 서빙
+- 업로드 경로는 항상 새 파일명(UUID 또는 내용 해시)이므로 응답을 영구 캐시 가능(immutable)으로 표시
+- ETag/Last-Modified 기반 조건부 요청(304)과 Range 요청은 Starlette StaticFiles/FileResponse가 처리
+- /uploads 요청은 로깅 미들웨어를 거치지 않도록 앱 바깥쪽에서 바로 정적 파일 앱으로 전달
+- Accept 헤더가 WebP/AVIF를 허용하면 변환 캐시의 파일로 응답 (Vary: Accept)
+- 업로드 응답의 리사이즈 URL이나 ?size= 요청의 리사이즈 버전이 아직 생성 전이면 원본으로 응답 (캐시하지 않음)
+- 점(.)으로 시작하는 경로(.sessions 부분 파일, .staging 임시 파일, .cache 변환 캐시 등)는 제공하지 않음 (404)
+"""
+import os
+import stat
+from pathlib import Path
+from typing import Optional, Sequence, Tuple
+from urllib.parse import parse_qs
+
+from starlette.concurrency import run_in_threadpool
+from starlette.datastructures import Headers
+from starlette.exceptions import HTTPException
+from starlette.responses import JSONResponse, Response
+from starlette.staticfiles import StaticFiles
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.core.config import settings
+from app.core.image_cache import available_formats, get_transcoder, is_transcodable, negotiate_format
+from app.core.images import expected_variant, resolve_variant, variant_source
+from app.core.storage import IMMUTABLE_CACHE_CONTROL
+
+
+def _requested_size(scope: Scope) -> Optional[int]:
+    """쿼리 문자열의 size 값 (없거나 잘못된 값이면 None)"""
+    query = parse_qs(scope.get("query_string", b"").decode("latin-1"))
+    values = query.get("size")
+    if values and values[0].isdigit() and int(values[0]) > 0:
+        return int(values[0])
+    return None
+
+
+class ImageFiles(StaticFiles):
+    """
+    업로드 이미지 전용 정적 파일 앱
+    - ?size= 지정 시 해당 크기 이상의 가장 작은 리사이즈 버전 제공 (아직 생성 전이면 원본을 캐시하지 않고 제공)
+    - JPEG/PNG는 Accept 헤더에 따라 WebP/AVIF 변환본 제공 (응답이 Accept에 따라 달라지므로 Vary: Accept)
+    - 모든 파일 응답에 immutable 캐시 헤더 추가 (생성 전인 리사이즈 버전을 원본으로 대신한 응답은 제외)
+    - 점(.)으로 시작하는 폴더/파일은 업로드 중이거나 내부용 파일이므로 404
+    """
+
+    async def get_response(self, path: str, scope: Scope) -> Response:
+        if any(part.startswith(".") for part in Path(path).parts):
+            raise HTTPException(status_code=404)
+        
+        fallback = await run_in_threadpool(self._pending_variant_source, path)
+        if fallback is not None:
+            response = await self.get_response(fallback, scope)
+            response.headers["Cache-Control"] = "no-cache"
+            return response
+        
+        size = _requested_size(scope)
+        variant_pending = False
+        if size:
+            full_path = Path(self.directory) / path
+            resolved = await run_in_threadpool(resolve_variant, full_path, size)
+            # 리사이즈 버전이 생성되면 같은 URL이 그 버전으로 바뀌어야 하므로 대신 준 원본은 캐시하지 않음
+            variant_pending = resolved == full_path and expected_variant(full_path, size) is not None
+            path = str(Path(path).with_name(resolved.name))
+        
+        if settings.IMAGE_TRANSCODE_FORMATS and is_transcodable(Path(path)):
+            response = await self._negotiated_response(path, scope)
+            response.headers["Vary"] = "Accept"
+        else:
+            response = await super().get_response(path, scope)
+        
+        if variant_pending:
+            response.headers["Cache-Control"] = "no-cache"
+        return response
+    
+    def _pending_variant_source(self, path: str) -> Optional[str]:
+        """아직 생성되지 않은 리사이즈 파일 요청이면 원본 경로 (업로드 직후 백그라운드 생성 중)"""
+        full_path = Path(self.directory) / path
+        source = variant_source(full_path)
+        if source is None or full_path.exists() or not source.is_file():
+            return None
+        return str(Path(path).with_name(source.name))
+    
+    async def _negotiated_response(self, path: str, scope: Scope) -> Response:
+        """클라이언트가 받을 수 있는 변환 형식이 있으면 변환 캐시 파일로, 아니면 원본으로 응답"""
+        format_name = negotiate_format(Headers(scope=scope).get("accept"), available_formats())
+        if format_name and scope["method"] in ("GET", "HEAD"):
+            full_path, stat_result = await run_in_threadpool(self.lookup_path, path)
+            if stat_result and stat.S_ISREG(stat_result.st_mode):
+                cached_path = await get_transcoder().get(Path(full_path), stat_result, format_name)
+                if cached_path:
+                    try:
+                        cached_stat = await run_in_threadpool(os.stat, cached_path)
+                        return self.file_response(cached_path, cached_stat, scope)
+                    except FileNotFoundError:
+                        # 응답 직전에 다른 요청이 캐시에서 삭제한 경우 원본으로 응답
+                        pass
+        
+        return await super().get_response(path, scope)
+
+    def file_response(self, *args, **kwargs) -> Response:
+        response = super().file_response(*args, **kwargs)
+        response.headers["Cache-Control"] = IMMUTABLE_CACHE_CONTROL
+        return response
+
+
+class StaticBypassMiddleware:
+    """
+    정적 파일 우회 미들웨어 (순수 ASGI)
+    - 지정한 경로 접두사로 들어온 요청은 안쪽 미들웨어(로깅, 업로드 제한)를 건너뛰고 바로 정적 파일 앱에서 처리
+    - 응답 본문을 중간에서 모으지 않으므로 서버가 지원하면 pathsend 확장으로 파일을 직접 전송
+    """
+
+    def __init__(self, app: ASGIApp, mounts: Sequence[Tuple[str, ASGIApp]]):
+        self.app = app
+        self.mounts = [(prefix.rstrip("/"), static_app) for prefix, static_app in mounts]
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http":
+            path = scope["path"]
+            for prefix, static_app in self.mounts:
+                if path.startswith(prefix + "/"):
+                    # Mount와 동일하게 root_path에 접두사를 붙여 정적 파일 앱이 나머지 경로만 보도록 함
+                    child_scope = dict(scope)
+                    child_scope["root_path"] = scope.get("root_path", "") + prefix
+                    try:
+                        await static_app(child_scope, receive, send)
+                    except HTTPException as exc:
+                        # 라우터의 예외 처리기를 거치지 않으므로 FastAPI와 같은 형식으로 직접 응답
+                        response = JSONResponse({"detail": exc.detail}, status_code=exc.status_code, headers=exc.headers)
+                        await response(child_scope, receive, send)
+                    return
+
+        await self.app(scope, receive, send)
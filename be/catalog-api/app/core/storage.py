@@ -0,0 +1,203 @@
+"""
+Catalog-API 파일 저장소 백엔드
+- 업로드 API가 사용하는 저장소 인터페이스 (키 = UPLOAD_DIR 기준 상대 경로, 예: images/1/2025/01/01/uuid.jpg)
+- local: 서버 로컬 파일 시스템 (/uploads 경로로 서빙)
+- s3: S3 호환 오브젝트 스토리지 (AWS S3, MinIO 등) - 사전 서명된 PUT URL로 클라이언트가 직접 업로드
+- STORAGE_BACKEND 환경변수로 선택
+"""
+import os
+import posixpath
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Optional
+
+from app.core.config import settings
+
+# 파일 URL에서 UPLOAD_DIR 기준 상대 경로를 추출하기 위한 접두사
+LOCAL_URL_PREFIXES = {"/uploads/": "", "/api/upload/images/": "images/"}
+
+# 업로드 이미지 캐시 정책 (키가 항상 새 이름이므로 변경되지 않음)
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+# 이어받기 업로드 부분 파일을 두는 로컬 폴더 (UPLOAD_DIR 기준, 저장소 백엔드와 무관하게 항상 로컬)
+UPLOAD_SESSION_DIR = ".sessions"
+
+
+def upload_session_path(session_id: str) -> Path:
+    """이어받기 업로드 세션의 부분 파일 경로"""
+    return Path(settings.UPLOAD_DIR) / UPLOAD_SESSION_DIR / f"{session_id}.part"
+
+
+def normalize_key(key: Optional[str]) -> Optional[str]:
+    """
+    URL에서 꺼낸 저장소 키 정규화 (posixpath.normpath)
+    - 절대 경로이거나 .. 구간이 있으면 None (images/{user_id}/ 접두사 검사를 우회해 다른 사용자 파일이나 UPLOAD_DIR 밖에 접근하지 못하도록 함)
+    """
+    if not key or key.startswith("/") or ".." in key.split("/"):
+        return None
+    
+    normalized = posixpath.normpath(key)
+    if normalized == "." or normalized.startswith("/"):
+        return None
+    return normalized
+
+
+def url_to_relative_path(url: Optional[str]) -> Optional[str]:
+    """로컬 이미지 URL(상대/절대)을 UPLOAD_DIR 기준 상대 경로로 변환 (업로드 파일이 아니거나 경로가 올바르지 않으면 None)"""
+    if not url:
+        return None
+    for prefix, replacement in LOCAL_URL_PREFIXES.items():
+        if prefix in url:
+            relative = replacement + url.split(prefix, 1)[1]
+            return normalize_key(relative.split("?", 1)[0])
+    return None
+
+
+class StorageBackend(ABC):
+    """저장소 백엔드 인터페이스 (store/size/delete/public_url/key_from_url은 각 백엔드에서 구현)"""
+    
+    # 사전 서명된 URL로 클라이언트 직접 업로드 지원 여부
+    supports_presigned_upload = False
+    
+    @abstractmethod
+    def store(self, source: Path, key: str, content_type: Optional[str] = None) -> None:
+        """로컬에 저장 완료된 파일을 저장소의 key 위치로 이동 (원본 파일은 제거)"""
+    
+    @abstractmethod
+    def size(self, key: str) -> Optional[int]:
+        """저장된 파일 크기 (없으면 None)"""
+    
+    def exists(self, key: str) -> bool:
+        """파일 존재 여부"""
+        return self.size(key) is not None
+    
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        """파일 삭제 (없으면 무시)"""
+    
+    @abstractmethod
+    def public_url(self, key: str) -> str:
+        """클라이언트가 파일에 접근할 URL"""
+    
+    @abstractmethod
+    def key_from_url(self, url: str) -> Optional[str]:
+        """public_url로 만든 URL에서 정규화한 키 추출 (이 저장소의 URL이 아니거나 경로가 올바르지 않으면 None, normalize_key 참고)"""
+    
+    def local_path(self, key: str) -> Optional[Path]:
+        """로컬 파일 경로 (로컬 저장소가 아니면 None - 썸네일 생성 등 로컬 전용 처리에 사용)"""
+        return None
+    
+    def presign_upload(self, key: str, content_type: str) -> str:
+        """클라이언트 직접 업로드용 사전 서명된 PUT URL (supports_presigned_upload인 백엔드만 구현)"""
+        raise NotImplementedError(f"{type(self).__name__}는 사전 서명 업로드를 지원하지 않습니다")
+
+
+class LocalStorageBackend(StorageBackend):
+    """로컬 파일 시스템 저장소 (UPLOAD_DIR)"""
+    
+    def __init__(self, root: str):
+        self.root = Path(root)
+    
+    def store(self, source: Path, key: str, content_type: Optional[str] = None) -> None:
+        target = self.root / key
+        target.parent.mkdir(parents=True, exist_ok=True)
+        os.replace(source, target)
+    
+    def size(self, key: str) -> Optional[int]:
+        try:
+            return (self.root / key).stat().st_size
+        except FileNotFoundError:
+            return None
+    
+    def delete(self, key: str) -> None:
+        (self.root / key).unlink(missing_ok=True)
+    
+    def public_url(self, key: str) -> str:
+        return f"/uploads/{key}"
+    
+    def key_from_url(self, url: str) -> Optional[str]:
+        return url_to_relative_path(url)
+    
+    def local_path(self, key: str) -> Optional[Path]:
+        return self.root / key
+
+
+class S3StorageBackend(StorageBackend):
+    """S3 호환 오브젝트 스토리지 (boto3 필요)"""
+    
+    supports_presigned_upload = True
+    
+    def __init__(self):
+        try:
+            import boto3
+            from botocore.config import Config
+        except ImportError:
+            raise RuntimeError("S3 저장소를 사용하려면 boto3를 설치해야 합니다 (pip install boto3)")
+        
+        self.bucket = settings.S3_BUCKET
+        self.client = boto3.client(
+            "s3",
+            endpoint_url=settings.S3_ENDPOINT_URL or None,
+            region_name=settings.S3_REGION,
+            aws_access_key_id=settings.S3_ACCESS_KEY_ID or None,
+            aws_secret_access_key=settings.S3_SECRET_ACCESS_KEY or None,
+            config=Config(signature_version="s3v4", s3={"addressing_style": "path"})
+        )
+        
+        # 공개 URL 기준 주소 (CDN 등) - 지정하지 않으면 엔드포인트/버킷 경로 사용
+        base_url = settings.S3_PUBLIC_BASE_URL
+        if not base_url:
+            endpoint = settings.S3_ENDPOINT_URL or f"https://s3.{settings.S3_REGION}.amazonaws.com"
+            base_url = f"{endpoint.rstrip('/')}/{self.bucket}"
+        self.base_url = base_url.rstrip("/")
+    
+    def store(self, source: Path, key: str, content_type: Optional[str] = None) -> None:
+        extra_args = {"CacheControl": IMMUTABLE_CACHE_CONTROL}
+        if content_type:
+            extra_args["ContentType"] = content_type
+        self.client.upload_file(str(source), self.bucket, key, ExtraArgs=extra_args)
+        source.unlink(missing_ok=True)
+    
+    def size(self, key: str) -> Optional[int]:
+        from botocore.exceptions import ClientError
+        try:
+            response = self.client.head_object(Bucket=self.bucket, Key=key)
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") in ("404", "NoSuchKey", "NotFound"):
+                return None
+            raise
+        return response["ContentLength"]
+    
+    def delete(self, key: str) -> None:
+        self.client.delete_object(Bucket=self.bucket, Key=key)
+    
+    def public_url(self, key: str) -> str:
+        return f"{self.base_url}/{key}"
+    
+    def key_from_url(self, url: str) -> Optional[str]:
+        prefix = f"{self.base_url}/"
+        if url.startswith(prefix):
+            return normalize_key(url[len(prefix):].split("?", 1)[0])
+        return None
+    
+    def presign_upload(self, key: str, content_type: str) -> str:
+        return self.client.generate_presigned_url(
+            "put_object",
+            Params={"Bucket": self.bucket, "Key": key, "ContentType": content_type},
+            ExpiresIn=settings.S3_PRESIGN_EXPIRES_SECONDS
+        )
+
+
+# 전역 저장소 인스턴스 (첫 사용 시 생성)
+_storage: Optional[StorageBackend] = None
+
+
+def get_storage() -> StorageBackend:
+    """설정된 저장소 백엔드 반환"""
+    global _storage
+    if _storage is None:
+        if settings.STORAGE_BACKEND == "s3":
+            _storage = S3StorageBackend()
+        else:
+            _storage = LocalStorageBackend(settings.UPLOAD_DIR)
+    return _storage
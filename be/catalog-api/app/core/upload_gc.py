@@ -0,0 +1,206 @@
+"""
+Catalog-API 미참조 업로드 파일 정리 (가비지 컬렉터)
+- 아이템/카탈로그 삭제 시 이미지 파일은 남으므로 주기적으로 정리
+- DB에서 참조 중인 image_url/thumbnail_url 인덱스(집합)를 만든 뒤 업로드 폴더를 순차 탐색
+- 어디에서도 참조하지 않고 유예 시간보다 오래된 파일(썸네일, 중단된 임시 파일 포함) 삭제
+- 만료된 이어받기 업로드 세션과 부분 파일 삭제
+- 서버 백그라운드 작업 또는 CLI로 실행
+
+CLI 사용 예:
+    python -m app.core.upload_gc --dry-run
+    python -m app.core.upload_gc --grace-hours 48
+"""
+import argparse
+import asyncio
+import json
+import logging
+import os
+import re
+import time
+from datetime import timedelta
+from pathlib import Path
+from typing import Iterator, Optional, Set
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+
+from app.core.config import settings, get_kst_now
+from app.core.images import CAS_PREFIX
+from app.core.storage import UPLOAD_SESSION_DIR, upload_session_path, url_to_relative_path
+from app.models.database import CatalogDB, ItemDB, UploadSessionDB, SessionLocal
+from app.crud import image_blob as image_blob_crud
+from app.crud import upload_session as upload_session_crud
+
+logger = logging.getLogger("API_COMMUNICATION")
+
+# 썸네일 파일명 패턴 (예: abc_512.jpg → abc.jpg)
+VARIANT_PATTERN = re.compile(r"^(?P<stem>.+)_(?P<size>\d+)(?P<suffix>\.[^.]+)$")
+
+
+def collect_referenced_paths(db: Session, batch_size: int = 1000) -> Set[str]:
+    """DB에서 참조 중인 모든 업로드 파일 경로 집합 (서버 측 커서로 나눠 조회)"""
+    referenced = set()
+    
+    for column in (ItemDB.image_url, CatalogDB.thumbnail_url):
+        stmt = select(column).where(column.isnot(None)).execution_options(yield_per=batch_size)
+        for (url,) in db.execute(stmt):
+            relative = url_to_relative_path(url)
+            if relative:
+                referenced.add(relative)
+    
+    return referenced
+
+
+def original_relative_path(relative: str) -> str:
+    """썸네일 파일이면 원본 파일 경로, 아니면 그대로 반환"""
+    directory, _, name = relative.rpartition("/")
+    match = VARIANT_PATTERN.match(name)
+    if match and int(match.group("size")) in settings.IMAGE_VARIANT_SIZES:
+        name = match.group("stem") + match.group("suffix")
+    return f"{directory}/{name}" if directory else name
+
+
+def iter_upload_files(directory: Path) -> Iterator[os.DirEntry]:
+    """업로드 폴더를 재귀적으로 순회하며 파일 항목을 하나씩 반환 (전체 목록을 메모리에 올리지 않음)"""
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    yield from iter_upload_files(Path(entry.path))
+                elif entry.is_file(follow_symlinks=False):
+                    yield entry
+    except FileNotFoundError:
+        return
+
+
+def expire_upload_sessions(db: Session, grace_seconds: int) -> int:
+    """
+    만료된 이어받기 업로드 세션 정리
+    - 만료 세션 레코드와 부분 파일 삭제
+    - 세션 레코드 없이 남은 부분 파일(완료 처리 중 중단 등)도 유예 시간이 지나면 삭제
+    - 삭제한 부분 파일 수 반환
+    """
+    removed = 0
+    for session_id in upload_session_crud.pop_expired_sessions(db):
+        path = upload_session_path(session_id)
+        if path.exists():
+            path.unlink(missing_ok=True)
+            removed += 1
+    
+    active_ids = {session_id for (session_id,) in db.query(UploadSessionDB.id).all()}
+    cutoff = time.time() - grace_seconds
+    for entry in iter_upload_files(Path(settings.UPLOAD_DIR) / UPLOAD_SESSION_DIR):
+        if Path(entry.name).stem in active_ids:
+            continue
+        try:
+            if entry.stat(follow_symlinks=False).st_mtime <= cutoff:
+                os.unlink(entry.path)
+                removed += 1
+        except FileNotFoundError:
+            continue
+    
+    return removed
+
+
+def sweep_orphaned_uploads(
+    db: Session,
+    grace_seconds: int = None,
+    dry_run: bool = False
+) -> dict:
+    """
+    미참조 업로드 파일 정리
+    - images/ 하위 파일 중 DB에서 참조하지 않고 유예 시간보다 오래된 파일 삭제
+    - 내용 주소 저장 파일은 유예 시간 안에 참조(재업로드)가 추가되었으면 파일이 오래되었어도 유지
+    - 내용 주소 저장 파일을 삭제하면 image_blobs 레코드도 함께 삭제
+    - 정리 결과(탐색/삭제 파일 수, 회수한 바이트 수) 반환
+    """
+    if grace_seconds is None:
+        grace_seconds = settings.UPLOAD_GC_GRACE_SECONDS
+    
+    upload_root = Path(settings.UPLOAD_DIR)
+    cutoff = time.time() - grace_seconds
+    referenced = collect_referenced_paths(db)
+    recently_uploaded = image_blob_crud.get_recently_referenced_paths(db, get_kst_now() - timedelta(seconds=grace_seconds))
+    
+    report = {
+        "referenced": len(referenced),
+        "scanned": 0,
+        "deleted": 0,
+        "reclaimed_bytes": 0,
+        "errors": 0,
+        "expired_sessions": 0,
+        "dry_run": dry_run
+    }
+    
+    if not dry_run:
+        report["expired_sessions"] = expire_upload_sessions(db, grace_seconds)
+    
+    for entry in iter_upload_files(upload_root / "images"):
+        report["scanned"] += 1
+        relative = Path(entry.path).relative_to(upload_root).as_posix()
+        
+        original = original_relative_path(relative)
+        if original in referenced or original in recently_uploaded:
+            continue
+        
+        try:
+            stat_result = entry.stat(follow_symlinks=False)
+            if stat_result.st_mtime > cutoff:
+                continue
+            
+            if not dry_run:
+                os.unlink(entry.path)
+                # 내용 주소 저장 원본이 삭제되면 참조 기록도 정리
+                if relative.startswith(CAS_PREFIX + "/") and original_relative_path(relative) == relative:
+                    image_blob_crud.delete_blob(db, Path(relative).stem)
+            
+            report["deleted"] += 1
+            report["reclaimed_bytes"] += stat_result.st_size
+        except FileNotFoundError:
+            continue
+        except OSError as e:
+            report["errors"] += 1
+            logger.warning(f"⚠️ 업로드 파일 정리 실패: {relative} ({e})")
+    
+    return report
+
+
+def run_sweep(grace_seconds: int = None, dry_run: bool = False) -> dict:
+    """새 DB 세션으로 정리 작업 1회 실행"""
+    db = SessionLocal()
+    try:
+        return sweep_orphaned_uploads(db, grace_seconds, dry_run)
+    finally:
+        db.close()
+
+
+async def upload_gc_loop(interval_seconds: int) -> None:
+    """서버 백그라운드 정리 루프 - 주기마다 스레드 풀에서 정리 작업 실행"""
+    while True:
+        await asyncio.sleep(interval_seconds)
+        try:
+            report = await run_in_threadpool(run_sweep)
+            if report["deleted"] or report["expired_sessions"]:
+                logger.warning(
+                    f"🧹 미참조 업로드 파일 {report['deleted']}개 정리 "
+                    f"({report['reclaimed_bytes']} bytes 회수, {report['scanned']}개 탐색, "
+                    f"만료된 업로드 세션 파일 {report['expired_sessions']}개 삭제)"
+                )
+        except Exception as e:
+            logger.warning(f"⚠️ 업로드 파일 정리 작업 오류: {e}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="미참조 업로드 파일 정리")
+    parser.add_argument("--grace-hours", type=float, default=None, help="업로드 후 보존할 유예 시간 (기본: UPLOAD_GC_GRACE_SECONDS)")
+    parser.add_argument("--dry-run", action="store_true", help="삭제하지 않고 대상만 집계")
+    args = parser.parse_args()
+    
+    grace_seconds = int(args.grace_hours * 3600) if args.grace_hours is not None else None
+    report = run_sweep(grace_seconds, args.dry_run)
+    print(json.dumps(report, indent=2, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""
+Catalog-API user-api(Spring Boot) 클라이언트
+- 공개 카탈로그 생성자 닉네임 조회 (GET {USER_API_URL}/{user_id})
+- requests 모듈과 HTTP 세션은 첫 호출 시 생성 (서버 시작 시 import 비용 없음, 이후 요청은 연결 재사용)
+- 조회 실패(연결 오류, 시간 초과, 200 이외 응답) 시 기본 닉네임 반환
+"""
+import threading
+
+from app.core.config import settings
+
+# 조회 실패 시 표시할 닉네임
+UNKNOWN_NICKNAME = "알 수 없음"
+
+# 앱 전체에서 공유하는 HTTP 세션 (첫 사용 시 생성)
+_session = None
+_session_lock = threading.Lock()
+
+
+def get_session():
+    """user-api 호출용 requests 세션 반환 (없으면 생성)"""
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                import requests
+                _session = requests.Session()
+    return _session
+
+
+def fetch_user_nickname(user_id: str) -> str:
+    """user-api에서 사용자 닉네임 조회"""
+    try:
+        response = get_session().get(
+            f"{settings.USER_API_URL}/{user_id}",
+            timeout=settings.USER_API_TIMEOUT_SECONDS
+        )
+        if response.status_code == 200 and response.text:
+            return response.json().get("nickname", UNKNOWN_NICKNAME)
+    except Exception:
+        pass
+    return UNKNOWN_NICKNAME
+
+
+def close_session() -> None:
+    """서버 종료 시 HTTP 세션 정리"""
+    global _session
+    session, _session = _session, None
+    if session is not None:
+        session.close()
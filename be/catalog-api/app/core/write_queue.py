@@ -0,0 +1,196 @@
+"""
+Catalog-API 쓰기 작업 조정기 (단일 쓰기 스레드 + 그룹 커밋)
+- SQLite는 한 번에 하나의 쓰기 트랜잭션만 허용하므로, 요청마다 따로 커밋하면 동시 요청이 잠금을 두고 경쟁하고
+  요청마다 fsync 비용을 치름
+- WRITE_COORDINATOR_ENABLED=true이면 쓰기 작업을 큐에 넣고 전용 스레드 하나가 순서대로 처리
+- 큐에 쌓인 작업(최대 WRITE_BATCH_MAX_SIZE개)을 한 트랜잭션에서 실행하고 한 번만 커밋 (그룹 커밋)
+- 작업마다 SAVEPOINT를 사용하므로 한 작업의 실패가 같은 묶음의 다른 작업에 영향을 주지 않음
+- 각 작업의 결과/예외는 커밋이 끝난 뒤 호출한 요청의 future로 전달
+- 작업이 등록한 실시간 알림 이벤트도 묶음 커밋이 끝난 뒤 발행 (실패한 작업의 이벤트는 버림)
+"""
+import asyncio
+import logging
+import queue
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, List, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core import events
+from app.models.database import configure_sqlite_connection, create_db_engine, engine
+
+logger = logging.getLogger("API_COMMUNICATION")
+
+# 큐 종료 신호
+_STOP = object()
+
+# 쓰기 작업 단위: (함수, 위치 인자, 키워드 인자, 결과 future)
+WriteUnit = Tuple[Callable[..., Any], tuple, dict, Future]
+
+
+def create_writer_engine() -> Engine:
+    """
+    쓰기 전용 엔진 생성
+    - SQLite는 드라이버(pysqlite)의 자동 BEGIN 대신 직접 BEGIN IMMEDIATE를 실행해야
+      SAVEPOINT가 바깥 트랜잭션 안에서 동작하고, 쓰기 잠금도 묶음 시작 시 한 번만 획득
+    - SQLite가 아니면 기본 엔진 사용
+    """
+    if engine.dialect.name != "sqlite":
+        return engine
+    
+    writer_engine = create_db_engine(
+        settings.DATABASE_URL,
+        connect_args={"isolation_level": None},
+        pool_size=1,
+        max_overflow=0
+    )
+    event.listen(writer_engine, "connect", configure_sqlite_connection)
+    
+    @event.listens_for(writer_engine, "begin")
+    def _begin_immediate(connection):
+        connection.exec_driver_sql("BEGIN IMMEDIATE")
+    
+    return writer_engine
+
+
+class WriteCoordinator:
+    """단일 쓰기 스레드 - 큐의 쓰기 작업을 묶어서 한 트랜잭션으로 커밋"""
+    
+    def __init__(self, max_batch_size: int):
+        self.max_batch_size = max(1, max_batch_size)
+        self._queue: "queue.Queue" = queue.Queue()
+        self._engine: Optional[Engine] = None
+        self._thread: Optional[threading.Thread] = None
+    
+    def start(self) -> None:
+        """쓰기 스레드 시작"""
+        if self._thread is not None:
+            return
+        self._engine = create_writer_engine()
+        self._thread = threading.Thread(target=self._run, name="db-writer", daemon=True)
+        self._thread.start()
+    
+    def stop(self, timeout: float = 10.0) -> None:
+        """큐에 남은 작업을 처리한 뒤 쓰기 스레드 종료"""
+        if self._thread is None:
+            return
+        self._queue.put(_STOP)
+        self._thread.join(timeout)
+        self._thread = None
+        if self._engine is not None and self._engine is not engine:
+            self._engine.dispose()
+    
+    def submit(self, fn: Callable[..., Any], *args, **kwargs) -> Future:
+        """쓰기 작업 등록 - fn(session, *args, **kwargs)을 쓰기 스레드에서 실행하고 결과를 future로 반환"""
+        future: Future = Future()
+        self._queue.put((fn, args, kwargs, future))
+        return future
+    
+    def _next_batch(self) -> Tuple[List[WriteUnit], bool]:
+        """첫 작업이 올 때까지 기다린 뒤, 이미 큐에 쌓인 작업을 최대 묶음 크기까지 함께 꺼냄"""
+        batch: List[WriteUnit] = []
+        stopping = False
+        
+        item = self._queue.get()
+        while True:
+            if item is _STOP:
+                stopping = True
+            else:
+                batch.append(item)
+            if len(batch) >= self.max_batch_size:
+                break
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+        
+        return batch, stopping
+    
+    def _run(self) -> None:
+        while True:
+            batch, stopping = self._next_batch()
+            if batch:
+                self._execute_batch(batch)
+            if stopping and self._queue.empty():
+                return
+    
+    def _execute_batch(self, batch: List[WriteUnit]) -> None:
+        """
+        묶음 실행
+        - 작업마다 바깥 트랜잭션의 SAVEPOINT에 연결된 세션을 만들어 실행 (crud 함수의 commit은 SAVEPOINT 해제)
+        - 실패한 작업은 해당 SAVEPOINT만 롤백
+        - 모든 작업 후 한 번 커밋하고, 커밋이 끝난 뒤에 결과 전달 및 이벤트 발행
+        """
+        results: List[Tuple[Future, bool, Any]] = []
+        pending_events: List[events.PendingEvent] = []
+        
+        try:
+            with self._engine.connect() as connection:
+                with connection.begin():
+                    for fn, args, kwargs, future in batch:
+                        if not future.set_running_or_notify_cancel():
+                            continue
+                        session = Session(
+                            bind=connection,
+                            join_transaction_mode="create_savepoint",
+                            expire_on_commit=False,
+                            autoflush=False,
+                            info={events.DEFER_EVENTS_KEY: True}
+                        )
+                        try:
+                            results.append((future, True, fn(session, *args, **kwargs)))
+                            pending_events.extend(events.take_pending_events(session))
+                        except Exception as e:
+                            session.rollback()
+                            results.append((future, False, e))
+                        finally:
+                            session.close()
+        except Exception as e:
+            # 커밋 실패 - 성공한 작업도 반영되지 않았으므로 모두 실패 처리
+            logger.warning(f"⚠️ 쓰기 묶음 커밋 실패 ({len(batch)}개 작업): {e}")
+            for _, _, _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        
+        events.publish_all(pending_events)
+        for future, succeeded, value in results:
+            if succeeded:
+                future.set_result(value)
+            else:
+                future.set_exception(value)
+
+
+# 앱 전체에서 공유하는 쓰기 조정기 (활성화된 경우에만 생성)
+_coordinator: Optional[WriteCoordinator] = None
+
+
+def start_write_coordinator() -> None:
+    """서버 시작 시 쓰기 조정기 시작 (WRITE_COORDINATOR_ENABLED=true일 때만)"""
+    global _coordinator
+    if settings.WRITE_COORDINATOR_ENABLED and _coordinator is None:
+        _coordinator = WriteCoordinator(settings.WRITE_BATCH_MAX_SIZE)
+        _coordinator.start()
+
+
+def stop_write_coordinator() -> None:
+    """서버 종료 시 남은 쓰기 작업을 처리하고 쓰기 조정기 종료"""
+    global _coordinator
+    if _coordinator is not None:
+        _coordinator.stop()
+        _coordinator = None
+
+
+async def run_write(db: Session, fn: Callable[..., Any], *args, **kwargs) -> Any:
+    """
+    쓰기 작업 실행 - fn(session, *args, **kwargs)
+    - 쓰기 조정기가 켜져 있으면 큐에 넣고 그룹 커밋이 끝날 때까지 대기 (이벤트 루프는 막지 않음)
+    - 꺼져 있으면 기존처럼 요청 세션(db)으로 바로 실행
+    """
+    if _coordinator is None:
+        return fn(db, *args, **kwargs)
+    return await asyncio.wrap_future(_coordinator.submit(fn, *args, **kwargs))
@@ -1,6 +1,6 @@
 """
 CRUD operations for database models
 """
-from app.crud import catalog, item, user_catalog
+from app.crud import catalog, item, user_catalog, image_blob, uploaded_object, upload_session, change_log
 
-__all__ = ["catalog", "item", "user_catalog"]
+__all__ = ["catalog", "item", "user_catalog", "image_blob", "uploaded_object", "upload_session", "change_log"]
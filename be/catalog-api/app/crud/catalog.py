@@ -2,13 +2,15 @@
 카탈로그 CRUD 작업
 """
 from sqlalchemy.orm import Session
-from sqlalchemy import and_
-from typing import List, Optional
+from sqlalchemy import and_, func
+from typing import Dict, List, Optional
 import uuid
 
-from app.models.database import CatalogDB, ItemDB, UserItemStatusDB, UserCatalogDB
+from app.models.database import CatalogDB, ItemDB, UserItemStatusDB, UserCatalogDB, SavedItemSourceDB
 from app.schemas.catalog import CatalogCreate, CatalogUpdate
 from app.core.config import get_kst_now
+from app.crud import change_log, catalog_reference, user_catalog
+from app.core import events
 
 
 def get_catalog(db: Session, catalog_id: str) -> Optional[CatalogDB]:
@@ -65,6 +67,8 @@ def create_catalog(db: Session, catalog: CatalogCreate, user_id: str) -> Catalog
     )
     
     db.add(db_catalog)
+    change_log.record_catalog_change(db, user_id, catalog_id)
+    events.publish_after_commit(db, user_id, events.catalog_event(events.CATALOG_CREATED, db_catalog))
     db.commit()
     db.refresh(db_catalog)
     
@@ -88,6 +92,8 @@ def update_catalog(
             setattr(db_catalog, key, value)
         
         db_catalog.updated_at = get_kst_now()
+        change_log.record_catalog_change(db, db_catalog.user_id, catalog_id)
+        events.publish_after_commit(db, db_catalog.user_id, events.catalog_event(events.CATALOG_UPDATED, db_catalog))
         db.commit()
         db.refresh(db_catalog)
     
@@ -101,6 +107,9 @@ def delete_catalog(db: Session, catalog_id: str, user_id: str) -> bool:
     if not db_catalog:
         return False
     
+    # 이 카탈로그를 참조 모드로 저장한 카탈로그는 아이템을 복사하여 유지
+    user_catalog.detach_references(db, catalog_id)
+    
     # 연관된 아이템들과 사용자 아이템 상태 삭제
     items = db.query(ItemDB).filter(ItemDB.catalog_id == catalog_id).all()
     for item in items:
@@ -118,28 +127,35 @@ def delete_catalog(db: Session, catalog_id: str, user_id: str) -> bool:
     if user_catalog_ref:
         db.delete(user_catalog_ref)
     
+    # 복사본 아이템의 출처 기록, 참조 모드 저장 기록 삭제
+    db.query(SavedItemSourceDB).filter(
+        SavedItemSourceDB.copied_catalog_id == catalog_id
+    ).delete(synchronize_session=False)
+    catalog_reference.delete_reference(db, catalog_id)
+    
     db.delete(db_catalog)
+    change_log.record_catalog_change(db, db_catalog.user_id, catalog_id, deleted=True)
+    events.publish_after_commit(db, db_catalog.user_id, events.catalog_event(events.CATALOG_DELETED, db_catalog))
     db.commit()
     
     return True
 
 
 def calculate_catalog_stats(db: Session, catalog_id: str, user_id: str) -> dict:
-    """카탈로그 통계 계산 (아이템 수, 보유 수, 수집률)"""
-    items = db.query(ItemDB).filter(ItemDB.catalog_id == catalog_id).all()
-    item_count = len(items)
+    """카탈로그 통계 계산 (아이템 수, 보유 수, 수집률, 참조 모드 카탈로그는 공유 중인 원본 아이템 포함)"""
+    catalog_items = catalog_reference.catalog_item_pairs(catalog_ids=[catalog_id])
+    item_count = db.query(func.count(catalog_items.c.item_id)).scalar()
     
     owned_count = 0
-    if items:
-        item_ids = [item.item_id for item in items]
-        user_statuses = db.query(UserItemStatusDB).filter(
+    if item_count:
+        owned_count = db.query(func.count(UserItemStatusDB.id)).join(
+            catalog_items, catalog_items.c.item_id == UserItemStatusDB.item_id
+        ).filter(
             and_(
                 UserItemStatusDB.user_id == user_id,
-                UserItemStatusDB.item_id.in_(item_ids),
                 UserItemStatusDB.owned == True
             )
-        ).all()
-        owned_count = len(user_statuses)
+        ).scalar()
     
     completion_rate = (owned_count / item_count * 100) if item_count > 0 else 0
     
@@ -150,6 +166,52 @@ def calculate_catalog_stats(db: Session, catalog_id: str, user_id: str) -> dict:
     }
 
 
+def calculate_catalogs_stats(db: Session, catalog_ids: List[str]) -> Dict[str, dict]:
+    """
+    여러 카탈로그의 통계를 한 번에 계산 (카탈로그 소유자 기준 보유 수)
+    - 아이템 수와 보유 수를 카탈로그별 GROUP BY 쿼리 2개로 집계 (카탈로그마다 calculate_catalog_stats를 호출하지 않음)
+    - 참조 모드 카탈로그는 공유 중인 원본 아이템도 포함
+    """
+    stats = {
+        catalog_id: {"item_count": 0, "owned_count": 0, "completion_rate": 0}
+        for catalog_id in catalog_ids
+    }
+    if not stats:
+        return stats
+    
+    catalog_items = catalog_reference.catalog_item_pairs(catalog_ids=list(stats))
+    item_counts = db.query(
+        catalog_items.c.catalog_id,
+        func.count(catalog_items.c.item_id)
+    ).group_by(catalog_items.c.catalog_id).all()
+    
+    owned_counts = db.query(
+        catalog_items.c.catalog_id,
+        func.count(func.distinct(UserItemStatusDB.item_id))
+    ).join(
+        CatalogDB, CatalogDB.catalog_id == catalog_items.c.catalog_id
+    ).join(
+        UserItemStatusDB,
+        and_(
+            UserItemStatusDB.item_id == catalog_items.c.item_id,
+            UserItemStatusDB.user_id == CatalogDB.user_id,
+            UserItemStatusDB.owned == True
+        )
+    ).group_by(catalog_items.c.catalog_id).all()
+    
+    for catalog_id, item_count in item_counts:
+        stats[catalog_id]["item_count"] = item_count
+    for catalog_id, owned_count in owned_counts:
+        stats[catalog_id]["owned_count"] = owned_count
+    
+    for catalog_stats in stats.values():
+        item_count = catalog_stats["item_count"]
+        completion_rate = (catalog_stats["owned_count"] / item_count * 100) if item_count > 0 else 0
+        catalog_stats["completion_rate"] = round(completion_rate, 2)
+    
+    return stats
+
+
 def build_catalog_response(
     catalog_record: CatalogDB, 
     stats: dict, 
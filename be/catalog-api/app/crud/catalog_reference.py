@@ -0,0 +1,221 @@
+"""
+참조 모드 저장 카탈로그 CRUD 작업
+- 참조 모드로 저장한 카탈로그는 아이템을 복사하지 않고 원본 카탈로그의 아이템을 공유 (저장 시 행 3개만 추가)
+- 공유 아이템의 보유 상태는 사용자별로 원본 아이템 ID에 저장
+- 사용자가 공유 아이템을 수정하면 그 아이템만 복사본 카탈로그로 복사(copy-on-write), 삭제하면 공유 제외 기록만 남김
+- 공유 아이템의 변경 기록/실시간 알림은 저장 카탈로그 ID로 저장한 사용자에게 전달 (원본 소유자의 아이템 추가/수정/삭제 포함)
+"""
+from sqlalchemy.orm import Session
+from sqlalchemy import and_, select, union_all
+from typing import List, Optional, Tuple
+import uuid
+
+from app.models.database import CatalogDB, ItemDB, UserItemStatusDB, SavedItemSourceDB, CatalogReferenceDB
+from app.schemas.item import ItemUpdate
+from app.core.config import get_kst_now
+from app.crud import change_log
+from app.core import events
+
+
+def get_reference(db: Session, copied_catalog_id: str) -> Optional[CatalogReferenceDB]:
+    """참조 모드 저장 기록 조회 (복사 모드 카탈로그면 None)"""
+    return db.query(CatalogReferenceDB).filter(CatalogReferenceDB.copied_catalog_id == copied_catalog_id).first()
+
+
+def create_reference(db: Session, user_id: str, original_catalog_id: str, copied_catalog_id: str) -> CatalogReferenceDB:
+    """참조 모드 저장 기록 추가 (커밋은 호출하는 쪽에서)"""
+    reference = CatalogReferenceDB(
+        copied_catalog_id=copied_catalog_id,
+        original_catalog_id=original_catalog_id,
+        user_id=user_id
+    )
+    db.add(reference)
+    return reference
+
+
+def _overridden(copied_catalog_id, source_item_id):
+    """공유에서 제외된 원본 아이템인지 (수정하여 복사했거나 삭제함)"""
+    return select(SavedItemSourceDB.copied_item_id).where(
+        and_(
+            SavedItemSourceDB.copied_catalog_id == copied_catalog_id,
+            SavedItemSourceDB.source_item_id == source_item_id
+        )
+    ).exists()
+
+
+def catalog_item_pairs(catalog_ids: Optional[List[str]] = None, owner_id: Optional[str] = None):
+    """
+    카탈로그별로 보이는 아이템 (catalog_id, item_id) 서브쿼리
+    - 카탈로그에 직접 속한 아이템 + 참조 모드 카탈로그가 공유하는 원본 아이템 (공유에서 제외된 아이템 제외)
+    - catalog_ids 또는 owner_id(카탈로그 소유자)로 범위 제한
+    """
+    own_items = select(ItemDB.catalog_id.label("catalog_id"), ItemDB.item_id.label("item_id"))
+    shared_items = select(
+        CatalogReferenceDB.copied_catalog_id.label("catalog_id"),
+        ItemDB.item_id.label("item_id")
+    ).join(
+        ItemDB, ItemDB.catalog_id == CatalogReferenceDB.original_catalog_id
+    ).where(
+        ~_overridden(CatalogReferenceDB.copied_catalog_id, ItemDB.item_id)
+    )
+    
+    if catalog_ids is not None:
+        own_items = own_items.where(ItemDB.catalog_id.in_(catalog_ids))
+        shared_items = shared_items.where(CatalogReferenceDB.copied_catalog_id.in_(catalog_ids))
+    if owner_id is not None:
+        own_items = own_items.join(CatalogDB, CatalogDB.catalog_id == ItemDB.catalog_id).where(CatalogDB.user_id == owner_id)
+        shared_items = shared_items.where(CatalogReferenceDB.user_id == owner_id)
+    
+    return union_all(own_items, shared_items).subquery()
+
+
+def list_catalog_items(db: Session, catalog_ids: List[str]) -> List[Tuple[str, str]]:
+    """카탈로그별로 보이는 (catalog_id, item_id) 목록 - 공유 아이템 포함, 아이템 생성 순서"""
+    pairs = catalog_item_pairs(catalog_ids=catalog_ids)
+    return db.query(pairs.c.catalog_id, pairs.c.item_id).join(
+        ItemDB, ItemDB.item_id == pairs.c.item_id
+    ).order_by(ItemDB.created_at).all()
+
+
+def record_shared_item_changes(db: Session, original_catalog_id: str, item_records: List[ItemDB], event_type: str) -> None:
+    """
+    원본 카탈로그의 아이템 추가/수정/삭제를 참조 모드로 저장한 사용자에게 전달 (커밋은 호출하는 쪽에서)
+    - 저장 카탈로그 ID로 변경 기록을 남기고 실시간 알림 발행, 삭제는 삭제 기록(tombstone)으로 전달
+    - 공유에서 제외한 아이템(사용자가 수정/삭제함)은 전달하지 않음
+    """
+    if not item_records:
+        return
+    
+    references = db.query(CatalogReferenceDB).filter(CatalogReferenceDB.original_catalog_id == original_catalog_id).all()
+    if not references:
+        return
+    
+    overridden = set(db.query(SavedItemSourceDB.copied_catalog_id, SavedItemSourceDB.source_item_id).join(
+        CatalogReferenceDB, CatalogReferenceDB.copied_catalog_id == SavedItemSourceDB.copied_catalog_id
+    ).filter(CatalogReferenceDB.original_catalog_id == original_catalog_id).all())
+    
+    deleted = event_type == events.ITEM_DELETED
+    for reference in references:
+        copied_catalog_id = reference.copied_catalog_id
+        shared_items = [item for item in item_records if (copied_catalog_id, item.item_id) not in overridden]
+        if not shared_items:
+            continue
+        
+        changes = [(change_log.ENTITY_ITEM, item.item_id, copied_catalog_id, deleted) for item in shared_items]
+        changes.append((change_log.ENTITY_CATALOG, copied_catalog_id, copied_catalog_id, False))
+        change_log.record_changes(db, reference.user_id, changes)
+        for item in shared_items:
+            events.publish_after_commit(db, reference.user_id, {**events.item_event(event_type, item), "catalog_id": copied_catalog_id})
+
+
+def find_item_reference(db: Session, user_id: str, item_record: ItemDB) -> Optional[CatalogReferenceDB]:
+    """사용자가 참조 모드로 공유 중인 아이템이면 그 저장 기록 (본인 아이템/공유하지 않는 아이템이면 None)"""
+    return db.query(CatalogReferenceDB).filter(
+        and_(
+            CatalogReferenceDB.user_id == user_id,
+            CatalogReferenceDB.original_catalog_id == item_record.catalog_id,
+            ~_overridden(CatalogReferenceDB.copied_catalog_id, item_record.item_id)
+        )
+    ).first()
+
+
+def _stop_sharing(db: Session, reference: CatalogReferenceDB, item_record: ItemDB, copied_item_id: str) -> None:
+    """원본 아이템을 공유에서 제외 (copied_item_id: 수정하여 만든 아이템 ID, 삭제면 행이 없는 새 ID)"""
+    db.add(SavedItemSourceDB(
+        copied_item_id=copied_item_id,
+        copied_catalog_id=reference.copied_catalog_id,
+        source_item_id=item_record.item_id,
+        source_updated_at=item_record.updated_at,
+        synced_at=item_record.updated_at                  # 복사본 수정 시간이 더 늦으므로 사용자 수정으로 취급
+    ))
+
+
+def materialize_item(
+    db: Session,
+    reference: CatalogReferenceDB,
+    user_id: str,
+    item_record: ItemDB,
+    item_update: ItemUpdate
+) -> ItemDB:
+    """
+    공유 아이템 수정 - 원본 아이템을 복사본 카탈로그로 복사한 뒤 수정 내용 적용
+    - 보유 상태는 새 아이템 ID로 옮기고, 클라이언트에는 원본 ID 삭제 + 새 아이템 생성으로 전달
+    """
+    now = get_kst_now()
+    new_item_id = str(uuid.uuid4())
+    
+    db_item = ItemDB(
+        item_id=new_item_id,
+        catalog_id=reference.copied_catalog_id,
+        name=item_record.name,
+        description=item_record.description,
+        image_url=item_record.image_url,
+        user_fields=item_record.user_fields,
+        created_at=item_record.created_at,                # 목록 순서 유지
+        updated_at=now
+    )
+    for key, value in item_update.dict(exclude_unset=True).items():
+        setattr(db_item, key, value)
+    db.add(db_item)
+    _stop_sharing(db, reference, item_record, new_item_id)
+    
+    moved = db.query(UserItemStatusDB).filter(
+        and_(
+            UserItemStatusDB.user_id == user_id,
+            UserItemStatusDB.item_id == item_record.item_id
+        )
+    ).update({UserItemStatusDB.item_id: new_item_id}, synchronize_session=False)
+    if not moved:
+        db.add(UserItemStatusDB(user_id=user_id, item_id=new_item_id, owned=False))
+    
+    copied_catalog_id = reference.copied_catalog_id
+    change_log.record_changes(db, user_id, [
+        (change_log.ENTITY_ITEM, item_record.item_id, copied_catalog_id, True),
+        (change_log.ENTITY_ITEM, new_item_id, copied_catalog_id, False),
+        (change_log.ENTITY_CATALOG, copied_catalog_id, copied_catalog_id, False)
+    ])
+    events.publish_after_commit(db, user_id, events.item_event(
+        events.ITEM_DELETED, ItemDB(item_id=item_record.item_id, catalog_id=copied_catalog_id)
+    ))
+    events.publish_after_commit(db, user_id, events.item_event(events.ITEM_CREATED, db_item))
+    db.commit()
+    db.refresh(db_item)
+    
+    return db_item
+
+
+def hide_item(db: Session, reference: CatalogReferenceDB, user_id: str, item_record: ItemDB) -> None:
+    """공유 아이템 삭제 - 원본은 그대로 두고 이 저장 카탈로그에서만 제외, 사용자의 보유 상태 삭제"""
+    _stop_sharing(db, reference, item_record, str(uuid.uuid4()))
+    db.query(UserItemStatusDB).filter(
+        and_(
+            UserItemStatusDB.user_id == user_id,
+            UserItemStatusDB.item_id == item_record.item_id
+        )
+    ).delete(synchronize_session=False)
+    
+    copied_catalog_id = reference.copied_catalog_id
+    change_log.record_changes(db, user_id, [
+        (change_log.ENTITY_ITEM, item_record.item_id, copied_catalog_id, True),
+        (change_log.ENTITY_CATALOG, copied_catalog_id, copied_catalog_id, False)
+    ])
+    events.publish_after_commit(db, user_id, events.item_event(
+        events.ITEM_DELETED, ItemDB(item_id=item_record.item_id, catalog_id=copied_catalog_id)
+    ))
+    db.commit()
+
+
+def delete_reference(db: Session, copied_catalog_id: str) -> None:
+    """참조 모드 저장 기록과 공유 아이템의 보유 상태 삭제 (저장 카탈로그 삭제 시, 커밋은 호출하는 쪽에서)"""
+    reference = get_reference(db, copied_catalog_id)
+    if reference is None:
+        return
+    
+    original_item_ids = select(ItemDB.item_id).where(ItemDB.catalog_id == reference.original_catalog_id)
+    db.query(UserItemStatusDB).filter(
+        and_(
+            UserItemStatusDB.user_id == reference.user_id,
+            UserItemStatusDB.item_id.in_(original_item_ids)
+        )
+    ).delete(synchronize_session=False)
+    db.delete(reference)
@@ -0,0 +1,193 @@
+"""
+동기화 변경 기록 CRUD 작업
+- 카탈로그/아이템 생성·수정·삭제와 보유 상태 변경을 카탈로그 소유자의 변경 기록에 남김
+- 변경을 만든 쓰기 작업과 같은 트랜잭션에서 기록 (crud 함수의 commit 전에 호출)
+- 버전은 사용자별 sync_state 행을 UPDATE ... RETURNING으로 한 번에 증가시켜 받으므로 동시 기록도 버전이 겹치지 않고,
+  그 행(SQLite는 DB 전체)의 쓰기 잠금을 커밋까지 유지하여 커밋 순서와 버전 순서가 같음 (클라이언트가 since 이후 변경을 놓치지 않음)
+- 엔티티마다 마지막 변경 한 행만 유지하여 기록이 엔티티 수 이상으로 늘어나지 않음
+"""
+from sqlalchemy.orm import Session
+from sqlalchemy import and_, update
+from sqlalchemy.dialects import postgresql, sqlite
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from app.models.database import ChangeLogDB, SyncStateDB, CatalogDB
+from app.core.config import get_kst_now
+
+# 엔티티 종류
+ENTITY_CATALOG = "catalog"
+ENTITY_ITEM = "item"
+
+# IN 조건 한 번에 넣을 ID 수
+_IN_CHUNK_SIZE = 500
+
+# 변경 단위: (엔티티 종류, 엔티티 ID, 소속 카탈로그 ID, 삭제 여부)
+Change = Tuple[str, str, Optional[str], bool]
+
+
+def _chunks(values: List[str], size: int = _IN_CHUNK_SIZE) -> Iterable[List[str]]:
+    for start in range(0, len(values), size):
+        yield values[start:start + size]
+
+
+def _ensure_sync_state(db: Session, user_id: str) -> None:
+    """
+    사용자 동기화 상태 행이 없으면 생성 (INSERT ... ON CONFLICT DO NOTHING)
+    - 동시에 처음 기록해도 중복 INSERT 오류가 나지 않음
+    - SQLite는 이 문장에서 쓰기 잠금을 잡으므로 이후 조회/증가가 다른 쓰기와 겹치지 않음
+    """
+    dialect_insert = postgresql.insert if db.get_bind().dialect.name == "postgresql" else sqlite.insert
+    db.execute(
+        dialect_insert(SyncStateDB).values(user_id=user_id, version=0, backfilled=False).on_conflict_do_nothing(
+            index_elements=[SyncStateDB.user_id]
+        )
+    )
+
+
+def _lock_sync_state(db: Session, user_id: str) -> SyncStateDB:
+    """사용자 동기화 상태 행 조회 (잠금) - 없으면 생성"""
+    _ensure_sync_state(db, user_id)
+    return db.query(SyncStateDB).filter(SyncStateDB.user_id == user_id).with_for_update().populate_existing().one()
+
+
+def _allocate_versions(db: Session, user_id: str, count: int) -> int:
+    """버전 count개를 한 번에 증가시켜 부여 - 부여한 마지막 버전 반환 (첫 버전은 반환값 - count + 1)"""
+    _ensure_sync_state(db, user_id)
+    return db.execute(
+        update(SyncStateDB).where(SyncStateDB.user_id == user_id).values(
+            version=SyncStateDB.version + count
+        ).returning(SyncStateDB.version)
+    ).scalar_one()
+
+
+def record_changes(db: Session, user_id: str, changes: List[Change]) -> None:
+    """
+    변경 기록 - 변경마다 새 버전을 부여하고 엔티티의 기존 기록 행을 갱신 (없으면 추가)
+    - 같은 엔티티가 여러 번 들어오면 마지막 변경만 기록
+    """
+    latest: Dict[Tuple[str, str], Change] = {}
+    for change in changes:
+        key = (change[0], change[1])
+        latest.pop(key, None)
+        latest[key] = change
+    if not latest:
+        return
+    
+    version = _allocate_versions(db, user_id, len(latest)) - len(latest)
+    
+    existing: Dict[Tuple[str, str], ChangeLogDB] = {}
+    entity_ids = list({entity_id for _, entity_id in latest})
+    for chunk in _chunks(entity_ids):
+        rows = db.query(ChangeLogDB).filter(
+            and_(
+                ChangeLogDB.user_id == user_id,
+                ChangeLogDB.entity_id.in_(chunk)
+            )
+        ).all()
+        for row in rows:
+            existing[(row.entity_type, row.entity_id)] = row
+    
+    now = get_kst_now()
+    for entity_type, entity_id, catalog_id, deleted in latest.values():
+        version += 1
+        row = existing.get((entity_type, entity_id))
+        if row is None:
+            row = ChangeLogDB(user_id=user_id, entity_type=entity_type, entity_id=entity_id)
+            db.add(row)
+        row.version = version
+        row.catalog_id = catalog_id
+        row.deleted = deleted
+        row.changed_at = now
+    
+    db.flush()
+
+
+def record_catalog_change(db: Session, user_id: str, catalog_id: str, deleted: bool = False) -> None:
+    """
+    카탈로그 변경 기록
+    - 삭제 시 소속 아이템의 기록은 지움 (클라이언트는 카탈로그 삭제 기록을 받으면 소속 아이템도 함께 삭제)
+    """
+    if deleted:
+        db.query(ChangeLogDB).filter(
+            and_(
+                ChangeLogDB.user_id == user_id,
+                ChangeLogDB.entity_type == ENTITY_ITEM,
+                ChangeLogDB.catalog_id == catalog_id
+            )
+        ).delete(synchronize_session=False)
+    
+    record_changes(db, user_id, [(ENTITY_CATALOG, catalog_id, catalog_id, deleted)])
+
+
+def record_item_changes(
+    db: Session,
+    catalog_id: str,
+    item_ids: List[str],
+    deleted: bool = False,
+    user_id: Optional[str] = None
+) -> Optional[str]:
+    """
+    아이템 변경 기록 (카탈로그 소유자의 기록) - 기록한 소유자 ID 반환 (기록하지 않았으면 None)
+    - 아이템 수/보유 수가 바뀌므로 소속 카탈로그도 변경으로 기록
+    - user_id를 넘기면 그 사용자가 카탈로그 소유자일 때만 기록 (보유 상태 변경은 본인 카탈로그만 동기화 대상)
+    """
+    owner_id = db.query(CatalogDB.user_id).filter(CatalogDB.catalog_id == catalog_id).scalar()
+    if owner_id is None or (user_id is not None and user_id != owner_id):
+        return None
+    
+    changes: List[Change] = [(ENTITY_ITEM, item_id, catalog_id, deleted) for item_id in item_ids]
+    changes.append((ENTITY_CATALOG, catalog_id, catalog_id, False))
+    record_changes(db, owner_id, changes)
+    return owner_id
+
+
+def delete_user_changes(db: Session, user_id: str) -> None:
+    """사용자의 변경 기록과 동기화 상태 삭제 (회원 탈퇴 시, 커밋은 호출하는 쪽에서)"""
+    db.query(ChangeLogDB).filter(ChangeLogDB.user_id == user_id).delete(synchronize_session=False)
+    db.query(SyncStateDB).filter(SyncStateDB.user_id == user_id).delete(synchronize_session=False)
+
+
+def get_sync_state(db: Session, user_id: str) -> Optional[SyncStateDB]:
+    """사용자 동기화 상태 조회"""
+    return db.query(SyncStateDB).filter(SyncStateDB.user_id == user_id).first()
+
+
+def backfill_user_changes(db: Session, user_id: str) -> None:
+    """
+    기존 데이터의 변경 기록 생성 (변경 기록 도입 전에 만들어진 카탈로그/아이템)
+    - 사용자의 첫 동기화 요청에서 한 번 실행, 이미 기록이 있는 엔티티는 새 버전으로 갱신됨
+    - 참조 모드 카탈로그가 공유 중인 원본 아이템도 저장 카탈로그의 아이템으로 기록
+    """
+    # catalog_reference가 이 모듈을 사용하므로 함수 안에서 import
+    from app.crud import catalog_reference
+    
+    state = _lock_sync_state(db, user_id)
+    if state.backfilled:
+        return
+    
+    changes: List[Change] = []
+    catalog_ids = [
+        catalog_id for (catalog_id,) in
+        db.query(CatalogDB.catalog_id).filter(CatalogDB.user_id == user_id).order_by(CatalogDB.created_at).all()
+    ]
+    changes.extend((ENTITY_CATALOG, catalog_id, catalog_id, False) for catalog_id in catalog_ids)
+    
+    for chunk in _chunks(catalog_ids):
+        items = catalog_reference.list_catalog_items(db, chunk)
+        changes.extend((ENTITY_ITEM, item_id, catalog_id, False) for catalog_id, item_id in items)
+    
+    record_changes(db, user_id, changes)
+    state.backfilled = True
+    db.commit()
+
+
+def get_changes(db: Session, user_id: str, since: int, limit: int) -> Tuple[List[ChangeLogDB], bool]:
+    """since 이후 변경 기록을 버전 순으로 limit개 조회 - (기록 목록, 다음 페이지 존재 여부)"""
+    rows = db.query(ChangeLogDB).filter(
+        and_(
+            ChangeLogDB.user_id == user_id,
+            ChangeLogDB.version > since
+        )
+    ).order_by(ChangeLogDB.version).limit(limit + 1).all()
+    
+    return rows[:limit], len(rows) > limit
@@ -0,0 +1,87 @@
+"""
+이미지 원본(내용 주소 저장) CRUD 작업
+"""
+from sqlalchemy.orm import Session
+from sqlalchemy import and_
+from sqlalchemy.exc import IntegrityError
+from datetime import datetime
+from typing import Optional, Set
+
+from app.models.database import ImageBlobDB, ImageBlobRefDB
+
+
+def get_blob(db: Session, sha256: str) -> Optional[ImageBlobDB]:
+    """SHA-256으로 저장된 이미지 조회"""
+    return db.query(ImageBlobDB).filter(ImageBlobDB.sha256 == sha256).first()
+
+
+def add_blob_reference(db: Session, sha256: str, user_id: str, file_path: str, size: int) -> ImageBlobDB:
+    """
+    이미지 참조 추가
+    - 처음 저장되는 내용이면 원본 레코드 생성, 이미 있으면 참조 수만 증가
+    - 같은 내용이 동시에 업로드되어 생성이 충돌하면 참조 수 증가로 처리
+    """
+    db_blob = get_blob(db, sha256)
+    
+    if not db_blob:
+        try:
+            db_blob = ImageBlobDB(sha256=sha256, file_path=file_path, size=size, ref_count=0)
+            db.add(db_blob)
+            db.flush()
+        except IntegrityError:
+            db.rollback()
+            db_blob = get_blob(db, sha256)
+    
+    db_blob.ref_count += 1
+    db.add(ImageBlobRefDB(sha256=sha256, user_id=user_id))
+    db.commit()
+    db.refresh(db_blob)
+    
+    return db_blob
+
+
+def release_blob_reference(db: Session, sha256: str, user_id: str) -> Optional[int]:
+    """
+    사용자의 이미지 참조 하나 제거
+    - 사용자의 참조가 없으면 None 반환 (삭제 권한 없음)
+    - 남은 참조 수 반환, 0이 되면 원본 레코드도 삭제 (호출 측에서 파일 삭제)
+    """
+    ref = db.query(ImageBlobRefDB).filter(
+        and_(
+            ImageBlobRefDB.sha256 == sha256,
+            ImageBlobRefDB.user_id == user_id
+        )
+    ).first()
+    
+    if not ref:
+        return None
+    
+    db.delete(ref)
+    
+    remaining = 0
+    db_blob = get_blob(db, sha256)
+    if db_blob:
+        db_blob.ref_count = max(db_blob.ref_count - 1, 0)
+        remaining = db_blob.ref_count
+        if remaining == 0:
+            db.delete(db_blob)
+    
+    db.commit()
+    
+    return remaining
+
+
+def get_recently_referenced_paths(db: Session, since: datetime) -> Set[str]:
+    """since 이후 참조가 추가된 이미지의 파일 경로 (같은 내용 재업로드 시 기존 파일의 수정 시간은 그대로이므로 참조 시간으로 판단)"""
+    rows = db.query(ImageBlobDB.file_path).join(
+        ImageBlobRefDB, ImageBlobRefDB.sha256 == ImageBlobDB.sha256
+    ).filter(ImageBlobRefDB.created_at > since).distinct().all()
+    
+    return {file_path for (file_path,) in rows}
+
+
+def delete_blob(db: Session, sha256: str) -> None:
+    """파일이 정리된 이미지의 원본 레코드와 참조 기록 삭제"""
+    db.query(ImageBlobRefDB).filter(ImageBlobRefDB.sha256 == sha256).delete()
+    db.query(ImageBlobDB).filter(ImageBlobDB.sha256 == sha256).delete()
+    db.commit()
@@ -2,13 +2,15 @@
 아이템 CRUD 작업
 """
 from sqlalchemy.orm import Session
-from sqlalchemy import and_
-from typing import List, Optional
+from sqlalchemy import and_, select
+from typing import Iterator, List, Optional, Tuple
 import uuid
 
 from app.models.database import ItemDB, UserItemStatusDB
 from app.schemas.item import ItemCreate, ItemUpdate
 from app.core.config import get_kst_now
+from app.crud import change_log, catalog_reference
+from app.core import events
 
 
 def get_item(db: Session, item_id: str) -> Optional[ItemDB]:
@@ -21,6 +23,71 @@ def get_items_by_catalog(db: Session, catalog_id: str) -> List[ItemDB]:
     return db.query(ItemDB).filter(ItemDB.catalog_id == catalog_id).all()
 
 
+def _catalog_items_statement(catalog_id: str, user_id: Optional[str]):
+    """카탈로그 아이템(참조 모드 카탈로그는 공유 중인 원본 아이템 포함)과 보유 여부 조회 쿼리"""
+    catalog_items = catalog_reference.catalog_item_pairs(catalog_ids=[catalog_id])
+    
+    if user_id:
+        stmt = select(ItemDB, UserItemStatusDB.owned).outerjoin(
+            UserItemStatusDB,
+            and_(
+                UserItemStatusDB.item_id == ItemDB.item_id,
+                UserItemStatusDB.user_id == user_id
+            )
+        )
+    else:
+        stmt = select(ItemDB)
+    
+    return stmt.join(
+        catalog_items, catalog_items.c.item_id == ItemDB.item_id
+    ).order_by(ItemDB.created_at, ItemDB.item_id)
+
+
+def get_catalog_items_with_owned(db: Session, catalog_id: str, user_id: Optional[str]) -> List[Tuple[ItemDB, bool]]:
+    """카탈로그 아이템 목록을 보유 여부와 함께 조회 (outer join 한 번, 참조 모드 카탈로그는 공유 아이템 포함)"""
+    rows = db.execute(_catalog_items_statement(catalog_id, user_id)).all()
+    return [(row[0], bool(row[1]) if user_id else False) for row in rows]
+
+
+def iter_items_with_owned(
+    db: Session,
+    catalog_id: str,
+    user_id: Optional[str],
+    batch_size: int = 500
+) -> Iterator[Tuple[ItemDB, bool]]:
+    """
+    카탈로그 아이템을 보유 여부와 함께 스트리밍 조회 (내보내기용)
+    - 서버 측 커서(yield_per)로 batch_size 단위만 메모리에 유지
+    - 보유 상태는 아이템별 추가 조회 없이 outer join 한 번으로 가져옴
+    - 참조 모드 카탈로그는 공유 중인 원본 아이템 포함
+    """
+    stmt = _catalog_items_statement(catalog_id, user_id)
+    result = db.execute(stmt.execution_options(yield_per=batch_size, stream_results=True))
+    
+    for row in result:
+        item_record = row[0]
+        owned = bool(row[1]) if user_id else False
+        yield item_record, owned
+        # 이미 전송한 행은 세션에서 분리하여 identity map이 커지지 않도록 함
+        db.expunge(item_record)
+
+
+def get_items_with_owned(db: Session, item_ids: List[str], user_id: str) -> List[Tuple[ItemDB, bool]]:
+    """아이템 ID 목록을 보유 여부와 함께 조회 (outer join 한 번, 없는 ID는 결과에서 빠짐)"""
+    if not item_ids:
+        return []
+    
+    rows = db.query(ItemDB, UserItemStatusDB.owned).outerjoin(
+        UserItemStatusDB,
+        and_(
+            UserItemStatusDB.item_id == ItemDB.item_id,
+            UserItemStatusDB.user_id == user_id
+        )
+    ).filter(ItemDB.item_id.in_(item_ids)).all()
+    
+    return [(item_record, bool(owned)) for item_record, owned in rows]
+
+
 def create_item(db: Session, item: ItemCreate, user_id: str) -> ItemDB:
     """아이템 생성"""
     item_id = str(uuid.uuid4())
@@ -44,6 +111,9 @@ def create_item(db: Session, item: ItemCreate, user_id: str) -> ItemDB:
         owned=False
     )
     db.add(user_item_status)
+    owner_id = change_log.record_item_changes(db, item.catalog_id, [item_id])
+    events.publish_after_commit(db, owner_id, events.item_event(events.ITEM_CREATED, db_item))
+    catalog_reference.record_shared_item_changes(db, item.catalog_id, [db_item], events.ITEM_CREATED)
     db.commit()
     db.refresh(db_item)
     
@@ -63,6 +133,9 @@ def update_item(db: Session, item_id: str, item_update: ItemUpdate) -> Optional[
             setattr(db_item, key, value)
         
         db_item.updated_at = get_kst_now()
+        owner_id = change_log.record_item_changes(db, db_item.catalog_id, [item_id])
+        events.publish_after_commit(db, owner_id, events.item_event(events.ITEM_UPDATED, db_item))
+        catalog_reference.record_shared_item_changes(db, db_item.catalog_id, [db_item], events.ITEM_UPDATED)
         db.commit()
         db.refresh(db_item)
     
@@ -76,10 +149,13 @@ def delete_item(db: Session, item_id: str) -> bool:
     if not db_item:
         return False
     
-    # 아이템 상태 삭제
+    # 아이템 상태 삭제 (참조 모드로 공유 중인 사용자의 보유 상태 포함, 삭제 기록으로 알림)
     db.query(UserItemStatusDB).filter(UserItemStatusDB.item_id == item_id).delete()
     
     db.delete(db_item)
+    owner_id = change_log.record_item_changes(db, db_item.catalog_id, [item_id], deleted=True)
+    events.publish_after_commit(db, owner_id, events.item_event(events.ITEM_DELETED, db_item))
+    catalog_reference.record_shared_item_changes(db, db_item.catalog_id, [db_item], events.ITEM_DELETED)
     db.commit()
     
     return True
@@ -113,17 +189,32 @@ def toggle_item_owned(db: Session, user_id: str, item_id: str) -> UserItemStatus
     user_status.owned = not user_status.owned
     user_status.updated_at = get_kst_now()
     
+    # 본인 카탈로그의 아이템이면 동기화 변경 기록, 보유 상태 알림은 토글한 사용자에게 전달
+    # 참조 모드로 공유 중인 아이템이면 저장 카탈로그의 아이템 변경으로 기록
+    db_item = get_item(db, item_id)
+    if db_item:
+        catalog_id = db_item.catalog_id
+        if change_log.record_item_changes(db, catalog_id, [item_id], user_id=user_id) is None:
+            reference = catalog_reference.find_item_reference(db, user_id, db_item)
+            if reference:
+                catalog_id = reference.copied_catalog_id
+                change_log.record_changes(db, user_id, [
+                    (change_log.ENTITY_ITEM, item_id, catalog_id, False),
+                    (change_log.ENTITY_CATALOG, catalog_id, catalog_id, False)
+                ])
+        events.publish_after_commit(db, user_id, {**events.owned_event(db_item, user_status.owned), "catalog_id": catalog_id})
+    
     db.commit()
     db.refresh(user_status)
     
     return user_status
 
 
-def build_item_response(item_record: ItemDB, owned: bool) -> dict:
-    """아이템 응답 데이터 구성"""
+def build_item_response(item_record: ItemDB, owned: bool, catalog_id: Optional[str] = None) -> dict:
+    """아이템 응답 데이터 구성 (catalog_id: 참조 모드로 공유 중인 아이템을 보여 줄 저장 카탈로그 ID)"""
     return {
         "item_id": item_record.item_id,
-        "catalog_id": item_record.catalog_id,
+        "catalog_id": catalog_id or item_record.catalog_id,
         "name": item_record.name,
         "description": item_record.description,
         "image_url": item_record.image_url,
@@ -0,0 +1,79 @@
+"""
+이어받기 업로드 세션 CRUD 작업
+"""
+from sqlalchemy.orm import Session
+from sqlalchemy import and_
+from datetime import timedelta
+from typing import List, Optional
+import uuid
+
+from app.core.config import get_kst_now, settings
+from app.models.database import UploadSessionDB
+
+
+def _new_expiry():
+    """세션 만료 시간 계산 (현재 시간 + UPLOAD_SESSION_TTL_SECONDS)"""
+    return get_kst_now() + timedelta(seconds=settings.UPLOAD_SESSION_TTL_SECONDS)
+
+
+def create_upload_session(
+    db: Session,
+    user_id: str,
+    filename: str,
+    content_type: Optional[str],
+    upload_length: int
+) -> UploadSessionDB:
+    """새 이어받기 업로드 세션 생성"""
+    db_session = UploadSessionDB(
+        id=str(uuid.uuid4()),
+        user_id=user_id,
+        filename=filename,
+        content_type=content_type,
+        upload_length=upload_length,
+        expires_at=_new_expiry()
+    )
+    db.add(db_session)
+    db.commit()
+    db.refresh(db_session)
+    
+    return db_session
+
+
+def get_active_session(db: Session, session_id: str, user_id: str) -> Optional[UploadSessionDB]:
+    """만료되지 않은 본인 업로드 세션 조회"""
+    return db.query(UploadSessionDB).filter(
+        and_(
+            UploadSessionDB.id == session_id,
+            UploadSessionDB.user_id == user_id,
+            UploadSessionDB.expires_at > get_kst_now()
+        )
+    ).first()
+
+
+def touch_session(db: Session, db_session: UploadSessionDB) -> UploadSessionDB:
+    """청크 수신 시 세션 만료 시간 연장"""
+    db_session.expires_at = _new_expiry()
+    db.commit()
+    db.refresh(db_session)
+    
+    return db_session
+
+
+def delete_session(db: Session, session_id: str) -> None:
+    """업로드 세션 삭제 (완료/취소 시)"""
+    db.query(UploadSessionDB).filter(UploadSessionDB.id == session_id).delete()
+    db.commit()
+
+
+def pop_expired_sessions(db: Session) -> List[str]:
+    """만료된 세션을 삭제하고 ID 목록 반환 (부분 파일 정리용)"""
+    expired_ids = [
+        session_id for (session_id,) in
+        db.query(UploadSessionDB.id).filter(UploadSessionDB.expires_at <= get_kst_now()).all()
+    ]
+    
+    if expired_ids:
+        db.query(UploadSessionDB).filter(UploadSessionDB.id.in_(expired_ids)).delete(synchronize_session=False)
+        db.commit()
+    
+    return expired_ids
@@ -0,0 +1,34 @@
+"""
+직접 업로드 기록 CRUD 작업
+"""
+from sqlalchemy.orm import Session
+from typing import Optional
+
+from app.models.database import UploadedObjectDB
+
+
+def get_uploaded_object(db: Session, key: str) -> Optional[UploadedObjectDB]:
+    """저장소 키로 업로드 기록 조회"""
+    return db.query(UploadedObjectDB).filter(UploadedObjectDB.key == key).first()
+
+
+def record_uploaded_object(db: Session, key: str, user_id: str, size: int) -> UploadedObjectDB:
+    """직접 업로드 완료 기록 (같은 키를 다시 확인하면 크기만 갱신)"""
+    db_object = get_uploaded_object(db, key)
+    
+    if db_object:
+        db_object.size = size
+    else:
+        db_object = UploadedObjectDB(key=key, user_id=user_id, size=size)
+        db.add(db_object)
+    
+    db.commit()
+    db.refresh(db_object)
+    
+    return db_object
+
+
+def delete_uploaded_object(db: Session, key: str) -> None:
+    """업로드 기록 삭제 (파일 삭제 시)"""
+    db.query(UploadedObjectDB).filter(UploadedObjectDB.key == key).delete()
+    db.commit()
@@ -2,7 +2,8 @@
 사용자 관련 CRUD 작업
 """
 from sqlalchemy.orm import Session
-from app.models.database import CatalogDB, ItemDB, UserItemStatusDB, UserCatalogDB
+from app.models.database import CatalogDB, ItemDB, UserItemStatusDB, UserCatalogDB, SavedItemSourceDB
+from app.crud import change_log, catalog_reference, user_catalog
 
 
 def delete_user_data(db: Session, user_id: str) -> dict:
@@ -24,6 +25,9 @@ def delete_user_data(db: Session, user_id: str) -> dict:
     user_catalogs = db.query(CatalogDB).filter(CatalogDB.user_id == user_id).all()
     
     for catalog in user_catalogs:
+        # 다른 사용자가 참조 모드로 저장한 카탈로그는 아이템을 복사하여 유지
+        user_catalog.detach_references(db, catalog.catalog_id)
+        
         # 카탈로그의 아이템들 삭제
         items = db.query(ItemDB).filter(ItemDB.catalog_id == catalog.catalog_id).all()
         for item in items:
@@ -41,6 +45,12 @@ def delete_user_data(db: Session, user_id: str) -> dict:
             UserCatalogDB.original_catalog_id == catalog.catalog_id
         ).delete()
         
+        # 저장한 카탈로그(복사본)이면 아이템 출처 기록, 참조 모드 저장 기록 삭제
+        db.query(SavedItemSourceDB).filter(
+            SavedItemSourceDB.copied_catalog_id == catalog.catalog_id
+        ).delete()
+        catalog_reference.delete_reference(db, catalog.catalog_id)
+        
         db.delete(catalog)
         deleted_counts["catalogs"] += 1
     
@@ -79,6 +89,9 @@ def delete_user_data(db: Session, user_id: str) -> dict:
     ).delete()
     deleted_counts["item_statuses"] += remaining_statuses
     
+    # 4. 동기화 변경 기록 삭제
+    change_log.delete_user_changes(db, user_id)
+    
     db.commit()
     
     return deleted_counts
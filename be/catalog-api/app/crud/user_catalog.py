@@ -1,12 +1,24 @@
 """
 사용자 카탈로그 CRUD 작업
 """
-from sqlalchemy.orm import Session
-from sqlalchemy import and_
-from typing import List, Optional
+from sqlalchemy.orm import Session, aliased
+from sqlalchemy import and_, func, insert, select, update
+from collections import defaultdict, deque
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
 import uuid
 
-from app.models.database import UserCatalogDB, CatalogDB, ItemDB, UserItemStatusDB
+from app.models.database import UserCatalogDB, CatalogDB, ItemDB, UserItemStatusDB, SavedItemSourceDB, CatalogReferenceDB
+from app.crud import change_log, catalog_reference
+from app.core import events
+from app.core.config import settings, get_kst_now
+
+# 저장 방식
+SAVE_MODE_COPY = "copy"
+SAVE_MODE_REFERENCE = "reference"
+
+# IN 조건 한 번에 넣을 ID 수
+_IN_CHUNK_SIZE = 500
 
 
 def get_user_catalog(db: Session, user_id: str, original_catalog_id: str) -> Optional[UserCatalogDB]:
@@ -19,6 +31,49 @@ def get_user_catalog(db: Session, user_id: str, original_catalog_id: str) -> Opt
     ).first()
 
 
+def get_user_catalog_by_copy(db: Session, user_id: str, copied_catalog_id: str) -> Optional[UserCatalogDB]:
+    """복사본 카탈로그 ID로 저장 기록 조회"""
+    return db.query(UserCatalogDB).filter(
+        and_(
+            UserCatalogDB.user_id == user_id,
+            UserCatalogDB.copied_catalog_id == copied_catalog_id
+        )
+    ).first()
+
+
+def get_original_catalog_ids(db: Session, user_id: str, copied_catalog_ids: List[str]) -> Dict[str, str]:
+    """복사본 카탈로그 ID → 원본 카탈로그 ID (IN 쿼리 한 번)"""
+    if not copied_catalog_ids:
+        return {}
+    
+    rows = db.query(UserCatalogDB.copied_catalog_id, UserCatalogDB.original_catalog_id).filter(
+        and_(
+            UserCatalogDB.user_id == user_id,
+            UserCatalogDB.copied_catalog_id.in_(copied_catalog_ids)
+        )
+    ).all()
+    
+    return {copied_catalog_id: original_catalog_id for copied_catalog_id, original_catalog_id in rows}
+
+
+def get_saved_catalog_map(db: Session, user_id: str, original_catalog_ids: List[str]) -> Dict[str, str]:
+    """
+    여러 카탈로그의 저장 여부를 한 번에 조회 - {원본 카탈로그 ID: 복사본 카탈로그 ID} (저장하지 않은 카탈로그는 빠짐)
+    - 공개 피드/카드 목록에서 카탈로그마다 check_catalog_saved를 호출하지 않고 IN 쿼리 한 번으로 확인
+    """
+    if not original_catalog_ids:
+        return {}
+    
+    rows = db.query(UserCatalogDB.original_catalog_id, UserCatalogDB.copied_catalog_id).filter(
+        and_(
+            UserCatalogDB.user_id == user_id,
+            UserCatalogDB.original_catalog_id.in_(set(original_catalog_ids))
+        )
+    ).all()
+    
+    return {original_catalog_id: copied_catalog_id for original_catalog_id, copied_catalog_id in rows}
+
+
 def check_catalog_saved(db: Session, user_id: str, catalog_id: str) -> bool:
     """카탈로그 저장 여부 확인"""
     # catalog_id가 원본 카탈로그 ID인 경우
@@ -32,8 +87,15 @@ def check_catalog_saved(db: Session, user_id: str, catalog_id: str) -> bool:
     return saved is not None
 
 
-def save_catalog(db: Session, user_id: str, original_catalog_id: str) -> dict:
-    """카탈로그 복사 및 저장"""
+def save_catalog(db: Session, user_id: str, original_catalog_id: str, mode: Optional[str] = None) -> dict:
+    """
+    카탈로그 복사 및 저장
+    - copy: 아이템 전체 복사 (카탈로그 크기에 비례)
+    - reference: 아이템은 원본과 공유하고 저장 기록만 추가 (카탈로그 크기와 관계없이 일정)
+    - mode를 생략하면 SAVED_CATALOG_MODE
+    """
+    mode = mode or settings.SAVED_CATALOG_MODE
+    
     # 원본 카탈로그 조회
     original_catalog = db.query(CatalogDB).filter(CatalogDB.catalog_id == original_catalog_id).first()
     
@@ -57,30 +119,21 @@ def save_catalog(db: Session, user_id: str, original_catalog_id: str) -> dict:
     db.add(copied_catalog)
     db.flush()
     
-    # 아이템 복사
-    original_items = db.query(ItemDB).filter(ItemDB.catalog_id == original_catalog_id).all()
+    changes = [(change_log.ENTITY_CATALOG, new_catalog_id, new_catalog_id, False)]
     
-    for original_item in original_items:
-        new_item_id = str(uuid.uuid4())
-        
-        copied_item = ItemDB(
-            item_id=new_item_id,
-            catalog_id=new_catalog_id,
-            name=original_item.name,
-            description=original_item.description,
-            image_url=original_item.image_url,
-            user_fields=original_item.user_fields
-        )
-        
-        db.add(copied_item)
-        
-        # 사용자 아이템 상태 생성
-        user_item_status = UserItemStatusDB(
-            user_id=user_id,
-            item_id=new_item_id,
-            owned=False
+    if mode == SAVE_MODE_REFERENCE:
+        # 원본 아이템 공유 (수정할 때 그 아이템만 복사), 공유 아이템은 저장 카탈로그의 아이템으로 기록
+        catalog_reference.create_reference(db, user_id, original_catalog_id, new_catalog_id)
+        db.flush()
+        changes.extend(
+            (change_log.ENTITY_ITEM, item_id, new_catalog_id, False)
+            for _, item_id in catalog_reference.list_catalog_items(db, [new_catalog_id])
         )
-        db.add(user_item_status)
+    else:
+        # 아이템 복사 (출처 기록 포함)
+        original_items = db.query(ItemDB).filter(ItemDB.catalog_id == original_catalog_id).order_by(ItemDB.created_at).all()
+        copied_items = _copy_items(db, user_id, new_catalog_id, original_items, get_kst_now())
+        changes.extend((change_log.ENTITY_ITEM, row["item_id"], new_catalog_id, False) for row in copied_items)
     
     # 원본-복사본 관계 저장
     user_catalog = UserCatalogDB(
@@ -90,14 +143,87 @@ def save_catalog(db: Session, user_id: str, original_catalog_id: str) -> dict:
     )
     
     db.add(user_catalog)
+    change_log.record_changes(db, user_id, changes)
+    events.publish_after_commit(db, user_id, events.catalog_event(events.CATALOG_CREATED, copied_catalog))
     db.commit()
     
     return {
         "copied_catalog_id": new_catalog_id,
-        "original_catalog_id": original_catalog_id
+        "original_catalog_id": original_catalog_id,
+        "mode": mode
     }
 
 
+def _copy_items(
+    db: Session,
+    user_id: str,
+    copied_catalog_id: str,
+    original_items: List[ItemDB],
+    now: datetime,
+    owned: Optional[Dict[str, bool]] = None,
+    keep_created_at: bool = False
+) -> List[dict]:
+    """
+    원본 아이템을 복사본 카탈로그에 일괄 추가 - 아이템, 사용자 상태, 출처 기록을 각각 INSERT 한 번으로 저장
+    - 보유 상태는 owned(원본 아이템 ID → 보유 여부)를 따르고 없으면 미보유
+    - keep_created_at이면 원본 아이템의 생성 시간 유지 (이미 복사된 아이템과 목록 순서를 맞출 때)
+    - 복사본 아이템의 수정 시간과 출처의 synced_at을 같은 값(now)으로 두어 이후 사용자 수정 여부를 구분
+    - 추가한 아이템 행 목록 반환
+    """
+    if not original_items:
+        return []
+    
+    item_rows = []
+    source_rows = []
+    for index, original_item in enumerate(original_items):
+        new_item_id = str(uuid.uuid4())
+        item_rows.append({
+            "item_id": new_item_id,
+            "catalog_id": copied_catalog_id,
+            "name": original_item.name,
+            "description": original_item.description,
+            "image_url": original_item.image_url,
+            "user_fields": original_item.user_fields,
+            "created_at": original_item.created_at if keep_created_at else now + timedelta(microseconds=index),     # 원본 순서 유지
+            "updated_at": now
+        })
+        source_rows.append({
+            "copied_item_id": new_item_id,
+            "copied_catalog_id": copied_catalog_id,
+            "source_item_id": original_item.item_id,
+            "source_updated_at": original_item.updated_at,
+            "synced_at": now
+        })
+    
+    db.execute(insert(ItemDB), item_rows)
+    owned = owned or {}
+    db.execute(insert(UserItemStatusDB), [
+        {
+            "user_id": user_id,
+            "item_id": row["copied_item_id"],
+            "owned": owned.get(row["source_item_id"], False),
+            "created_at": now,
+            "updated_at": now
+        }
+        for row in source_rows
+    ])
+    db.execute(insert(SavedItemSourceDB), source_rows)
+    
+    return item_rows
+
+
+def _chunks(values: List[str], size: int = _IN_CHUNK_SIZE):
+    for start in range(0, len(values), size):
+        yield values[start:start + size]
+
+
+def _delete_item_sources(db: Session, copied_catalog_id: str) -> None:
+    """복사본 카탈로그의 아이템 출처 기록 삭제 (복사본 삭제 시)"""
+    db.query(SavedItemSourceDB).filter(
+        SavedItemSourceDB.copied_catalog_id == copied_catalog_id
+    ).delete(synchronize_session=False)
+
+
 def unsave_catalog(db: Session, user_id: str, copied_catalog_id: str) -> bool:
     """저장한 카탈로그 제거"""
     # 카탈로그 조회
@@ -112,8 +238,10 @@ def unsave_catalog(db: Session, user_id: str, copied_catalog_id: str) -> bool:
         db.query(UserItemStatusDB).filter(UserItemStatusDB.item_id == item.item_id).delete()
         db.delete(item)
     
-    # 카탈로그 삭제
+    # 카탈로그, 아이템 출처 기록, 참조 모드 저장 기록 삭제
     db.delete(catalog)
+    _delete_item_sources(db, copied_catalog_id)
+    catalog_reference.delete_reference(db, copied_catalog_id)
     
     # 원본 참조 삭제
     user_catalog_ref = db.query(UserCatalogDB).filter(
@@ -126,6 +254,396 @@ def unsave_catalog(db: Session, user_id: str, copied_catalog_id: str) -> bool:
     if user_catalog_ref:
         db.delete(user_catalog_ref)
     
+    change_log.record_catalog_change(db, user_id, copied_catalog_id, deleted=True)
+    events.publish_after_commit(db, user_id, events.catalog_event(events.CATALOG_DELETED, catalog))
     db.commit()
     
     return True
+
+
+def detach_references(db: Session, original_catalog_id: str) -> None:
+    """
+    원본 카탈로그를 참조하는 저장 카탈로그를 복사 모드로 전환 (원본 삭제 전에 호출, 커밋은 호출하는 쪽에서)
+    - 공유 중이던 아이템을 저장 카탈로그마다 복사하고 보유 상태를 새 아이템으로 옮김
+    """
+    references = db.query(CatalogReferenceDB).filter(
+        CatalogReferenceDB.original_catalog_id == original_catalog_id
+    ).all()
+    if not references:
+        return
+    
+    now = get_kst_now()
+    original_items = db.query(ItemDB).filter(ItemDB.catalog_id == original_catalog_id).order_by(ItemDB.created_at).all()
+    
+    for reference in references:
+        overridden = {
+            source_item_id for (source_item_id,) in db.query(SavedItemSourceDB.source_item_id).filter(
+                SavedItemSourceDB.copied_catalog_id == reference.copied_catalog_id
+            ).all()
+        }
+        shared_items = [item for item in original_items if item.item_id not in overridden]
+        shared_ids = [item.item_id for item in shared_items]
+        
+        owned = {}
+        for chunk in _chunks(shared_ids):
+            statuses = db.query(UserItemStatusDB.item_id, UserItemStatusDB.owned).filter(
+                and_(
+                    UserItemStatusDB.user_id == reference.user_id,
+                    UserItemStatusDB.item_id.in_(chunk)
+                )
+            ).all()
+            owned.update((item_id, bool(item_owned)) for item_id, item_owned in statuses)
+            db.query(UserItemStatusDB).filter(
+                and_(
+                    UserItemStatusDB.user_id == reference.user_id,
+                    UserItemStatusDB.item_id.in_(chunk)
+                )
+            ).delete(synchronize_session=False)
+        
+        copied_items = _copy_items(db, reference.user_id, reference.copied_catalog_id, shared_items, now, owned, keep_created_at=True)
+        
+        copied_catalog_id = reference.copied_catalog_id
+        changes = [(change_log.ENTITY_ITEM, item_id, copied_catalog_id, True) for item_id in shared_ids]
+        changes.extend((change_log.ENTITY_ITEM, row["item_id"], copied_catalog_id, False) for row in copied_items)
+        changes.append((change_log.ENTITY_CATALOG, copied_catalog_id, copied_catalog_id, False))
+        change_log.record_changes(db, reference.user_id, changes)
+        
+        db.delete(reference)
+
+
+def _completion_rate(owned_count: int, item_count: int) -> float:
+    """수집률 (calculate_catalog_stats와 같은 방식으로 소수점 2자리 반올림)"""
+    return round(owned_count / item_count * 100, 2) if item_count > 0 else 0
+
+
+def _catalog_progress_query(db: Session, user_id: str):
+    """
+    내 카탈로그별 아이템 수, 보유 수, 마지막 보유 처리 시간 (집계 서브쿼리)
+    - 아이템 수와 보유 수를 각각 GROUP BY 서브쿼리로 집계한 뒤 카탈로그에 외부 조인 (조인 중복 집계 방지)
+    - 참조 모드 카탈로그는 공유 중인 원본 아이템도 포함
+    """
+    catalog_items = catalog_reference.catalog_item_pairs(owner_id=user_id)
+    item_counts = db.query(
+        catalog_items.c.catalog_id.label("catalog_id"),
+        func.count(catalog_items.c.item_id).label("item_count")
+    ).group_by(catalog_items.c.catalog_id).subquery()
+    
+    owned_counts = db.query(
+        catalog_items.c.catalog_id.label("catalog_id"),
+        func.count(func.distinct(UserItemStatusDB.item_id)).label("owned_count"),
+        func.max(UserItemStatusDB.updated_at).label("last_owned_at")
+    ).join(
+        UserItemStatusDB,
+        and_(
+            UserItemStatusDB.item_id == catalog_items.c.item_id,
+            UserItemStatusDB.user_id == user_id,
+            UserItemStatusDB.owned == True
+        )
+    ).group_by(catalog_items.c.catalog_id).subquery()
+    
+    return db.query(
+        CatalogDB.catalog_id.label("catalog_id"),
+        CatalogDB.title.label("title"),
+        CatalogDB.category.label("category"),
+        CatalogDB.thumbnail_url.label("thumbnail_url"),
+        func.coalesce(item_counts.c.item_count, 0).label("item_count"),
+        func.coalesce(owned_counts.c.owned_count, 0).label("owned_count"),
+        owned_counts.c.last_owned_at.label("last_owned_at")
+    ).outerjoin(
+        item_counts, item_counts.c.catalog_id == CatalogDB.catalog_id
+    ).outerjoin(
+        owned_counts, owned_counts.c.catalog_id == CatalogDB.catalog_id
+    ).filter(
+        CatalogDB.user_id == user_id
+    )
+
+
+def get_collection_summary(db: Session, user_id: str, recent_limit: int = 5) -> dict:
+    """
+    홈 대시보드용 수집 현황 요약 (쿼리 2개)
+    - 카테고리별 카탈로그/아이템/보유 수를 한 번에 집계하고 전체 합계는 카테고리 합으로 계산
+    - 최근 보유 처리 시간 기준으로 수집이 진행된 카탈로그 recent_limit개 조회
+    """
+    progress = _catalog_progress_query(db, user_id).subquery()
+    
+    category_rows = db.query(
+        progress.c.category,
+        func.count(progress.c.catalog_id),
+        func.sum(progress.c.item_count),
+        func.sum(progress.c.owned_count)
+    ).group_by(progress.c.category).all()
+    
+    categories = []
+    for category, catalog_count, item_count, owned_count in category_rows:
+        item_count = int(item_count or 0)
+        owned_count = int(owned_count or 0)
+        categories.append({
+            "category": category or "미분류",
+            "catalog_count": catalog_count,
+            "item_count": item_count,
+            "owned_count": owned_count,
+            "completion_rate": _completion_rate(owned_count, item_count)
+        })
+    categories.sort(key=lambda summary: (-summary["item_count"], summary["category"]))
+    
+    recent_catalogs = []
+    if recent_limit > 0:
+        recent_rows = db.query(progress).filter(
+            progress.c.last_owned_at.isnot(None)
+        ).order_by(progress.c.last_owned_at.desc()).limit(recent_limit).all()
+        
+        for row in recent_rows:
+            recent_catalogs.append({
+                "catalog_id": row.catalog_id,
+                "title": row.title,
+                "category": row.category or "미분류",
+                "thumbnail_url": row.thumbnail_url,
+                "item_count": row.item_count,
+                "owned_count": row.owned_count,
+                "completion_rate": _completion_rate(row.owned_count, row.item_count),
+                "last_owned_at": row.last_owned_at.isoformat()
+            })
+    
+    total_items = sum(summary["item_count"] for summary in categories)
+    total_owned = sum(summary["owned_count"] for summary in categories)
+    
+    return {
+        "total_catalogs": sum(summary["catalog_count"] for summary in categories),
+        "total_items": total_items,
+        "total_owned": total_owned,
+        "completion_rate": _completion_rate(total_owned, total_items),
+        "categories": categories,
+        "recent_catalogs": recent_catalogs
+    }
+
+
+def _has_item_sources(db: Session, copied_catalog_id: str) -> bool:
+    """복사본에 출처 기록이 하나라도 있는지"""
+    return db.query(SavedItemSourceDB.copied_item_id).filter(
+        SavedItemSourceDB.copied_catalog_id == copied_catalog_id
+    ).first() is not None
+
+
+def _match_items_by_name(db: Session, original_catalog_id: str, copied_catalog_id: str) -> tuple:
+    """
+    출처 기록 도입 전에 저장한 복사본의 출처 추정 (쓰기 없음)
+    - 같은 이름의 아이템끼리 생성 순서대로 짝지음, 짝이 없는 복사본 아이템은 사용자가 추가한 아이템으로 취급
+    - ((복사본 아이템, 원본 아이템) 쌍 목록, 짝이 없는 원본 아이템 목록) 반환
+    """
+    originals_by_name = defaultdict(deque)
+    for original in db.query(ItemDB.item_id, ItemDB.name, ItemDB.updated_at).filter(
+        ItemDB.catalog_id == original_catalog_id
+    ).order_by(ItemDB.created_at).all():
+        originals_by_name[original.name].append(original)
+    
+    pairs = []
+    for copied in db.query(ItemDB.item_id, ItemDB.name, ItemDB.created_at, ItemDB.updated_at).filter(
+        ItemDB.catalog_id == copied_catalog_id
+    ).order_by(ItemDB.created_at).all():
+        if originals_by_name[copied.name]:
+            pairs.append((copied, originals_by_name[copied.name].popleft()))
+    
+    unmatched = [original for originals in originals_by_name.values() for original in originals]
+    return pairs, unmatched
+
+
+def _bootstrap_item_sources(db: Session, original_catalog_id: str, copied_catalog_id: str) -> None:
+    """
+    출처 기록 도입 전에 저장한 복사본의 추정 출처 기록 (출처 기록이 하나도 없을 때만)
+    - 복사 시점(복사본 생성 시간)을 마지막 반영 시간으로 기록하여 이후의 원본 수정/사용자 수정을 구분
+    """
+    if _has_item_sources(db, copied_catalog_id):
+        return
+    
+    pairs, _ = _match_items_by_name(db, original_catalog_id, copied_catalog_id)
+    source_rows = [
+        {
+            "copied_item_id": copied.item_id,
+            "copied_catalog_id": copied_catalog_id,
+            "source_item_id": original.item_id,
+            "source_updated_at": copied.created_at,
+            "synced_at": copied.created_at
+        }
+        for copied, original in pairs
+    ]
+    
+    if source_rows:
+        db.execute(insert(SavedItemSourceDB), source_rows)
+
+
+def _count_bootstrapped_changes(db: Session, original_catalog_id: str, copied_catalog_id: str) -> dict:
+    """
+    출처 기록이 없는 복사본을 동기화하면 반영될 변경 수 (추정 출처 기록을 메모리에서만 계산)
+    - _bootstrap_item_sources 후 diff_saved_catalog를 실행한 결과와 같음 (추정 출처는 모두 있는 원본이므로 삭제 없음)
+    """
+    pairs, unmatched = _match_items_by_name(db, original_catalog_id, copied_catalog_id)
+    
+    counts = {"inserted": len(unmatched), "updated": 0, "deleted": 0, "local_edits": 0}
+    for copied, original in pairs:
+        if original.updated_at > copied.created_at:
+            counts["local_edits" if copied.updated_at > copied.created_at else "updated"] += 1
+    
+    return counts
+
+
+def diff_saved_catalog(db: Session, original_catalog_id: str, copied_catalog_id: str) -> dict:
+    """
+    원본과 복사본의 차이 계산 (출처 기록 기준, 쿼리 3개)
+    - inserted: 출처 기록에 없는 원본 아이템 (원본에 새로 추가됨)
+    - updated: 마지막 반영 이후 수정된 원본 아이템 중 복사본을 사용자가 수정하지 않은 것 (복사본 아이템, 원본 아이템)
+    - local_edits: 원본이 수정되었지만 사용자도 복사본을 수정하여 반영하지 않는 복사본 아이템 ID
+    - deleted: 원본에서 삭제된 아이템의 출처 기록
+    """
+    source_item_ids = select(SavedItemSourceDB.source_item_id).where(
+        SavedItemSourceDB.copied_catalog_id == copied_catalog_id
+    )
+    inserted = db.query(ItemDB).filter(
+        and_(
+            ItemDB.catalog_id == original_catalog_id,
+            ItemDB.item_id.not_in(source_item_ids)
+        )
+    ).order_by(ItemDB.created_at).all()
+    
+    original_item = aliased(ItemDB)
+    copied_item = aliased(ItemDB)
+    changed = db.query(SavedItemSourceDB, original_item, copied_item.updated_at).join(
+        original_item, original_item.item_id == SavedItemSourceDB.source_item_id
+    ).join(
+        copied_item, copied_item.item_id == SavedItemSourceDB.copied_item_id
+    ).filter(
+        and_(
+            SavedItemSourceDB.copied_catalog_id == copied_catalog_id,
+            original_item.catalog_id == original_catalog_id,
+            original_item.updated_at > SavedItemSourceDB.source_updated_at
+        )
+    ).all()
+    
+    updated = []
+    local_edits = []
+    for source, original, copied_updated_at in changed:
+        if copied_updated_at > source.synced_at:
+            local_edits.append(source.copied_item_id)
+        else:
+            updated.append((source, original))
+    
+    deleted = db.query(SavedItemSourceDB).outerjoin(
+        original_item,
+        and_(
+            original_item.item_id == SavedItemSourceDB.source_item_id,
+            original_item.catalog_id == original_catalog_id
+        )
+    ).filter(
+        and_(
+            SavedItemSourceDB.copied_catalog_id == copied_catalog_id,
+            original_item.item_id.is_(None)
+        )
+    ).all()
+    
+    return {
+        "inserted": inserted,
+        "updated": updated,
+        "local_edits": local_edits,
+        "deleted": deleted
+    }
+
+
+# 참조 모드 카탈로그는 원본 아이템을 공유하므로 동기화할 변경이 없음
+_NO_CHANGES = {"inserted": 0, "updated": 0, "deleted": 0, "local_edits": 0}
+
+
+def preview_saved_catalog_sync(db: Session, original_catalog_id: str, copied_catalog_id: str) -> dict:
+    """동기화하면 반영될 변경 수 (쓰기 없음, 출처 기록이 없는 복사본은 동기화와 같은 추정 출처 기준)"""
+    if catalog_reference.get_reference(db, copied_catalog_id):
+        return _NO_CHANGES.copy()
+    if not _has_item_sources(db, copied_catalog_id):
+        return _count_bootstrapped_changes(db, original_catalog_id, copied_catalog_id)
+    
+    diff = diff_saved_catalog(db, original_catalog_id, copied_catalog_id)
+    return {
+        "inserted": len(diff["inserted"]),
+        "updated": len(diff["updated"]),
+        "deleted": len(diff["deleted"]),
+        "local_edits": len(diff["local_edits"])
+    }
+
+
+def sync_saved_catalog(db: Session, user_id: str, original_catalog_id: str, copied_catalog_id: str) -> dict:
+    """
+    저장한 카탈로그에 원본의 변경분만 반영
+    - 추가된 원본 아이템은 복사(미보유 상태), 수정된 아이템은 내용 갱신, 삭제된 아이템은 복사본에서도 삭제
+    - 유지되는 아이템의 보유 상태와 사용자가 직접 추가/수정/삭제한 아이템은 그대로 둠
+    - 종류별로 INSERT/UPDATE/DELETE를 한 번씩(executemany/IN) 실행
+    """
+    if catalog_reference.get_reference(db, copied_catalog_id):
+        return _NO_CHANGES.copy()
+    
+    now = get_kst_now()
+    _bootstrap_item_sources(db, original_catalog_id, copied_catalog_id)
+    diff = diff_saved_catalog(db, original_catalog_id, copied_catalog_id)
+    
+    inserted_rows = _copy_items(db, user_id, copied_catalog_id, diff["inserted"], now)
+    
+    updated_rows = [
+        {
+            "item_id": source.copied_item_id,
+            "name": original.name,
+            "description": original.description,
+            "image_url": original.image_url,
+            "user_fields": original.user_fields,
+            "updated_at": now
+        }
+        for source, original in diff["updated"]
+    ]
+    if updated_rows:
+        db.execute(update(ItemDB), updated_rows)
+        db.execute(update(SavedItemSourceDB), [
+            {"copied_item_id": source.copied_item_id, "source_updated_at": original.updated_at, "synced_at": now}
+            for source, original in diff["updated"]
+        ])
+    
+    deleted_ids = [source.copied_item_id for source in diff["deleted"]]
+    deleted_items = []
+    for chunk in _chunks(deleted_ids):
+        deleted_items.extend(db.query(ItemDB).filter(ItemDB.item_id.in_(chunk)).all())
+        db.query(UserItemStatusDB).filter(UserItemStatusDB.item_id.in_(chunk)).delete(synchronize_session=False)
+        db.query(ItemDB).filter(ItemDB.item_id.in_(chunk)).delete(synchronize_session=False)
+        db.query(SavedItemSourceDB).filter(SavedItemSourceDB.copied_item_id.in_(chunk)).delete(synchronize_session=False)
+    
+    # 동기화 변경 기록과 실시간 알림 (사용자가 이미 지운 아이템은 삭제 기록에서 제외)
+    changes = [(change_log.ENTITY_ITEM, row["item_id"], copied_catalog_id, False) for row in inserted_rows + updated_rows]
+    changes.extend((change_log.ENTITY_ITEM, item.item_id, copied_catalog_id, True) for item in deleted_items)
+    if changes:
+        changes.append((change_log.ENTITY_CATALOG, copied_catalog_id, copied_catalog_id, False))
+        change_log.record_changes(db, user_id, changes)
+    
+    inserted_items = [ItemDB(**row) for row in inserted_rows]
+    updated_items = [
+        ItemDB(
+            item_id=source.copied_item_id,
+            catalog_id=copied_catalog_id,
+            name=original.name,
+            description=original.description,
+            image_url=original.image_url,
+            user_fields=original.user_fields,
+            updated_at=now
+        )
+        for source, original in diff["updated"]
+    ]
+    for event_type, items in (
+        (events.ITEM_CREATED, inserted_items),
+        (events.ITEM_UPDATED, updated_items),
+        (events.ITEM_DELETED, deleted_items)
+    ):
+        for item in items:
+            events.publish_after_commit(db, user_id, events.item_event(event_type, item))
+        # 이 복사본을 참조 모드로 저장한 사용자에게도 전달
+        catalog_reference.record_shared_item_changes(db, copied_catalog_id, items, event_type)
+    
+    db.commit()
+    
+    return {
+        "inserted": len(inserted_rows),
+        "updated": len(updated_rows),
+        "deleted": len(deleted_items),
+        "local_edits": len(diff["local_edits"])
+    }
@@ -1,7 +1,7 @@
 """
 SQLAlchemy 데이터베이스 모델
 """
-from app.models.database import Base, CatalogDB, ItemDB, UserCatalogDB, UserItemStatusDB, engine, SessionLocal, get_db, init_db
+from app.models.database import Base, CatalogDB, ItemDB, UserCatalogDB, UserItemStatusDB, SavedItemSourceDB, CatalogReferenceDB, ImageBlobDB, ImageBlobRefDB, UploadedObjectDB, UploadSessionDB, ChangeLogDB, SyncStateDB, SchemaVersionDB, SCHEMA_VERSION, engine, read_engine, SessionLocal, ReadSessionLocal, get_db, get_read_db, get_write_db, init_db, prepare_database, warm_up_database
 
 __all__ = [
     "Base",
@@ -9,8 +9,24 @@ __all__ = [
     "ItemDB",
     "UserCatalogDB",
     "UserItemStatusDB",
+    "SavedItemSourceDB",
+    "CatalogReferenceDB",
+    "ImageBlobDB",
+    "ImageBlobRefDB",
+    "UploadedObjectDB",
+    "UploadSessionDB",
+    "ChangeLogDB",
+    "SyncStateDB",
+    "SchemaVersionDB",
+    "SCHEMA_VERSION",
     "engine",
+    "read_engine",
     "SessionLocal",
+    "ReadSessionLocal",
     "get_db",
-    "init_db"
+    "get_read_db",
+    "get_write_db",
+    "init_db",
+    "prepare_database",
+    "warm_up_database"
 ]
@@ -1,29 +1,168 @@
 """
 Catalog-API 데이터베이스 설정 및 모델 정의
-- SQLite 데이터베이스 연결 및 세션 관리
+- SQLite(기본) / PostgreSQL 데이터베이스 연결 및 세션 관리 (읽기 전용 엔진과 읽기/쓰기 엔진 분리)
 - 카탈로그, 아이템, 사용자 관련 테이블 정의
 - 데이터베이스 초기화 및 의존성 주입 함수 제공
 - 한국 시간(KST) 기준으로 타임스탬프 저장
 """
 import os
-from sqlalchemy import create_engine, Column, String, Boolean, Text, DateTime, Integer, JSON
+from fastapi import Request
+from sqlalchemy import create_engine, event, select, Column, String, Boolean, Text, DateTime, Integer, JSON, Index, UniqueConstraint
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, Session
 from datetime import datetime
+from typing import Optional
 from app.core.config import settings, get_kst_now
 
-# SQLAlchemy 데이터베이스 엔진 설정
-# SQLite 사용, 멀티스레드 환경에서 안전하게 동작하도록 설정
-engine = create_engine(settings.DATABASE_URL, connect_args={"check_same_thread": False})
+# PostgreSQL 세션 타임존 - DateTime 컬럼은 타임존 없이 KST 시각을 저장하므로,
+# KST aware 값이 세션 타임존(기본 UTC)으로 바뀌어 9시간 이르게 저장되지 않도록 연결마다 KST로 지정
+POSTGRES_SESSION_OPTIONS = "-c timezone=Asia/Seoul"
+
+def _merge_connect_args(base: dict, extra: dict) -> dict:
+    """connect_args 병합 (libpq options 문자열은 덮어쓰지 않고 이어 붙임)"""
+    merged = {**base, **extra}
+    if "options" in base and "options" in extra:
+        merged["options"] = f"{base['options']} {extra['options']}"
+    return merged
+
+def create_db_engine(url: str, **overrides) -> Engine:
+    """
+    DB 종류별 엔진 생성
+    - SQLite: 멀티스레드 환경에서 안전하게 동작하도록 check_same_thread 해제 (연결 풀 설정은 SQLAlchemy 기본값)
+    - PostgreSQL 등 서버 DB: 연결 풀 크기/초과 허용 수/재생성 주기/사용 전 확인(pre-ping) 설정
+    - PostgreSQL: 세션 타임존을 KST로 지정 (POSTGRES_SESSION_OPTIONS)
+    - overrides: 호출하는 쪽에서 덮어쓸 create_engine 인자 (읽기 전용 풀 크기 등)
+    """
+    backend = make_url(url).get_backend_name()
+    if backend == "sqlite":
+        options = {"connect_args": {"check_same_thread": False}}
+    else:
+        options = {
+            "pool_size": settings.DB_POOL_SIZE,
+            "max_overflow": settings.DB_MAX_OVERFLOW,
+            "pool_recycle": settings.DB_POOL_RECYCLE_SECONDS,
+            "pool_pre_ping": settings.DB_POOL_PRE_PING,
+            "pool_timeout": settings.DB_POOL_TIMEOUT_SECONDS
+        }
+        if backend == "postgresql":
+            options["connect_args"] = {"options": POSTGRES_SESSION_OPTIONS}
+    
+    for key, value in overrides.items():
+        if key == "connect_args":
+            options["connect_args"] = _merge_connect_args(options.get("connect_args", {}), value)
+        else:
+            options[key] = value
+    
+    return create_engine(url, **options)
+
+# SQLAlchemy 데이터베이스 엔진 설정 (DATABASE_URL로 SQLite/PostgreSQL 선택)
+engine = create_db_engine(settings.DATABASE_URL)
+
+@event.listens_for(engine, "connect")
+def configure_sqlite_connection(dbapi_connection, connection_record):
+    """
+    SQLite 연결마다 PRAGMA 설정 (여러 워커 프로세스가 같은 DB 파일을 쓰는 환경 대비)
+    - journal_mode=WAL: 쓰기 중에도 다른 프로세스의 읽기가 막히지 않음
+    - busy_timeout: 다른 프로세스가 쓰는 중이면 바로 실패하지 않고 잠시 대기
+    - synchronous: WAL에서는 NORMAL로도 커밋 내구성이 충분하고 fsync 횟수가 줄어듦
+    """
+    if engine.dialect.name != "sqlite":
+        return
+    cursor = dbapi_connection.cursor()
+    try:
+        if settings.SQLITE_JOURNAL_MODE:
+            cursor.execute(f"PRAGMA journal_mode={settings.SQLITE_JOURNAL_MODE}")
+        cursor.execute(f"PRAGMA busy_timeout={settings.SQLITE_BUSY_TIMEOUT_MS}")
+        if settings.SQLITE_SYNCHRONOUS:
+            cursor.execute(f"PRAGMA synchronous={settings.SQLITE_SYNCHRONOUS}")
+    finally:
+        cursor.close()
+
+def _read_only_database_url() -> str:
+    """
+    읽기 전용 엔진 URL
+    - DATABASE_READ_URL이 있으면 그대로 사용 (복제본 등)
+    - SQLite 파일 DB면 같은 파일을 mode=ro URI로 열어 쓰기 자체가 불가능하도록 함
+    - 그 외(메모리 SQLite 등)는 기본 URL
+    """
+    if settings.DATABASE_READ_URL:
+        return settings.DATABASE_READ_URL
+    
+    url = make_url(settings.DATABASE_URL)
+    if url.get_backend_name() == "sqlite" and url.database and url.database != ":memory:":
+        return f"sqlite:///file:{url.database}?mode=ro&uri=true"
+    return settings.DATABASE_URL
+
+def create_read_engine() -> Engine:
+    """읽기 전용 엔진 생성 - 쓰기 엔진과 별도 연결 풀 사용 (크기는 READ_POOL_SIZE/READ_MAX_OVERFLOW)"""
+    read_url = _read_only_database_url()
+    if read_url == settings.DATABASE_URL and make_url(read_url).get_backend_name() == "sqlite":
+        # 메모리 DB는 연결마다 다른 DB이므로 쓰기 엔진을 함께 사용
+        return engine
+    
+    overrides = {}
+    if make_url(read_url).get_backend_name() == "postgresql":
+        # 세션 기본값을 읽기 전용 트랜잭션으로 설정 (쓰기 쿼리는 서버에서 거부)
+        overrides["connect_args"] = {"options": "-c default_transaction_read_only=on"}
+    
+    read_engine = create_db_engine(
+        read_url,
+        pool_size=settings.READ_POOL_SIZE,
+        max_overflow=settings.READ_MAX_OVERFLOW,
+        **overrides
+    )
+    
+    @event.listens_for(read_engine, "connect")
+    def _configure_read_connection(dbapi_connection, connection_record):
+        """읽기 연결 설정 - query_only로 실수로 쓰기 쿼리가 실행되는 것을 막고, 쓰기 중이면 잠시 대기"""
+        if read_engine.dialect.name != "sqlite":
+            return
+        cursor = dbapi_connection.cursor()
+        try:
+            cursor.execute("PRAGMA query_only=1")
+            cursor.execute(f"PRAGMA busy_timeout={settings.SQLITE_BUSY_TIMEOUT_MS}")
+        finally:
+            cursor.close()
+    
+    return read_engine
+
+# 읽기 전용 엔진 - 목록/상세 조회 등 GET 요청 (WAL 모드에서는 쓰기 중에도 대기 없이 조회)
+read_engine = create_read_engine()
 
 # 데이터베이스 세션 팩토리 생성
 # autocommit=False: 명시적 커밋 필요 (트랜잭션 안전성)
 # autoflush=False: 자동 플러시 비활성화 (성능 최적화)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# 읽기 전용 세션 팩토리 - 조회 요청 전용 (커밋할 내용 없음)
+ReadSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=read_engine)
+
+# 읽기 전용 연결을 사용하는 HTTP 메서드
+READ_ONLY_METHODS = ("GET", "HEAD")
+
 # SQLAlchemy ORM 베이스 클래스
 Base = declarative_base()
 
+# PostgreSQL 사용 여부 - PostgreSQL 방언 모듈은 import 비용이 커서 PostgreSQL을 사용할 때만 불러옴
+IS_POSTGRESQL = engine.dialect.name == "postgresql"
+
+def _json_column_type():
+    """JSON 컬럼 타입 - PostgreSQL에서는 JSONB (GIN 인덱스, 포함 검색 지원), 그 외에는 JSON"""
+    if not IS_POSTGRESQL:
+        return JSON()
+    from sqlalchemy.dialects.postgresql import JSONB
+    return JSON().with_variant(JSONB(), "postgresql")
+
+def _gin_index(name: str, column: str) -> tuple:
+    """PostgreSQL 전용 GIN 인덱스 (__table_args__용, 다른 DB에서는 빈 튜플)"""
+    if not IS_POSTGRESQL:
+        return ()
+    return (Index(name, column, postgresql_using="gin"),)
+
+JSONType = _json_column_type()
+
 # 데이터베이스 테이블 모델 정의
 
 class CatalogDB(Base):
@@ -35,11 +174,14 @@ class CatalogDB(Base):
     title = Column(String, nullable=False)                    # 카탈로그 제목
     description = Column(Text, nullable=False)                # 카탈로그 설명
     category = Column(String, default="미분류")                # 카테고리 분류
-    tags = Column(JSON, default=list)                         # 태그 배열 (JSON 형태)
+    tags = Column(JSONType, default=list)                     # 태그 배열 (JSON 형태)
     visibility = Column(String, default="public")             # 공개 설정 (public/private)
     thumbnail_url = Column(String, nullable=True)             # 썸네일 이미지 URL
     created_at = Column(DateTime, default=get_kst_now)        # 생성 시간 (KST)
     updated_at = Column(DateTime, default=get_kst_now, onupdate=get_kst_now)  # 수정 시간 (KST)
+    
+    # PostgreSQL 전용: 태그 포함 검색(tags @> '["태그"]')용 GIN 인덱스
+    __table_args__ = _gin_index("ix_catalogs_tags_gin", "tags")
 
 class ItemDB(Base):
     """아이템 테이블 - 카탈로그에 속한 개별 수집품 정보"""
@@ -50,9 +192,12 @@ class ItemDB(Base):
     name = Column(String, nullable=False)                     # 아이템명
     description = Column(Text, nullable=False)                # 아이템 설명
     image_url = Column(String, nullable=True)                 # 아이템 이미지 URL
-    user_fields = Column(JSON, default=dict)                  # 사용자 정의 필드 (JSON 형태)
+    user_fields = Column(JSONType, default=dict)              # 사용자 정의 필드 (JSON 형태)
     created_at = Column(DateTime, default=get_kst_now)        # 생성 시간 (KST)
     updated_at = Column(DateTime, default=get_kst_now, onupdate=get_kst_now)  # 수정 시간 (KST)
+    
+    # PostgreSQL 전용: 사용자 정의 필드 검색(user_fields @> '{"키": "값"}')용 GIN 인덱스
+    __table_args__ = _gin_index("ix_items_user_fields_gin", "user_fields")
 
 class UserCatalogDB(Base):
     """사용자 카탈로그 저장 테이블 - 다른 사용자의 카탈로그를 내 컬렉션에 저장"""
@@ -85,31 +230,219 @@ class UserItemStatusDB(Base):
         {'sqlite_autoincrement': True}
     )
 
-async def init_db():
+class SavedItemSourceDB(Base):
     """
-    데이터베이스 초기화 함수
-    - 서버 시작 시 호출되어 모든 테이블 생성
-    - 파일 업로드 디렉토리도 함께 생성
+    저장한 카탈로그의 아이템 출처 테이블 - 복사본 아이템이 원본의 어떤 아이템에서 복사되었는지 기록
+    - 원본 변경분만 복사본에 반영하는 동기화(sync-saved)에서 추가/수정/삭제 비교에 사용
+    - 사용자가 복사본 아이템을 지워도 행은 남겨 두어 다음 동기화에서 다시 추가하지 않음
+    - 참조 모드 카탈로그에서는 더 이상 공유하지 않는 원본 아이템 표시 (수정하여 복사한 아이템, 또는 삭제하여 아이템 행이 없는 기록)
+    """
+    __tablename__ = "saved_item_sources"
+    
+    copied_item_id = Column(String, primary_key=True)                 # 복사본 아이템 ID
+    copied_catalog_id = Column(String, index=True, nullable=False)    # 복사본 카탈로그 ID
+    source_item_id = Column(String, index=True, nullable=False)       # 원본 아이템 ID
+    source_updated_at = Column(DateTime, nullable=False)              # 마지막으로 반영한 원본 아이템의 수정 시간
+    synced_at = Column(DateTime, nullable=False)                      # 마지막 반영 시간 (이후 복사본이 수정되었으면 사용자 수정)
+
+class CatalogReferenceDB(Base):
+    """
+    참조 모드 저장 테이블 - 아이템을 복사하지 않고 원본 카탈로그의 아이템을 공유하는 저장 카탈로그
+    - 공유 아이템의 보유 상태는 원본 아이템 ID 기준으로 user_item_status에 저장
+    - 사용자가 공유 아이템을 수정하면 그 아이템만 복사본 카탈로그로 복사하고 saved_item_sources에 기록
+    """
+    __tablename__ = "catalog_references"
+    
+    copied_catalog_id = Column(String, primary_key=True)              # 저장 카탈로그(복사본) ID
+    original_catalog_id = Column(String, index=True, nullable=False)  # 아이템을 공유하는 원본 카탈로그 ID
+    user_id = Column(String, index=True, nullable=False)              # 저장한 사용자 ID
+    created_at = Column(DateTime, default=get_kst_now)                # 저장 시간 (KST)
+
+class ImageBlobDB(Base):
+    """이미지 원본 테이블 - 내용 주소 저장(SHA-256) 방식으로 저장된 파일과 참조 수"""
+    __tablename__ = "image_blobs"
+    
+    sha256 = Column(String(64), primary_key=True)                     # 파일 내용의 SHA-256 (hex)
+    file_path = Column(String, nullable=False)                        # UPLOAD_DIR 기준 상대 경로
+    size = Column(Integer, nullable=False)                            # 파일 크기 (바이트)
+    ref_count = Column(Integer, default=0, nullable=False)            # 참조(업로드) 수
+    created_at = Column(DateTime, default=get_kst_now)                # 최초 저장 시간 (KST)
+
+class ImageBlobRefDB(Base):
+    """이미지 참조 테이블 - 어떤 사용자가 같은 내용의 이미지를 업로드했는지 기록 (삭제 권한 확인용)"""
+    __tablename__ = "image_blob_refs"
+    
+    id = Column(Integer, primary_key=True, autoincrement=True)        # 자동 증가 ID
+    sha256 = Column(String(64), index=True, nullable=False)           # 참조하는 이미지 SHA-256
+    user_id = Column(String, index=True, nullable=False)              # 업로드한 사용자 ID
+    created_at = Column(DateTime, default=get_kst_now)                # 업로드 시간 (KST)
+    
+    __table_args__ = (
+        {'sqlite_autoincrement': True}
+    )
+
+class UploadedObjectDB(Base):
+    """직접 업로드 기록 테이블 - 사전 서명 URL로 저장소에 바로 올린 뒤 확인(confirm)된 파일"""
+    __tablename__ = "uploaded_objects"
+    
+    key = Column(String, primary_key=True)                            # 저장소 키 (UPLOAD_DIR/버킷 기준 상대 경로)
+    user_id = Column(String, index=True, nullable=False)              # 업로드한 사용자 ID
+    size = Column(Integer, nullable=False)                            # 파일 크기 (바이트)
+    created_at = Column(DateTime, default=get_kst_now)                # 확인 시간 (KST)
+
+class UploadSessionDB(Base):
+    """이어받기 업로드 세션 테이블 - 받은 데이터는 디스크의 부분 파일에 저장, 현재 오프셋은 부분 파일 크기"""
+    __tablename__ = "upload_sessions"
+    
+    id = Column(String, primary_key=True)                             # 세션 ID (UUID)
+    user_id = Column(String, index=True, nullable=False)              # 업로드하는 사용자 ID
+    filename = Column(String, nullable=False)                         # 원본 파일명 (확장자 확인용)
+    content_type = Column(String, nullable=True)                      # 파일 Content-Type
+    upload_length = Column(Integer, nullable=False)                   # 전체 파일 크기 (바이트)
+    created_at = Column(DateTime, default=get_kst_now)                # 세션 생성 시간 (KST)
+    expires_at = Column(DateTime, index=True, nullable=False)         # 세션 만료 시간 (KST, 청크 수신 시 연장)
+
+class ChangeLogDB(Base):
+    """
+    동기화 변경 기록 테이블 - 사용자별 카탈로그/아이템 변경 (GET /api/sync)
+    - 엔티티마다 마지막 변경 한 행만 유지 (같은 엔티티가 다시 바뀌면 version만 새로 부여)
+    - deleted=True인 행은 삭제 기록(tombstone)
     """
+    __tablename__ = "change_log"
+    
+    id = Column(Integer, primary_key=True, autoincrement=True)        # 자동 증가 ID
+    user_id = Column(String, nullable=False)                          # 변경을 받을 사용자 ID (카탈로그 소유자)
+    version = Column(Integer, nullable=False)                         # 사용자별 변경 버전 (단조 증가)
+    entity_type = Column(String(20), nullable=False)                  # 엔티티 종류 (catalog/item)
+    entity_id = Column(String, nullable=False)                        # 카탈로그 ID 또는 아이템 ID
+    catalog_id = Column(String, nullable=True)                        # 소속 카탈로그 ID
+    deleted = Column(Boolean, default=False, nullable=False)          # 삭제 여부 (tombstone)
+    changed_at = Column(DateTime, default=get_kst_now)                # 변경 시간 (KST)
+    
+    __table_args__ = (
+        UniqueConstraint("user_id", "entity_type", "entity_id", name="uq_change_log_entity"),
+        Index("ix_change_log_user_version", "user_id", "version"),
+        {'sqlite_autoincrement': True}
+    )
+
+class SyncStateDB(Base):
+    """사용자별 동기화 상태 테이블 - 마지막으로 부여한 변경 버전 (변경 기록 시 이 행을 잠가 버전 순서 보장)"""
+    __tablename__ = "sync_state"
+    
+    user_id = Column(String, primary_key=True)                        # 사용자 ID
+    version = Column(Integer, default=0, nullable=False)              # 마지막으로 부여한 버전
+    backfilled = Column(Boolean, default=False, nullable=False)       # 기존 데이터 변경 기록 생성 여부
+
+class SchemaVersionDB(Base):
+    """스키마 버전 테이블 - 마지막으로 create_all을 실행한 모델 버전 (행 1개)"""
+    __tablename__ = "schema_version"
+    
+    id = Column(Integer, primary_key=True)                            # 항상 1
+    version = Column(Integer, nullable=False)                         # 적용된 SCHEMA_VERSION
+    applied_at = Column(DateTime, default=get_kst_now)                # 적용 시간 (KST)
+
+# 현재 모델의 스키마 버전 - 테이블/컬럼/인덱스를 추가하면 1 증가시켜야 다음 시작 시 create_all 실행
+SCHEMA_VERSION = 4
+
+def get_schema_version() -> Optional[int]:
+    """DB에 기록된 스키마 버전 (테이블이 없거나 조회 실패 시 None)"""
     try:
+        with engine.connect() as connection:
+            return connection.execute(
+                select(SchemaVersionDB.version).where(SchemaVersionDB.id == 1)
+            ).scalar()
+    except SQLAlchemyError:
+        return None
+
+def prepare_database():
+    """
+    스키마 생성 및 업로드 디렉토리 준비 (동기 함수)
+    - 기록된 스키마 버전이 SCHEMA_VERSION과 같으면 버전 행 조회 한 번으로 끝냄
+      (create_all은 테이블마다 존재 여부를 조회하므로 워커 시작이 느려짐)
+    - 버전이 다르거나 없으면 create_all로 없는 테이블을 만들고 버전 기록
+    - 멀티 프로세스 실행(serve.py)에서는 워커를 띄우기 전에 부모 프로세스에서 한 번만 호출
+    """
+    if get_schema_version() != SCHEMA_VERSION:
         # SQLAlchemy 메타데이터를 기반으로 모든 테이블 생성
         Base.metadata.create_all(bind=engine)
         
-        # 이미지 업로드용 디렉토리 생성 (존재하지 않는 경우)
-        os.makedirs(settings.UPLOAD_DIR, exist_ok=True)
+        with SessionLocal() as db:
+            row = db.get(SchemaVersionDB, 1)
+            if row is None:
+                db.add(SchemaVersionDB(id=1, version=SCHEMA_VERSION))
+            else:
+                row.version = SCHEMA_VERSION
+                row.applied_at = get_kst_now()
+            db.commit()
+    
+    # 이미지 업로드용 디렉토리 생성 (존재하지 않는 경우)
+    os.makedirs(settings.UPLOAD_DIR, exist_ok=True)
+
+async def init_db():
+    """
+    데이터베이스 초기화 함수
+    - 서버 시작 시 호출되어 스키마 버전 확인 후 필요한 경우에만 테이블 생성
+    - 파일 업로드 디렉토리도 함께 생성
+    - 부모 프로세스에서 이미 초기화한 경우(SKIP_DB_INIT) 워커는 건너뜀 (스키마 생성 경쟁 방지)
+    """
+    if settings.SKIP_DB_INIT:
+        return
+    
+    try:
+        prepare_database()
         
-        print("✅ SQLite 데이터베이스 초기화 완료")
+        print("✅ 데이터베이스 초기화 완료")
     except Exception as e:
         print(f"❌ 데이터베이스 초기화 오류: {e}")
 
-def get_db():
+def warm_up_database(connections: int) -> None:
+    """
+    연결 풀 미리 채우기 (동기 함수)
+    - 읽기/쓰기 엔진마다 연결을 connections개(풀 크기 이내)까지 열어 확인한 뒤 풀에 반환
+    - 워커의 첫 요청이 연결 생성 비용(SQLite PRAGMA 설정, PostgreSQL 접속/인증)을 치르지 않도록 서버 시작 시 호출
+    """
+    targets = [engine] if read_engine is engine else [engine, read_engine]
+    for target in targets:
+        pool_size = getattr(target.pool, "size", None)
+        count = min(connections, pool_size()) if callable(pool_size) else connections
+        
+        opened = []
+        try:
+            for _ in range(count):
+                connection = target.connect()
+                opened.append(connection)
+                connection.exec_driver_sql("SELECT 1")
+        finally:
+            for connection in opened:
+                connection.close()
+
+def get_db(request: Request):
     """
     데이터베이스 세션 의존성 주입 함수
     - FastAPI의 Depends()와 함께 사용
+    - GET/HEAD 요청은 읽기 전용 엔진, 그 외 요청은 읽기/쓰기 엔진의 세션 사용
+    - 메서드와 관계없이 고정하려면 get_read_db / get_write_db 사용
     - 요청 처리 후 자동으로 세션 종료하여 리소스 관리
     """
-    db = SessionLocal()  # 새 데이터베이스 세션 생성
+    session_factory = ReadSessionLocal if request.method in READ_ONLY_METHODS else SessionLocal
+    db = session_factory()  # 새 데이터베이스 세션 생성
     try:
         yield db  # 라우터 함수에 세션 전달
     finally:
         db.close()  # 요청 완료 후 세션 정리
+
+def get_read_db():
+    """읽기 전용 세션 의존성 (POST 검색 등 메서드와 관계없이 조회만 하는 라우트용)"""
+    db = ReadSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+def get_write_db():
+    """읽기/쓰기 세션 의존성 (GET이지만 쓰기가 필요한 라우트용)"""
+    db = SessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
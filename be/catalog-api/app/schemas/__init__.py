@@ -3,9 +3,10 @@ Pydantic 스키마 모델
 """
 from app.schemas.catalog import Catalog, CatalogBase, CatalogCreate, CatalogUpdate
 from app.schemas.item import Item, ItemBase, ItemCreate, ItemUpdate
-from app.schemas.user_catalog import UserCatalog, UserCatalogSave
+from app.schemas.user_catalog import UserCatalog, UserCatalogSave, CheckSavedRequest, CheckSavedResult, CheckSavedResponse, SavedCatalogSyncResult, CollectionSummary, CategorySummary, RecentCatalogProgress
 from app.schemas.user_item import UserItemStatus
-from app.schemas.common import UploadResponse, ErrorResponse
+from app.schemas.sync import SyncResponse, SyncTombstone
+from app.schemas.common import UploadResponse, PresignedUploadRequest, ConfirmUploadRequest, UploadSessionCreate, UploadSessionStatus, ErrorResponse
 
 __all__ = [
     "Catalog",
@@ -18,7 +19,20 @@ __all__ = [
     "ItemUpdate",
     "UserCatalog",
     "UserCatalogSave",
+    "CheckSavedRequest",
+    "CheckSavedResult",
+    "CheckSavedResponse",
+    "SavedCatalogSyncResult",
+    "CollectionSummary",
+    "CategorySummary",
+    "RecentCatalogProgress",
     "UserItemStatus",
+    "SyncResponse",
+    "SyncTombstone",
     "UploadResponse",
+    "PresignedUploadRequest",
+    "ConfirmUploadRequest",
+    "UploadSessionCreate",
+    "UploadSessionStatus",
     "ErrorResponse"
 ]
@@ -1,9 +1,30 @@
 from pydantic import BaseModel, Field
-from typing import Optional
+from datetime import datetime
+from typing import Dict, Optional
 
 class UploadResponse(BaseModel):
     upload_url: str = Field(..., description="S3 업로드 URL")
     file_url: str = Field(..., description="업로드 후 파일 접근 URL")
+    variants: Dict[str, str] = Field(default_factory=dict, description="크기(px)별 리사이즈 이미지 URL")
+
+class PresignedUploadRequest(BaseModel):
+    filename: str = Field(..., description="업로드할 파일명 (확장자 확인용)")
+    content_type: str = Field(..., description="파일 Content-Type (PUT 요청 시 같은 값 사용)")
+    size: int = Field(..., gt=0, description="파일 크기 (바이트)")
+
+class ConfirmUploadRequest(BaseModel):
+    file_url: str = Field(..., description="사전 서명 발급 시 받은 파일 URL")
+
+class UploadSessionCreate(BaseModel):
+    filename: str = Field(..., description="업로드할 파일명 (확장자 확인용)")
+    content_type: Optional[str] = Field(default=None, description="파일 Content-Type")
+    size: int = Field(..., gt=0, description="전체 파일 크기 (바이트)")
+
+class UploadSessionStatus(BaseModel):
+    session_id: str = Field(..., description="이어받기 업로드 세션 ID")
+    offset: int = Field(..., description="서버가 받은 바이트 수 (다음 청크 시작 위치)")
+    size: int = Field(..., description="전체 파일 크기 (바이트)")
+    expires_at: datetime = Field(..., description="세션 만료 시간")
 
 class ErrorResponse(BaseModel):
     error: str = Field(..., description="오류 메시지")
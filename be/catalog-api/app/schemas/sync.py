@@ -0,0 +1,20 @@
+from pydantic import BaseModel, Field
+from typing import List, Optional
+from app.schemas.catalog import Catalog
+from app.schemas.item import Item
+
+class SyncTombstone(BaseModel):
+    entity_type: str = Field(..., description="삭제된 엔티티 종류 (catalog/item)")
+    entity_id: str = Field(..., description="삭제된 카탈로그 ID 또는 아이템 ID")
+    catalog_id: Optional[str] = Field(default=None, description="소속 카탈로그 ID")
+    version: int = Field(..., description="삭제 버전")
+
+class SyncResponse(BaseModel):
+    since: int = Field(..., description="요청한 기준 버전")
+    version: int = Field(..., description="다음 요청의 since로 사용할 버전 (이 페이지의 마지막 변경 버전)")
+    current_version: int = Field(..., description="서버에 기록된 최신 버전")
+    has_more: bool = Field(default=False, description="다음 페이지 존재 여부")
+    reset: bool = Field(default=False, description="since가 서버 기록과 맞지 않음 - 로컬 캐시를 비우고 since=0부터 다시 동기화")
+    catalogs: List[Catalog] = Field(default_factory=list, description="추가/변경된 카탈로그")
+    items: List[Item] = Field(default_factory=list, description="추가/변경된 아이템 (보유 여부 포함)")
+    deleted: List[SyncTombstone] = Field(default_factory=list, description="삭제 기록 (카탈로그 삭제 시 소속 아이템도 삭제)")
@@ -1,14 +1,62 @@
 from pydantic import BaseModel, Field
+from typing import List, Literal, Optional
 from app.schemas.catalog import Catalog
 
 class UserCatalogSave(BaseModel):
     catalog_id: str = Field(..., description="저장할 카탈로그 ID")
+    mode: Optional[Literal["copy", "reference"]] = Field(default=None, description="저장 방식 (copy: 아이템 복사, reference: 원본 아이템 공유, 생략 시 SAVED_CATALOG_MODE)")
+
+class CheckSavedRequest(BaseModel):
+    catalog_ids: List[str] = Field(..., max_length=500, description="저장 여부를 확인할 원본 카탈로그 ID 목록 (최대 500개)")
+
+class CheckSavedResult(BaseModel):
+    original_catalog_id: str = Field(..., description="원본 카탈로그 ID")
+    is_saved: bool = Field(..., description="저장 여부")
+    copied_catalog_id: Optional[str] = Field(default=None, description="저장한 복사본 카탈로그 ID")
+
+class CheckSavedResponse(BaseModel):
+    user_id: str = Field(..., description="사용자 ID")
+    results: List[CheckSavedResult] = Field(default_factory=list, description="요청한 순서대로의 저장 여부")
+
+class SavedCatalogSyncResult(BaseModel):
+    copied_catalog_id: str = Field(..., description="저장한 복사본 카탈로그 ID")
+    original_catalog_id: str = Field(..., description="원본 카탈로그 ID")
+    applied: bool = Field(..., description="반영 여부 (false면 미리보기)")
+    inserted: int = Field(..., description="원본에 추가되어 복사한 아이템 수")
+    updated: int = Field(..., description="원본 수정을 반영한 아이템 수")
+    deleted: int = Field(..., description="원본에서 삭제되어 지운 아이템 수")
+    local_edits: int = Field(..., description="사용자가 수정하여 원본 수정을 반영하지 않은 아이템 수")
 
 class UserCatalog(BaseModel):
     user_id: str = Field(..., description="사용자 ID")
     catalog_id: str = Field(..., description="카탈로그 ID")
     saved_at: str = Field(..., description="저장일")
     catalog: Catalog = Field(..., description="카탈로그 정보")
-
+    
     class Config:
         from_attributes = True
+
+class CategorySummary(BaseModel):
+    category: str = Field(..., description="카테고리")
+    catalog_count: int = Field(..., description="카탈로그 개수")
+    item_count: int = Field(..., description="아이템 개수")
+    owned_count: int = Field(..., description="보유 아이템 개수")
+    completion_rate: float = Field(..., description="수집률")
+
+class RecentCatalogProgress(BaseModel):
+    catalog_id: str = Field(..., description="카탈로그 ID")
+    title: str = Field(..., description="카탈로그 제목")
+    category: str = Field(..., description="카테고리")
+    thumbnail_url: Optional[str] = Field(default=None, description="썸네일 이미지 URL")
+    item_count: int = Field(..., description="아이템 개수")
+    owned_count: int = Field(..., description="보유 아이템 개수")
+    completion_rate: float = Field(..., description="수집률")
+    last_owned_at: str = Field(..., description="마지막으로 아이템을 보유 처리한 시간")
+
+class CollectionSummary(BaseModel):
+    total_catalogs: int = Field(..., description="내 카탈로그 개수 (원본 + 복사본)")
+    total_items: int = Field(..., description="전체 아이템 개수")
+    total_owned: int = Field(..., description="전체 보유 아이템 개수")
+    completion_rate: float = Field(..., description="전체 수집률")
+    categories: List[CategorySummary] = Field(default_factory=list, description="카테고리별 통계")
+    recent_catalogs: List[RecentCatalogProgress] = Field(default_factory=list, description="최근 수집이 진행된 카탈로그")
@@ -0,0 +1,141 @@
+"""
+벤치마크 공통 유틸리티
+- 임시 디렉토리(SQLite 파일, 업로드 폴더)를 사용하는 catalog-api 서버 프로세스 실행
+- user-api와 동일한 형식의 테스트용 JWT 토큰 발급
+- 지연시간 백분위수 계산
+"""
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import jwt
+import requests
+
+# catalog-api 루트 디렉토리 (main.py 위치)
+APP_DIR = Path(__file__).resolve().parent.parent
+
+# 벤치마크 서버와 토큰 발급에 공통으로 사용하는 시크릿 키
+BENCH_JWT_SECRET = "benchmark-secret-key-1234567890123456789012345678901234567890"
+
+
+def find_free_port() -> int:
+    """사용 가능한 로컬 포트 반환"""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def make_token(user_id: str, secret: str = BENCH_JWT_SECRET) -> str:
+    """벤치마크용 JWT 토큰 생성 (sub 클레임에 사용자 ID)"""
+    now = int(time.time())
+    payload = {"sub": user_id, "iat": now, "exp": now + 60 * 60 * 24}
+    return jwt.encode(payload, secret, algorithm="HS256")
+
+
+def auth_headers(user_id: str) -> Dict[str, str]:
+    """Authorization 헤더 구성"""
+    return {"Authorization": f"Bearer {make_token(user_id)}"}
+
+
+class BenchmarkServer:
+    """
+    임시 작업 디렉토리를 사용하는 catalog-api 서버 프로세스
+    - DATABASE_URL, UPLOAD_DIR, LOG_FILE을 임시 디렉토리로 지정하여 로컬 데이터에 영향 없음
+    - with 문으로 사용하면 종료 시 프로세스와 임시 디렉토리를 정리
+    """
+
+    def __init__(self, env: Optional[Dict[str, str]] = None, workdir: Optional[str] = None):
+        self._tempdir = None if workdir else tempfile.TemporaryDirectory(prefix="catalog-bench-")
+        self.workdir = Path(workdir or self._tempdir.name)
+        self.port = find_free_port()
+        self.base_url = f"http://127.0.0.1:{self.port}"
+        self.database_url = f"sqlite:///{self.workdir / 'catalog.db'}"
+        self.upload_dir = self.workdir / "uploads"
+        self.extra_env = env or {}
+        self.process: Optional[subprocess.Popen] = None
+
+    def environment(self) -> Dict[str, str]:
+        """서버 프로세스 환경변수 구성"""
+        env = dict(os.environ)
+        env.update({
+            "DATABASE_URL": self.database_url,
+            "UPLOAD_DIR": str(self.upload_dir),
+            "LOG_FILE": str(self.workdir / "api_communication.log"),
+            "JWT_SECRET_KEY": BENCH_JWT_SECRET,
+            "PYTHONDONTWRITEBYTECODE": "1",
+        })
+        env.update(self.extra_env)
+        return env
+
+    def start(self, timeout: float = 30.0, poll_interval: float = 0.2) -> "BenchmarkServer":
+        """서버 실행 후 /health 응답까지 대기 (poll_interval 간격으로 확인)"""
+        self.upload_dir.mkdir(parents=True, exist_ok=True)
+        self.process = subprocess.Popen(
+            [
+                sys.executable, "-m", "uvicorn", "main:app",
+                "--host", "127.0.0.1", "--port", str(self.port),
+                "--log-level", "warning",
+            ],
+            cwd=APP_DIR,
+            env=self.environment(),
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if self.process.poll() is not None:
+                raise RuntimeError(f"서버 프로세스가 종료되었습니다 (exit code {self.process.returncode})")
+            try:
+                if requests.get(f"{self.base_url}/health", timeout=1).status_code == 200:
+                    return self
+            except requests.RequestException:
+                pass
+            time.sleep(poll_interval)
+
+        self.stop()
+        raise RuntimeError("서버가 제한 시간 내에 시작되지 않았습니다")
+
+    def stop(self) -> None:
+        """서버 종료 및 임시 디렉토리 정리"""
+        if self.process and self.process.poll() is None:
+            self.process.terminate()
+            try:
+                self.process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                self.process.kill()
+        if self._tempdir:
+            self._tempdir.cleanup()
+
+    def __enter__(self) -> "BenchmarkServer":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    """최근접 순위(nearest-rank) 방식 백분위수 계산"""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    rank = max(0, min(len(ordered) - 1, int(round(pct / 100 * len(ordered) + 0.5)) - 1))
+    return ordered[rank]
+
+
+def latency_summary(samples_ms: List[float]) -> Dict[str, float]:
+    """지연시간 샘플(ms) 요약 - 건수, 평균, p50/p95/p99, 최대값"""
+    count = len(samples_ms)
+    return {
+        "count": count,
+        "mean_ms": round(sum(samples_ms) / count, 3) if count else 0.0,
+        "p50_ms": round(percentile(samples_ms, 50), 3),
+        "p95_ms": round(percentile(samples_ms, 95), 3),
+        "p99_ms": round(percentile(samples_ms, 99), 3),
+        "max_ms": round(max(samples_ms), 3) if count else 0.0,
+    }
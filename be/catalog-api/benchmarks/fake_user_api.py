@@ -0,0 +1,262 @@
+"""
+user-api(Spring Boot) 대역 서버 - GET /api/users/{id} 응답만 흉내
+- Java 스택 없이 공개 피드(생성자 닉네임 조회)의 실제 지연을 재현하기 위한 벤치마크/테스트용 서버
+- 응답 지연 분포, 오류(5xx) 비율, 응답하지 않는(시간 초과) 비율, 빈 본문 비율, 존재하지 않는 사용자(404) 비율 설정
+- 벤치마크/테스트에서는 FakeUserApi를 with 문으로 띄우고 catalog-api의 USER_API_URL을 base_url로 지정
+
+사용 예:
+    python -m benchmarks.fake_user_api --port 8080 --latency lognormal:40,0.6 --error-rate 0.05 --timeout-rate 0.02
+    USER_API_URL=http://127.0.0.1:8080/api/users python main.py
+"""
+import argparse
+import json
+import random
+import re
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional, Tuple
+
+# 사용자 조회 경로 (/api/users/{id})
+USER_PATH = re.compile(r"^/api/users/([^/?]+)/?(?:\?.*)?$")
+
+# 지원하는 지연시간 분포와 인자 수
+LATENCY_DISTRIBUTIONS = {"fixed": 1, "uniform": 2, "normal": 2, "lognormal": 2}
+
+
+def parse_latency(value: str) -> Tuple[str, Tuple[float, ...]]:
+    """
+    지연시간 분포 설정 파싱 (단위 ms)
+    - fixed:50 / uniform:10,200 (최소, 최대) / normal:50,15 (평균, 표준편차) / lognormal:40,0.6 (중앙값, 로그 표준편차)
+    """
+    name, _, params = value.partition(":")
+    name = name.strip().lower()
+    if name not in LATENCY_DISTRIBUTIONS:
+        raise argparse.ArgumentTypeError(f"알 수 없는 지연시간 분포: {name} (사용 가능: {', '.join(LATENCY_DISTRIBUTIONS)})")
+    try:
+        numbers = tuple(float(number) for number in params.split(",") if number.strip())
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"지연시간 인자는 숫자여야 합니다: {value}")
+    if len(numbers) != LATENCY_DISTRIBUTIONS[name]:
+        raise argparse.ArgumentTypeError(f"{name} 분포는 인자 {LATENCY_DISTRIBUTIONS[name]}개가 필요합니다: {value}")
+    return name, numbers
+
+
+@dataclass
+class FaultProfile:
+    """응답 지연/장애 설정 - 비율은 0~1, 요청마다 독립적으로 결정 (시간 초과 → 오류 → 404 → 빈 본문 순서로 판정)"""
+    latency: Tuple[str, Tuple[float, ...]] = ("fixed", (0.0,))
+    error_rate: float = 0.0
+    error_status: int = 500
+    timeout_rate: float = 0.0
+    hang_seconds: float = 30.0
+    empty_rate: float = 0.0
+    not_found_rate: float = 0.0
+    seed: Optional[int] = None
+
+
+def add_fault_arguments(parser: argparse.ArgumentParser, prefix: str = "") -> None:
+    """FaultProfile 설정용 명령행 인자 추가 (다른 벤치마크에서 prefix를 붙여 재사용)"""
+    parser.add_argument(f"--{prefix}latency", type=parse_latency, default=("fixed", (0.0,)),
+                        help="응답 지연 분포 ms (fixed:50, uniform:10,200, normal:50,15, lognormal:40,0.6)")
+    parser.add_argument(f"--{prefix}error-rate", type=float, default=0.0, help="오류 응답 비율 (0~1)")
+    parser.add_argument(f"--{prefix}error-status", type=int, default=500, help="오류 응답 상태 코드")
+    parser.add_argument(f"--{prefix}timeout-rate", type=float, default=0.0, help="응답하지 않는 요청 비율 (0~1)")
+    parser.add_argument(f"--{prefix}hang-seconds", type=float, default=30.0, help="응답하지 않는 요청의 대기 시간 (초)")
+    parser.add_argument(f"--{prefix}empty-rate", type=float, default=0.0, help="빈 본문 200 응답 비율 (0~1)")
+    parser.add_argument(f"--{prefix}not-found-rate", type=float, default=0.0, help="404 응답 비율 (0~1)")
+
+
+def profile_from_args(args: argparse.Namespace, prefix: str = "", seed: Optional[int] = None) -> FaultProfile:
+    """add_fault_arguments로 추가한 인자에서 FaultProfile 생성"""
+    attr = prefix.replace("-", "_")
+    return FaultProfile(
+        latency=getattr(args, f"{attr}latency"),
+        error_rate=getattr(args, f"{attr}error_rate"),
+        error_status=getattr(args, f"{attr}error_status"),
+        timeout_rate=getattr(args, f"{attr}timeout_rate"),
+        hang_seconds=getattr(args, f"{attr}hang_seconds"),
+        empty_rate=getattr(args, f"{attr}empty_rate"),
+        not_found_rate=getattr(args, f"{attr}not_found_rate"),
+        seed=seed,
+    )
+
+
+def user_payload(user_id: str) -> Dict[str, object]:
+    """user-api UserDto.Response와 같은 형태의 사용자 정보"""
+    now = datetime.now().isoformat(timespec="seconds")
+    return {
+        "id": int(user_id) if user_id.isdigit() else user_id,
+        "email": f"{user_id}@example.com",
+        "nickname": f"user-{user_id}",
+        "introduction": "",
+        "profileImage": None,
+        "createdAt": now,
+        "updatedAt": now,
+    }
+
+
+class FaultInjector:
+    """요청마다 응답 종류와 지연시간 결정 (여러 요청 스레드에서 호출되므로 난수 생성기를 잠금으로 보호)"""
+
+    def __init__(self, profile: FaultProfile):
+        self.profile = profile
+        self._rng = random.Random(profile.seed)
+        self._lock = threading.Lock()
+
+    def delay_seconds(self) -> float:
+        name, params = self.profile.latency
+        with self._lock:
+            if name == "fixed":
+                delay_ms = params[0]
+            elif name == "uniform":
+                delay_ms = self._rng.uniform(*params)
+            elif name == "normal":
+                delay_ms = self._rng.gauss(*params)
+            else:
+                median, sigma = params
+                delay_ms = median * self._rng.lognormvariate(0.0, sigma)
+        return max(0.0, delay_ms) / 1000
+
+    def outcome(self) -> str:
+        """timeout / error / not_found / empty / ok 중 하나"""
+        profile = self.profile
+        with self._lock:
+            roll = self._rng.random
+            if roll() < profile.timeout_rate:
+                return "timeout"
+            if roll() < profile.error_rate:
+                return "error"
+            if roll() < profile.not_found_rate:
+                return "not_found"
+            if roll() < profile.empty_rate:
+                return "empty"
+        return "ok"
+
+
+class _UserApiHandler(BaseHTTPRequestHandler):
+    server: "_UserApiServer"
+
+    def do_GET(self) -> None:
+        match = USER_PATH.match(self.path)
+        if not match:
+            self._respond(404, {"message": "Not Found"})
+            return
+
+        injector = self.server.injector
+        outcome = injector.outcome()
+        self.server.record(outcome)
+
+        if outcome == "timeout":
+            time.sleep(injector.profile.hang_seconds)
+        else:
+            time.sleep(injector.delay_seconds())
+
+        if outcome == "error":
+            self._respond(injector.profile.error_status, {"message": "Injected failure"})
+        elif outcome == "not_found":
+            self._respond(404, {"message": "존재하지 않는 사용자입니다."})
+        elif outcome == "empty":
+            self._respond(200, None)
+        else:
+            self._respond(200, user_payload(match.group(1)))
+
+    def _respond(self, status: int, payload: Optional[dict]) -> None:
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8") if payload is not None else b""
+        try:
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        except (BrokenPipeError, ConnectionResetError):
+            # 클라이언트가 시간 초과로 먼저 연결을 끊은 경우
+            pass
+
+    def log_message(self, format: str, *args) -> None:
+        # 요청마다 stderr에 출력하지 않음
+        return
+
+
+class _UserApiServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address: Tuple[str, int], injector: FaultInjector):
+        super().__init__(address, _UserApiHandler)
+        self.injector = injector
+        self.stats: Counter = Counter()
+        self._stats_lock = threading.Lock()
+
+    def record(self, outcome: str) -> None:
+        with self._stats_lock:
+            self.stats["requests"] += 1
+            self.stats[outcome] += 1
+
+
+@dataclass
+class FakeUserApi:
+    """
+    스레드에서 실행하는 user-api 대역 서버
+    - port=0이면 사용 가능한 포트를 자동 선택
+    - base_url을 catalog-api의 USER_API_URL로 지정
+    """
+    profile: FaultProfile = field(default_factory=FaultProfile)
+    host: str = "127.0.0.1"
+    port: int = 0
+    _server: Optional[_UserApiServer] = field(default=None, init=False, repr=False)
+    _thread: Optional[threading.Thread] = field(default=None, init=False, repr=False)
+
+    @property
+    def base_url(self) -> str:
+        return f"http://{self.host}:{self.port}/api/users"
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """응답 종류별 요청 수"""
+        return dict(self._server.stats) if self._server else {}
+
+    def start(self) -> "FakeUserApi":
+        self._server = _UserApiServer((self.host, self.port), FaultInjector(self.profile))
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(target=self._server.serve_forever, name="fake-user-api", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+            self._thread.join(timeout=5)
+
+    def __enter__(self) -> "FakeUserApi":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="user-api 대역 서버 (지연/장애 주입)")
+    parser.add_argument("--host", default="127.0.0.1", help="바인딩 주소")
+    parser.add_argument("--port", type=int, default=8080, help="포트 (기본: user-api와 같은 8080)")
+    parser.add_argument("--seed", type=int, default=None, help="난수 시드 (지정하면 장애 발생 순서 재현)")
+    add_fault_arguments(parser)
+    args = parser.parse_args()
+
+    server = FakeUserApi(profile=profile_from_args(args, seed=args.seed), host=args.host, port=args.port).start()
+    print(f"fake user-api: {server.base_url} ({server.profile})")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.stop()
+        print(json.dumps(server.stats, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,421 @@
+"""
+카탈로그 API 부하/지연시간 벤치마크
+- 임시 SQLite 파일로 서버를 실행하고 설정한 규모(사용자 수, 사용자당 카탈로그 수, 카탈로그당 아이템 수, 보유 비율)로 데이터 생성
+- 여러 클라이언트가 동시에 주요 엔드포인트를 가중치 비율로 호출
+  (공개 피드, 내 카탈로그, 아이템 목록, toggle-owned, save-catalog, 업로드, 회원 탈퇴 데이터 삭제)
+- 엔드포인트별 처리량과 p50/p95/p99 지연시간을 JSON으로 출력
+- --output으로 결과를 저장하고, 다음 실행에서 --baseline으로 지정하면 기준 결과와 비교
+
+같은 --seed와 설정이면 생성 데이터와 클라이언트별 요청 순서가 같음 (지연시간 자체는 실행 환경에 따라 달라짐)
+
+사용 예:
+    python -m benchmarks.load --users 20 --catalogs-per-user 5 --items-per-catalog 20 --output baseline.json
+    python -m benchmarks.load --users 20 --catalogs-per-user 5 --items-per-catalog 20 --baseline baseline.json
+"""
+import argparse
+import contextlib
+import io
+import json
+import random
+import sys
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
+
+import requests
+
+from benchmarks.common import BenchmarkServer, auth_headers, latency_summary
+from benchmarks.fake_user_api import FakeUserApi, add_fault_arguments, profile_from_args
+
+# 엔드포인트별 기본 호출 비율 (가중치)
+DEFAULT_MIX = {
+    "public_feed": 15,
+    "my_catalogs": 20,
+    "item_list": 25,
+    "toggle_owned": 20,
+    "save_catalog": 8,
+    "upload": 7,
+    "delete_me": 5,
+}
+
+# 기준 결과와 비교할 지연시간 지표
+COMPARED_METRICS = ("p50_ms", "p95_ms", "p99_ms")
+
+
+def parse_mix(value: str) -> Dict[str, int]:
+    """'public_feed=10,item_list=30' 형식의 호출 비율 파싱 (지정하지 않은 엔드포인트는 기본값)"""
+    mix = dict(DEFAULT_MIX)
+    for part in value.split(","):
+        if not part.strip():
+            continue
+        name, _, weight = part.partition("=")
+        name = name.strip()
+        if name not in DEFAULT_MIX:
+            raise argparse.ArgumentTypeError(f"알 수 없는 엔드포인트: {name} (사용 가능: {', '.join(DEFAULT_MIX)})")
+        mix[name] = int(weight)
+    return mix
+
+
+def make_upload_payload() -> bytes:
+    """업로드용 작은 JPEG 이미지 (Pillow가 없으면 JPEG 헤더만 있는 바이트열)"""
+    try:
+        from PIL import Image
+    except ImportError:
+        return b"\xff\xd8\xff\xe0" + bytes(32 * 1024) + b"\xff\xd9"
+
+    buffer = io.BytesIO()
+    Image.new("RGB", (256, 256), (120, 160, 200)).save(buffer, "JPEG", quality=85)
+    return buffer.getvalue()
+
+
+class Dataset:
+    """
+    생성한 데이터와 실행 중 공유 상태
+    - 사용자별 카탈로그/아이템 ID, 전체 공개 카탈로그 목록
+    - save-catalog로 저장한 (사용자, 원본 카탈로그) → 복사본 카탈로그 ID (저장 요청 중이면 None), 회원 탈퇴용 사용자 목록
+    """
+
+    def __init__(self):
+        self.catalogs: Dict[str, List[str]] = {}
+        self.items: Dict[str, List[str]] = {}
+        self.public_catalogs: List[tuple] = []  # (소유자 ID, 카탈로그 ID)
+        self.saved: Dict[tuple, Optional[str]] = {}
+        self.disposable_users: List[str] = []
+        self.lock = threading.Lock()
+
+    @property
+    def users(self) -> List[str]:
+        return list(self.catalogs)
+
+
+def seed_user(base_url: str, user_id: str, catalogs: int, items: int, owned_ratio: float, rng: random.Random) -> tuple:
+    """사용자 한 명의 카탈로그/아이템 생성 후 보유 비율만큼 toggle-owned (카탈로그 ID 목록, 아이템 ID 목록) 반환"""
+    session = requests.Session()
+    headers = auth_headers(user_id)
+    catalog_ids, item_ids = [], []
+
+    for catalog_index in range(catalogs):
+        catalog = session.post(
+            f"{base_url}/api/catalogs/",
+            json={
+                "title": f"{user_id} catalog {catalog_index}",
+                "description": "load benchmark",
+                "category": f"category-{catalog_index % 4}",
+                "tags": ["bench"],
+                "visibility": "public",
+            },
+            headers=headers,
+            timeout=60,
+        )
+        catalog.raise_for_status()
+        catalog_id = catalog.json()["catalog_id"]
+        catalog_ids.append(catalog_id)
+
+        for item_index in range(items):
+            item = session.post(
+                f"{base_url}/api/items/",
+                json={"catalog_id": catalog_id, "name": f"item-{item_index}", "description": "", "user_fields": {}},
+                headers=headers,
+                timeout=60,
+            )
+            item.raise_for_status()
+            item_id = item.json()["item_id"]
+            item_ids.append(item_id)
+            if rng.random() < owned_ratio:
+                session.patch(f"{base_url}/api/items/{item_id}/toggle-owned", headers=headers, timeout=60).raise_for_status()
+
+    return catalog_ids, item_ids
+
+
+def seed(base_url: str, args: argparse.Namespace) -> Dataset:
+    """설정한 규모로 데이터 생성 (사용자별로 병렬 생성, 사용자마다 고정 시드 사용)"""
+    dataset = Dataset()
+    users = [f"bench-user-{index}" for index in range(args.users)]
+    disposable = [f"bench-disposable-{index}" for index in range(args.disposable_users)]
+
+    with ThreadPoolExecutor(max_workers=max(1, args.seed_workers)) as pool:
+        futures = {
+            user_id: pool.submit(
+                seed_user, base_url, user_id, args.catalogs_per_user, args.items_per_catalog,
+                args.owned_ratio, random.Random(f"{args.seed}:{user_id}"),
+            )
+            for user_id in users
+        }
+        disposable_futures = [
+            pool.submit(seed_user, base_url, user_id, 1, args.items_per_catalog, args.owned_ratio, random.Random(f"{args.seed}:{user_id}"))
+            for user_id in disposable
+        ]
+        for user_id, future in futures.items():
+            dataset.catalogs[user_id], dataset.items[user_id] = future.result()
+            dataset.public_catalogs.extend((user_id, catalog_id) for catalog_id in dataset.catalogs[user_id])
+        for future in disposable_futures:
+            future.result()
+
+    dataset.disposable_users = disposable
+    return dataset
+
+
+class LoadClient:
+    """엔드포인트 호출 클라이언트 - 호출 비율에 따라 요청을 골라 실행하고 (엔드포인트, 상태 코드, 지연시간) 기록"""
+
+    def __init__(self, base_url: str, dataset: Dataset, mix: Dict[str, int], payload: bytes, rng: random.Random):
+        self.base_url = base_url
+        self.dataset = dataset
+        self.payload = payload
+        self.rng = rng
+        self.session = requests.Session()
+        self.endpoints = [name for name, weight in mix.items() if weight > 0]
+        self.weights = [mix[name] for name in self.endpoints]
+        self.results: List[tuple] = []
+
+    def run(self, count: int) -> List[tuple]:
+        for _ in range(count):
+            name = self.rng.choices(self.endpoints, self.weights)[0]
+            user_id = self.rng.choice(self.dataset.users)
+            started = time.perf_counter()
+            try:
+                name, status = getattr(self, name)(user_id)
+            except requests.RequestException:
+                status = 0
+            self.results.append((name, status, (time.perf_counter() - started) * 1000))
+        return self.results
+
+    def public_feed(self, user_id: str) -> tuple:
+        response = self.session.get(f"{self.base_url}/api/catalogs/public", params={"user_id": user_id}, timeout=60)
+        return "public_feed", response.status_code
+
+    def my_catalogs(self, user_id: str) -> tuple:
+        response = self.session.get(f"{self.base_url}/api/user-catalogs/my-catalogs", headers=auth_headers(user_id), timeout=60)
+        return "my_catalogs", response.status_code
+
+    def item_list(self, user_id: str) -> tuple:
+        _, catalog_id = self.rng.choice(self.dataset.public_catalogs)
+        response = self.session.get(f"{self.base_url}/api/items/catalog/{catalog_id}", headers=auth_headers(user_id), timeout=60)
+        return "item_list", response.status_code
+
+    def toggle_owned(self, user_id: str) -> tuple:
+        item_id = self.rng.choice(self.dataset.items[user_id])
+        response = self.session.patch(f"{self.base_url}/api/items/{item_id}/toggle-owned", headers=auth_headers(user_id), timeout=60)
+        return "toggle_owned", response.status_code
+
+    def save_catalog(self, user_id: str) -> tuple:
+        """
+        다른 사용자의 카탈로그 저장 (이미 저장한 경우 복사본 카탈로그 ID로 저장 취소를 unsave_catalog로 기록)
+        - 저장에 실패하면 저장 상태로 기록하지 않음, 다른 스레드가 같은 쌍을 저장 중이면 my_catalogs로 대체
+        """
+        candidates = [catalog_id for owner, catalog_id in self.dataset.public_catalogs if owner != user_id]
+        if not candidates:
+            return self.my_catalogs(user_id)
+        catalog_id = self.rng.choice(candidates)
+        key = (user_id, catalog_id)
+
+        with self.dataset.lock:
+            if key in self.dataset.saved and self.dataset.saved[key] is None:
+                copied_catalog_id, pending = None, True
+            else:
+                copied_catalog_id, pending = self.dataset.saved.pop(key, None), False
+                if copied_catalog_id is None:
+                    self.dataset.saved[key] = None
+        if pending:
+            return self.my_catalogs(user_id)
+
+        headers = auth_headers(user_id)
+        if copied_catalog_id is not None:
+            try:
+                response = self.session.delete(f"{self.base_url}/api/user-catalogs/unsave-catalog/{copied_catalog_id}", headers=headers, timeout=60)
+            except requests.RequestException:
+                response = None
+            if response is None or not response.ok:
+                with self.dataset.lock:
+                    self.dataset.saved[key] = copied_catalog_id
+            return "unsave_catalog", response.status_code if response is not None else 0
+
+        try:
+            response = self.session.post(f"{self.base_url}/api/user-catalogs/save-catalog", json={"catalog_id": catalog_id}, headers=headers, timeout=60)
+        except requests.RequestException:
+            response = None
+        with self.dataset.lock:
+            if response is not None and response.ok:
+                self.dataset.saved[key] = response.json()["copied_catalog_id"]
+            else:
+                self.dataset.saved.pop(key, None)
+        return "save_catalog", response.status_code if response is not None else 0
+
+    def upload(self, user_id: str) -> tuple:
+        response = self.session.post(
+            f"{self.base_url}/api/upload/file",
+            files={"file": ("bench.jpg", self.payload, "image/jpeg")},
+            headers=auth_headers(user_id),
+            timeout=60,
+        )
+        return "upload", response.status_code
+
+    def delete_me(self, user_id: str) -> tuple:
+        """회원 탈퇴 데이터 삭제 - 미리 만든 일회용 사용자를 사용 (모두 사용하면 데이터 없는 사용자)"""
+        with self.dataset.lock:
+            target = self.dataset.disposable_users.pop() if self.dataset.disposable_users else f"bench-empty-{self.rng.random()}"
+        response = self.session.delete(f"{self.base_url}/api/users/me", headers=auth_headers(target), timeout=60)
+        return "delete_me", response.status_code
+
+
+def summarize(results: List[tuple], elapsed: float) -> dict:
+    """엔드포인트별/전체 처리량, 오류 수, 지연시간 요약"""
+    by_endpoint = defaultdict(list)
+    for name, status, latency in results:
+        by_endpoint[name].append((status, latency))
+
+    def describe(samples: List[tuple]) -> dict:
+        return {
+            "requests": len(samples),
+            "errors": sum(1 for status, _ in samples if status == 0 or status >= 400),
+            "throughput_rps": round(len(samples) / elapsed, 1) if elapsed else 0.0,
+            "latency": latency_summary([latency for _, latency in samples]),
+        }
+
+    return {
+        "elapsed_s": round(elapsed, 3),
+        "overall": describe([(status, latency) for _, status, latency in results]),
+        "endpoints": {name: describe(samples) for name, samples in sorted(by_endpoint.items())},
+    }
+
+
+def compare(report: dict, baseline: dict, tolerance: float) -> dict:
+    """
+    기준 결과와 비교
+    - 지연시간(p50/p95/p99)은 기준보다 tolerance 비율 이상 늘어나면, 처리량은 tolerance 비율 이상 줄어들면 회귀로 표시
+    - ratio: 현재 값 / 기준 값
+    """
+    comparison = {}
+    regressions = []
+    current_endpoints = {"overall": report["results"]["overall"], **report["results"]["endpoints"]}
+    baseline_endpoints = {"overall": baseline["results"]["overall"], **baseline["results"]["endpoints"]}
+
+    for name, current in current_endpoints.items():
+        previous = baseline_endpoints.get(name)
+        if previous is None:
+            continue
+        metrics = {}
+        for metric in COMPARED_METRICS:
+            before, after = previous["latency"][metric], current["latency"][metric]
+            ratio = round(after / before, 3) if before else None
+            metrics[metric] = {"baseline": before, "current": after, "ratio": ratio}
+            if ratio is not None and ratio > 1 + tolerance:
+                regressions.append(f"{name}.{metric}")
+        before, after = previous["throughput_rps"], current["throughput_rps"]
+        ratio = round(after / before, 3) if before else None
+        metrics["throughput_rps"] = {"baseline": before, "current": after, "ratio": ratio}
+        if ratio is not None and ratio < 1 - tolerance:
+            regressions.append(f"{name}.throughput_rps")
+        comparison[name] = metrics
+
+    return {"tolerance": tolerance, "regressions": regressions, "endpoints": comparison}
+
+
+def run(args: argparse.Namespace) -> dict:
+    """서버 실행 → 데이터 생성 → 워밍업 → 동시 부하 실행 후 보고서 반환"""
+    env = {"UPLOAD_GC_INTERVAL_SECONDS": "0", **dict(args.env)}
+    payload = make_upload_payload()
+
+    user_api = None
+    if args.fake_user_api:
+        # 공개 피드의 생성자 닉네임 조회를 user-api 대역 서버로 연결 (지연/장애 주입)
+        user_api = FakeUserApi(profile_from_args(args, "user-api-", seed=args.seed))
+        env["USER_API_URL"] = user_api.start().base_url
+
+    with contextlib.ExitStack() as stack:
+        if user_api:
+            stack.callback(user_api.stop)
+        server = stack.enter_context(BenchmarkServer(env=env))
+
+        seed_started = time.perf_counter()
+        dataset = seed(server.base_url, args)
+        seed_elapsed = time.perf_counter() - seed_started
+
+        # 워밍업 (결과에 포함하지 않음, 저장/탈퇴처럼 상태를 바꾸는 요청은 제외)
+        warmup_mix = {name: weight for name, weight in args.mix.items() if name not in ("save_catalog", "delete_me")}
+        LoadClient(server.base_url, dataset, warmup_mix, payload, random.Random(f"{args.seed}:warmup")).run(args.warmup)
+
+        clients = [
+            LoadClient(server.base_url, dataset, args.mix, payload, random.Random(f"{args.seed}:client-{index}"))
+            for index in range(args.clients)
+        ]
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=args.clients) as pool:
+            futures = [pool.submit(client.run, args.requests) for client in clients]
+            results = [result for future in futures for result in future.result()]
+        elapsed = time.perf_counter() - started
+
+    return {
+        "config": {
+            "users": args.users,
+            "catalogs_per_user": args.catalogs_per_user,
+            "items_per_catalog": args.items_per_catalog,
+            "owned_ratio": args.owned_ratio,
+            "disposable_users": args.disposable_users,
+            "clients": args.clients,
+            "requests_per_client": args.requests,
+            "mix": args.mix,
+            "seed": args.seed,
+            "env": dict(args.env),
+            "fake_user_api": str(user_api.profile) if user_api else None,
+        },
+        "dataset": {
+            "catalogs": len(dataset.public_catalogs),
+            "items": sum(len(items) for items in dataset.items.values()),
+            "seed_s": round(seed_elapsed, 3),
+        },
+        "results": summarize(results, elapsed),
+        "user_api": user_api.stats if user_api else None,
+    }
+
+
+def parse_env(value: str) -> tuple:
+    """'KEY=VALUE' 형식의 서버 환경변수"""
+    key, separator, env_value = value.partition("=")
+    if not separator:
+        raise argparse.ArgumentTypeError("KEY=VALUE 형식이어야 합니다")
+    return key, env_value
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="카탈로그 API 부하/지연시간 벤치마크")
+    parser.add_argument("--users", type=int, default=20, help="사용자 수")
+    parser.add_argument("--catalogs-per-user", type=int, default=5, help="사용자당 카탈로그 수")
+    parser.add_argument("--items-per-catalog", type=int, default=20, help="카탈로그당 아이템 수")
+    parser.add_argument("--owned-ratio", type=float, default=0.3, help="보유 표시할 아이템 비율 (0~1)")
+    parser.add_argument("--disposable-users", type=int, default=20, help="delete_me 요청용 일회용 사용자 수")
+    parser.add_argument("--clients", type=int, default=16, help="동시 클라이언트 수")
+    parser.add_argument("--requests", type=int, default=100, help="클라이언트당 요청 수")
+    parser.add_argument("--warmup", type=int, default=50, help="측정 전 워밍업 요청 수")
+    parser.add_argument("--mix", type=parse_mix, default=dict(DEFAULT_MIX), help="엔드포인트별 호출 비율 (예: public_feed=10,upload=0)")
+    parser.add_argument("--seed", type=int, default=42, help="데이터 생성/요청 순서 난수 시드")
+    parser.add_argument("--seed-workers", type=int, default=8, help="데이터 생성 동시 요청 수")
+    parser.add_argument("--env", type=parse_env, action="append", default=[], help="서버 환경변수 (KEY=VALUE, 반복 가능)")
+    parser.add_argument("--output", help="결과 JSON 저장 경로 (다음 실행의 --baseline으로 사용)")
+    parser.add_argument("--baseline", help="비교할 기준 결과 JSON 경로")
+    parser.add_argument("--tolerance", type=float, default=0.1, help="회귀 판정 허용 비율 (기본 0.1 = 10%%)")
+    parser.add_argument("--fail-on-regression", action="store_true", help="회귀가 있으면 종료 코드 1")
+    parser.add_argument("--fake-user-api", action="store_true", help="user-api 대역 서버를 띄워 USER_API_URL로 지정 (--user-api-* 장애 설정)")
+    add_fault_arguments(parser, prefix="user-api-")
+    args = parser.parse_args()
+
+    report = run(args)
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as file:
+            report["comparison"] = compare(report, json.load(file), args.tolerance)
+
+    output = json.dumps(report, indent=2, ensure_ascii=False)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            file.write(output + "\n")
+    print(output)
+
+    if args.fail_on_regression and report.get("comparison", {}).get("regressions"):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
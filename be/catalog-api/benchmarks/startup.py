@@ -0,0 +1,82 @@
+"""
+서버 시작 시간 벤치마크
+- `python -X importtime`으로 `import main`의 모듈별 import 시간을 측정하여 누적 시간이 큰 순서로 출력
+- 서버 프로세스 실행부터 첫 /health 응답까지의 시간과 첫 인증 요청(카탈로그 목록) 지연시간 측정
+- 같은 DB 파일로 두 번 실행: 첫 실행은 테이블 생성, 두 번째는 스키마 버전 확인만 수행
+
+사용 예:
+    python -m benchmarks.startup --top 25
+"""
+import argparse
+import json
+import subprocess
+import sys
+import tempfile
+import time
+
+import requests
+
+from benchmarks.common import APP_DIR, BenchmarkServer, auth_headers
+
+
+def import_profile(env: dict, top: int) -> dict:
+    """import main의 모듈별 import 시간 (-X importtime 출력 파싱, 단위 ms)"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import main"],
+        cwd=APP_DIR,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    modules = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = [part.strip() for part in line[len("import time:"):].split("|")]
+        modules.append({"module": name, "self_ms": int(self_us) / 1000, "cumulative_ms": int(cumulative_us) / 1000})
+
+    total_ms = next((module["cumulative_ms"] for module in modules if module["module"] == "main"), 0.0)
+    modules.sort(key=lambda module: module["cumulative_ms"], reverse=True)
+    return {"import_main_ms": round(total_ms, 1), "top_modules": modules[:top]}
+
+
+def measure_start(workdir: str) -> dict:
+    """서버 실행부터 첫 /health 응답까지의 시간과 첫 인증 요청 지연시간 (ms)"""
+    server = BenchmarkServer(env={"UPLOAD_GC_INTERVAL_SECONDS": "0"}, workdir=workdir)
+    started = time.perf_counter()
+    server.start(poll_interval=0.01)
+    try:
+        ready_ms = (time.perf_counter() - started) * 1000
+
+        request_started = time.perf_counter()
+        response = requests.get(f"{server.base_url}/api/catalogs/", headers=auth_headers("bench-startup"), timeout=30)
+        first_request_ms = (time.perf_counter() - request_started) * 1000
+    finally:
+        server.stop()
+
+    return {
+        "ready_ms": round(ready_ms, 1),
+        "first_request_ms": round(first_request_ms, 1),
+        "first_request_status": response.status_code,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="서버 시작 시간 벤치마크")
+    parser.add_argument("--top", type=int, default=20, help="출력할 모듈 수 (누적 import 시간 순)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="catalog-bench-") as workdir:
+        env = BenchmarkServer(workdir=workdir).environment()
+        report = {
+            "imports": import_profile(env, args.top),
+            "fresh_database": measure_start(workdir),
+            "existing_database": measure_start(workdir),
+        }
+    print(json.dumps(report, indent=2, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""
+업로드 중 이벤트 루프 응답성 벤치마크
+- 여러 클라이언트가 동시에 대용량 이미지를 업로드하는 동안
+  별도 스레드에서 /health 를 주기적으로 호출하여 응답 지연을 측정
+- 업로드가 이벤트 루프를 막으면 /health 지연시간(p99, max)이 업로드 시간만큼 늘어남
+
+사용 예:
+    python -m benchmarks.upload_event_loop --uploaders 8 --size-mb 8 --duration 15
+"""
+import argparse
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+from benchmarks.common import BenchmarkServer, auth_headers, latency_summary
+
+
+def upload_worker(base_url: str, user_id: str, payload: bytes, stop_at: float, results: list) -> None:
+    """제한 시간까지 같은 파일을 반복 업로드"""
+    session = requests.Session()
+    headers = auth_headers(user_id)
+    while time.monotonic() < stop_at:
+        started = time.perf_counter()
+        response = session.post(
+            f"{base_url}/api/upload/file",
+            files={"file": ("bench.jpg", payload, "image/jpeg")},
+            headers=headers,
+            timeout=120,
+        )
+        results.append((response.status_code, (time.perf_counter() - started) * 1000))
+
+
+def probe_worker(base_url: str, interval: float, stop_at: float, samples: list) -> None:
+    """주기적으로 /health 호출하여 이벤트 루프 응답 지연 기록"""
+    session = requests.Session()
+    while time.monotonic() < stop_at:
+        started = time.perf_counter()
+        session.get(f"{base_url}/health", timeout=60)
+        samples.append((time.perf_counter() - started) * 1000)
+        time.sleep(interval)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="업로드 중 이벤트 루프 응답성 벤치마크")
+    parser.add_argument("--uploaders", type=int, default=8, help="동시 업로드 클라이언트 수")
+    parser.add_argument("--size-mb", type=float, default=8.0, help="업로드 파일 크기 (MB)")
+    parser.add_argument("--duration", type=float, default=15.0, help="측정 시간 (초)")
+    parser.add_argument("--probe-interval", type=float, default=0.05, help="/health 호출 간격 (초)")
+    args = parser.parse_args()
+
+    payload = os.urandom(int(args.size_mb * 1024 * 1024))
+    env = {"MAX_UPLOAD_SIZE": str(len(payload) * 2)}
+
+    with BenchmarkServer(env=env) as server:
+        # 업로드가 없는 상태의 기준 지연시간
+        idle_samples: list = []
+        probe_worker(server.base_url, args.probe_interval, time.monotonic() + 2.0, idle_samples)
+
+        upload_results: list = []
+        probe_samples: list = []
+        stop_at = time.monotonic() + args.duration
+
+        with ThreadPoolExecutor(max_workers=args.uploaders) as pool:
+            for index in range(args.uploaders):
+                pool.submit(upload_worker, server.base_url, f"bench-user-{index}", payload, stop_at, upload_results)
+            probe = threading.Thread(
+                target=probe_worker,
+                args=(server.base_url, args.probe_interval, stop_at, probe_samples),
+            )
+            probe.start()
+            probe.join()
+
+    succeeded = [elapsed for status, elapsed in upload_results if status == 200]
+    report = {
+        "config": vars(args),
+        "uploads": {
+            "succeeded": len(succeeded),
+            "failed": len(upload_results) - len(succeeded),
+            "throughput_mb_s": round(len(succeeded) * args.size_mb / args.duration, 3),
+            "latency": latency_summary(succeeded),
+        },
+        "health_idle": latency_summary(idle_samples),
+        "health_under_upload": latency_summary(probe_samples),
+    }
+    print(json.dumps(report, indent=2, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
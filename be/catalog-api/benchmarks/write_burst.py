@@ -0,0 +1,105 @@
+"""
+동시 쓰기 처리량 벤치마크 (쓰기 조정기 on/off 비교)
+- 아이템을 만든 뒤 여러 클라이언트가 동시에 toggle-owned / 아이템 생성 요청을 보냄
+- 같은 부하를 WRITE_COORDINATOR_ENABLED=false / true 서버에 각각 실행하여 초당 처리량과 지연시간 비교
+
+사용 예:
+    python -m benchmarks.write_burst --clients 32 --requests 50
+"""
+import argparse
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+from benchmarks.common import BenchmarkServer, auth_headers, latency_summary
+
+
+def seed_items(base_url: str, user_id: str, count: int) -> tuple:
+    """벤치마크용 카탈로그와 아이템 생성 후 (카탈로그 ID, 아이템 ID 목록) 반환"""
+    headers = auth_headers(user_id)
+    catalog = requests.post(
+        f"{base_url}/api/catalogs/",
+        json={"title": "bench", "description": "write burst", "category": "bench", "tags": [], "visibility": "public"},
+        headers=headers,
+        timeout=30,
+    ).json()
+    item_ids = []
+    for index in range(count):
+        item = requests.post(
+            f"{base_url}/api/items/",
+            json={"catalog_id": catalog["catalog_id"], "name": f"item-{index}", "description": "", "user_fields": {}},
+            headers=headers,
+            timeout=30,
+        ).json()
+        item_ids.append(item["item_id"])
+    return catalog["catalog_id"], item_ids
+
+
+def client_worker(base_url: str, user_id: str, catalog_id: str, item_ids: list, requests_per_client: int) -> list:
+    """toggle-owned 3회마다 아이템 생성 1회 비율로 쓰기 요청 반복"""
+    session = requests.Session()
+    headers = auth_headers(user_id)
+    results = []
+    for index in range(requests_per_client):
+        started = time.perf_counter()
+        if index % 4 == 3:
+            response = session.post(
+                f"{base_url}/api/items/",
+                json={"catalog_id": catalog_id, "name": f"burst-{index}", "description": "", "user_fields": {}},
+                headers=headers,
+                timeout=60,
+            )
+        else:
+            item_id = item_ids[index % len(item_ids)]
+            response = session.patch(f"{base_url}/api/items/{item_id}/toggle-owned", headers=headers, timeout=60)
+        results.append((response.status_code, (time.perf_counter() - started) * 1000))
+    return results
+
+
+def run_burst(coordinator: bool, clients: int, requests_per_client: int) -> dict:
+    """쓰기 조정기 설정별로 서버를 띄워 동시 쓰기 부하 실행"""
+    env = {"WRITE_COORDINATOR_ENABLED": "true" if coordinator else "false"}
+    user_id = "bench-writer"
+
+    with BenchmarkServer(env=env) as server:
+        catalog_id, item_ids = seed_items(server.base_url, user_id, 20)
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=clients) as pool:
+            futures = [
+                pool.submit(client_worker, server.base_url, user_id, catalog_id, item_ids, requests_per_client)
+                for _ in range(clients)
+            ]
+            results = [result for future in futures for result in future.result()]
+        elapsed = time.perf_counter() - started
+
+    latencies = [latency for _, latency in results]
+    errors = sum(1 for status, _ in results if status >= 400)
+    return {
+        "write_coordinator": coordinator,
+        "requests": len(results),
+        "errors": errors,
+        "elapsed_s": round(elapsed, 3),
+        "throughput_rps": round(len(results) / elapsed, 1) if elapsed else 0.0,
+        "latency": latency_summary(latencies),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="동시 쓰기 처리량 벤치마크")
+    parser.add_argument("--clients", type=int, default=32, help="동시 클라이언트 수")
+    parser.add_argument("--requests", type=int, default=50, help="클라이언트당 요청 수")
+    args = parser.parse_args()
+
+    report = {
+        "clients": args.clients,
+        "requests_per_client": args.requests,
+        "results": [run_burst(coordinator, args.clients, args.requests) for coordinator in (False, True)],
+    }
+    print(json.dumps(report, indent=2, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
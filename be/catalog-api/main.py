@@ -4,28 +4,103 @@ Catalog-API 메인 서버 파일 (Python FastAPI)
 - Flutter 앱에서 데이터 CRUD 요청을 처리
 - JWT 토큰 기반 인증으로 사용자별 데이터 관리
 """
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.staticfiles import StaticFiles
-from app.api import catalogs, items, upload, user_catalogs, users
-from app.models import init_db
+from app.api import catalogs, items, upload, user_catalogs, users, sync, events
+from app.models import engine, read_engine, init_db, warm_up_database
 from app.core.config import settings, setup_logging
-from app.core.middleware import log_requests_middleware
+from app.core.events import start_event_bus, stop_event_bus
+from app.core.middleware import log_requests_middleware, limit_upload_size_middleware, profiling_middleware, query_stats_middleware
+from app.core.profiler import profiling_enabled
+from app.core.query_stats import install_query_hooks
+from app.core.images import shutdown_image_executor
+from app.core.loop_monitor import get_loop_monitor, start_loop_monitor, stop_loop_monitor
+from app.core.security import warm_up_jwt
+from app.core.static import ImageFiles, StaticBypassMiddleware
+from app.core.upload_gc import upload_gc_loop
+from app.core.user_api import close_session
+from app.core.write_queue import start_write_coordinator, stop_write_coordinator
+import asyncio
 import os
+import time
 
 # API 통신 로깅 설정
 logger = setup_logging()
 
+# 서버 시작/종료 처리 (lifespan)
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    앱 시작 시: 스키마 버전 확인(필요 시 테이블 생성), 연결 풀과 JWT 설정 미리 준비,
+    쓰기 조정기, 실시간 알림 전달 및 업로드 파일 정리 작업 시작 - 워커의 첫 요청이 초기화 비용을 치르지 않도록 함
+    앱 종료 시: 업로드 파일 정리 작업 중지, 남은 쓰기 작업 처리, 알림 전달 중지, 이미지 프로세스 풀과 user-api 세션 정리
+    """
+    start_time = time.perf_counter()
+    await init_db()
+    
+    try:
+        if settings.DB_POOL_WARMUP_CONNECTIONS > 0:
+            warm_up_database(settings.DB_POOL_WARMUP_CONNECTIONS)
+        warm_up_jwt()
+    except Exception as e:
+        logger.warning(f"⚠️ 시작 준비 작업 오류: {e}")
+    
+    start_write_coordinator()
+    await start_event_bus()
+    start_loop_monitor()
+    
+    upload_gc_task = None
+    if settings.UPLOAD_GC_INTERVAL_SECONDS > 0:
+        upload_gc_task = asyncio.create_task(upload_gc_loop(settings.UPLOAD_GC_INTERVAL_SECONDS))
+    
+    logger.warning(f"✅ 서버 시작 준비 완료 ({(time.perf_counter() - start_time) * 1000:.1f}ms)")
+    
+    try:
+        yield
+    finally:
+        if upload_gc_task:
+            upload_gc_task.cancel()
+        stop_loop_monitor()
+        stop_write_coordinator()
+        await stop_event_bus()
+        shutdown_image_executor()
+        close_session()
+
 # FastAPI 앱 인스턴스 생성
 app = FastAPI(
     title="카탈로그 API",
     description="수집가를 위한 카탈로그 및 아이템 관리 API",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
+# 요청 프로파일링 미들웨어 - 가장 안쪽에서 라우트 처리 중 스택 샘플링 (설정하지 않으면 등록하지 않아 비용 없음)
+if profiling_enabled():
+    app.middleware("http")(profiling_middleware)
+
 # HTTP 요청/응답 로깅 미들웨어 - 모든 API 호출을 자동으로 기록
 app.middleware("http")(log_requests_middleware)
 
+# SQL 쿼리 집계 미들웨어 - 로깅 미들웨어 바깥에서 요청별 쿼리 수/DB 시간을 집계하여 Server-Timing 헤더와 로그에 기록
+if settings.SQL_STATS_ENABLED:
+    install_query_hooks(engine, read_engine)
+    app.middleware("http")(query_stats_middleware)
+
+# 업로드 크기 제한 미들웨어 - 로깅보다 바깥에서 Content-Length로 대용량 요청을 먼저 거부
+app.middleware("http")(limit_upload_size_middleware)
+
+# 정적 파일 서빙 설정 - 업로드된 이미지 파일 제공
+# 로깅/업로드 제한 미들웨어 바깥에서 처리하여 응답 본문 버퍼링 없이 전송 (Range, ETag, immutable 캐시)
+# /api/upload/images/... 는 기존 개발용 이미지 경로 호환
+app.add_middleware(
+    StaticBypassMiddleware,
+    mounts=[
+        ("/uploads", ImageFiles(directory=settings.UPLOAD_DIR, check_dir=False)),
+        ("/api/upload/images", ImageFiles(directory=os.path.join(settings.UPLOAD_DIR, "images"), check_dir=False)),
+    ],
+)
+
 # CORS 미들웨어 설정 - Flutter 앱에서 API 호출 허용
 app.add_middleware(
     CORSMiddleware,
@@ -35,22 +110,14 @@ app.add_middleware(
     allow_headers=settings.CORS_HEADERS,
 )
 
-# 정적 파일 서빙 설정 - 업로드된 이미지 파일 제공
-if os.path.exists(settings.UPLOAD_DIR):
-    app.mount("/uploads", StaticFiles(directory=settings.UPLOAD_DIR), name="uploads")
-
 # API 라우터 등록 - 각 기능별로 분리된 라우터들을 메인 앱에 연결
 app.include_router(catalogs.router, prefix="/api/catalogs", tags=["catalogs"])  # 카탈로그 CRUD
 app.include_router(items.router, prefix="/api/items", tags=["items"])           # 아이템 CRUD
 app.include_router(upload.router, prefix="/api/upload", tags=["upload"])        # 파일 업로드
 app.include_router(user_catalogs.router, prefix="/api/user-catalogs", tags=["user-catalogs"])  # 사용자 카탈로그 관리
 app.include_router(users.router, prefix="/api/users", tags=["users"])          # 사용자 관리
-
-# 서버 시작 시 실행되는 이벤트 핸들러
-@app.on_event("startup")
-async def startup_event():
-    """앱 시작 시 SQLite 데이터베이스 테이블 초기화"""
-    await init_db()
+app.include_router(sync.router, prefix="/api/sync", tags=["sync"])             # 변경분 동기화
+app.include_router(events.router, prefix="/api/events", tags=["events"])       # 실시간 변경 알림 (WebSocket)
 
 # 기본 엔드포인트들
 @app.get("/")
@@ -63,6 +130,14 @@ async def health_check():
     """헬스체크 엔드포인트 - Flutter 앱에서 서버 연결 테스트용"""
     return {"status": "healthy"}
 
+@app.get("/metrics/loop-lag")
+async def loop_lag_metrics():
+    """이벤트 루프 지연 백분위수와 최근 멈춤 기록 (LOOP_MONITOR_ENABLED일 때)"""
+    monitor = get_loop_monitor()
+    if monitor is None:
+        return {"enabled": False}
+    return {"enabled": True, **monitor.snapshot()}
+
 # 서버 실행 설정 - 개발 환경에서 직접 실행 시
 if __name__ == "__main__":
     import uvicorn
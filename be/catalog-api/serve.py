@@ -0,0 +1,91 @@
+"""
+Catalog-API 운영 서버 실행 파일
+- 여러 uvicorn 워커 프로세스로 실행하여 모든 CPU 코어 사용 (개발용 단일 프로세스 실행은 main.py)
+- 스키마 생성은 워커를 띄우기 전에 부모 프로세스에서 한 번만 실행 (워커 간 create_all 경쟁 방지)
+- 미참조 업로드 파일 정리는 부모 프로세스에서만 실행 (워커마다 중복 실행 방지)
+- SIGTERM/SIGINT 수신 시 새 연결을 받지 않고 처리 중인 요청을 GRACEFUL_SHUTDOWN_TIMEOUT까지 기다린 뒤 종료
+
+사용 예:
+    python serve.py
+    python serve.py --workers 4 --port 8000
+"""
+import argparse
+import os
+import threading
+import time
+
+import uvicorn
+
+from app.core.config import settings, setup_logging
+from app.core.upload_gc import run_sweep
+from app.models import prepare_database
+
+# API 통신 로깅 설정
+logger = setup_logging()
+
+
+def default_worker_count() -> int:
+    """워커 수 기본값 - WORKERS 설정, 없으면 CPU 코어 수"""
+    return settings.WORKERS or os.cpu_count() or 1
+
+
+def upload_gc_worker(interval_seconds: int, stop_event: threading.Event) -> None:
+    """부모 프로세스의 업로드 파일 정리 스레드 (주기마다 정리 작업 1회 실행)"""
+    while not stop_event.wait(interval_seconds):
+        try:
+            report = run_sweep()
+            if report["deleted"] or report["expired_sessions"]:
+                logger.warning(
+                    f"🧹 미참조 업로드 파일 {report['deleted']}개 정리 "
+                    f"({report['reclaimed_bytes']} bytes 회수, 만료된 업로드 세션 파일 {report['expired_sessions']}개 삭제)"
+                )
+        except Exception as e:
+            logger.warning(f"⚠️ 업로드 파일 정리 작업 오류: {e}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="카탈로그 API 운영 서버 (멀티 프로세스)")
+    parser.add_argument("--workers", type=int, default=default_worker_count(), help="워커 프로세스 수 (기본: WORKERS 또는 CPU 코어 수)")
+    parser.add_argument("--host", default=settings.HOST, help="바인딩 주소 (기본: HOST)")
+    parser.add_argument("--port", type=int, default=settings.PORT, help="포트 (기본: PORT)")
+    args = parser.parse_args()
+    
+    # 1) 스키마 생성 및 업로드 디렉토리 준비 - 워커 실행 전 한 번만
+    start_time = time.time()
+    prepare_database()
+    logger.warning(f"✅ 데이터베이스 초기화 완료 ({time.time() - start_time:.2f}s)")
+    
+    # 2) 워커 프로세스 설정 - 환경변수로 전달 (워커는 설정 모듈을 새로 읽음, 워커 1개면 현재 프로세스 설정도 변경)
+    gc_interval = settings.UPLOAD_GC_INTERVAL_SECONDS
+    os.environ["SKIP_DB_INIT"] = "true"            # 스키마 초기화는 이미 완료
+    os.environ["UPLOAD_GC_INTERVAL_SECONDS"] = "0"  # 업로드 파일 정리는 부모 프로세스에서만
+    settings.SKIP_DB_INIT = True
+    settings.UPLOAD_GC_INTERVAL_SECONDS = 0
+    
+    stop_event = threading.Event()
+    if gc_interval > 0:
+        threading.Thread(
+            target=upload_gc_worker,
+            args=(gc_interval, stop_event),
+            name="upload-gc",
+            daemon=True
+        ).start()
+    
+    logger.warning(f"🚀 카탈로그 API 서버 시작: {args.host}:{args.port} (워커 {args.workers}개)")
+    
+    # 3) 워커 실행 - uvicorn이 워커 프로세스를 관리하고 종료 신호를 전달
+    try:
+        uvicorn.run(
+            "main:app",
+            host=args.host,
+            port=args.port,
+            workers=args.workers,
+            timeout_graceful_shutdown=settings.GRACEFUL_SHUTDOWN_TIMEOUT,
+            log_config=None
+        )
+    finally:
+        stop_event.set()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,17 @@
+"""
+테스트 공통 설정
+- app 모듈이 import 시점에 설정을 읽으므로 DB/업로드 경로를 임시 디렉토리로 먼저 지정
+- 이미 지정한 환경변수는 그대로 사용
+"""
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+_TEST_ROOT = tempfile.mkdtemp(prefix="catalog-api-test-")
+
+os.environ.setdefault("DATABASE_URL", f"sqlite:///{_TEST_ROOT}/catalog.db")
+os.environ.setdefault("UPLOAD_DIR", f"{_TEST_ROOT}/uploads")
+os.environ.setdefault("LOG_FILE", f"{_TEST_ROOT}/catalog-api.log")
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
@@ -0,0 +1,65 @@
+"""
+변경 기록 버전 부여 테스트 (기본 SQLite DB)
+- 동시에 기록해도 버전이 겹치지 않고, 먼저 기록을 시작한 트랜잭션이 커밋할 때까지 다른 기록이 기다리는지 확인
+"""
+import threading
+import uuid
+
+import pytest
+
+from app.models import SessionLocal, ChangeLogDB, prepare_database
+from app.crud import change_log
+
+
+@pytest.fixture(scope="module", autouse=True)
+def database():
+    prepare_database()
+
+
+@pytest.fixture
+def user_id():
+    return f"versions-{uuid.uuid4()}"
+
+
+def _versions(user_id: str) -> dict:
+    with SessionLocal() as db:
+        return {
+            row.entity_id: row.version
+            for row in db.query(ChangeLogDB).filter(ChangeLogDB.user_id == user_id).all()
+        }
+
+
+def _record(user_id: str, entity_id: str) -> None:
+    with SessionLocal() as db:
+        change_log.record_changes(db, user_id, [(change_log.ENTITY_ITEM, entity_id, "catalog", False)])
+        db.commit()
+
+
+def test_versions_follow_commit_order(user_id):
+    _record(user_id, "x")
+
+    holder = SessionLocal()
+    change_log.record_changes(holder, user_id, [(change_log.ENTITY_ITEM, "y", "catalog", False)])
+
+    # holder가 커밋하기 전에는 다른 기록이 버전을 받지 못함
+    waiter = threading.Thread(target=_record, args=(user_id, "z"))
+    waiter.start()
+    waiter.join(timeout=0.5)
+    assert waiter.is_alive()
+
+    holder.commit()
+    holder.close()
+    waiter.join(timeout=10)
+    assert not waiter.is_alive()
+
+    assert _versions(user_id) == {"x": 1, "y": 2, "z": 3}
+
+
+def test_concurrent_first_writes_get_unique_versions(user_id):
+    threads = [threading.Thread(target=_record, args=(user_id, f"item-{index}")) for index in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=30)
+
+    assert sorted(_versions(user_id).values()) == list(range(1, 9))
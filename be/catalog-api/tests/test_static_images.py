@@ -0,0 +1,58 @@
+"""
+업로드 이미지 서빙 캐시 헤더 테스트
+- ?size= 요청에 리사이즈 버전이 아직 없어 원본으로 대신 응답하면 immutable 대신 no-cache인지 확인
+- 업로드 중인 부분 파일 등 점(.)으로 시작하는 경로는 제공하지 않는지 확인
+"""
+import pytest
+from starlette.applications import Starlette
+from starlette.routing import Mount
+from starlette.testclient import TestClient
+
+from app.core.config import settings
+from app.core.images import variant_path
+from app.core.static import ImageFiles
+from app.core.storage import IMMUTABLE_CACHE_CONTROL
+
+
+@pytest.fixture
+def image_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "IMAGE_VARIANT_SIZES", [128, 512])
+    monkeypatch.setattr(settings, "IMAGE_TRANSCODE_FORMATS", [])
+    (tmp_path / "photo.jpg").write_bytes(b"original")
+    return tmp_path
+
+
+@pytest.fixture
+def client(image_dir):
+    app = Starlette(routes=[Mount("/images", app=ImageFiles(directory=str(image_dir)))])
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+def test_pending_variant_falls_back_without_cache(client):
+    response = client.get("/images/photo.jpg", params={"size": 100})
+    assert response.status_code == 200
+    assert response.content == b"original"
+    assert response.headers["Cache-Control"] == "no-cache"
+
+
+def test_generated_variant_is_immutable(client, image_dir):
+    variant_path(image_dir / "photo.jpg", 128).write_bytes(b"variant")
+
+    response = client.get("/images/photo.jpg", params={"size": 100})
+    assert response.content == b"variant"
+    assert response.headers["Cache-Control"] == IMMUTABLE_CACHE_CONTROL
+
+
+def test_size_above_largest_variant_serves_original_immutable(client):
+    response = client.get("/images/photo.jpg", params={"size": 2048})
+    assert response.content == b"original"
+    assert response.headers["Cache-Control"] == IMMUTABLE_CACHE_CONTROL
+
+
+def test_dot_directories_are_not_served(client, image_dir):
+    (image_dir / ".sessions").mkdir()
+    (image_dir / ".sessions" / "partial.part").write_bytes(b"partial")
+
+    assert client.get("/images/.sessions/partial.part").status_code == 404
+    assert client.get("/images/.sessions/../.sessions/partial.part").status_code == 404
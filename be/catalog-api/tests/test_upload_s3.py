@@ -0,0 +1,147 @@
+"""
+S3 직접 업로드 테스트 (presign → PUT → confirm → delete)
+- moto 서버를 S3 호환 엔드포인트로 띄워 실제 boto3/HTTP 요청으로 확인 (moto[server]가 없으면 건너뜀)
+"""
+import socket
+
+import pytest
+
+pytest.importorskip("boto3")
+moto_server = pytest.importorskip("moto.server")
+
+import requests
+from fastapi.testclient import TestClient
+
+import main
+from app.core import storage as storage_module
+from app.core.config import settings
+from app.core.security import create_access_token
+from app.crud import uploaded_object as uploaded_object_crud
+from app.models import SessionLocal
+
+BUCKET = "catalog-test-uploads"
+PAYLOAD = b"\xff\xd8\xff\xe0" + b"0" * 2048
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@pytest.fixture(scope="module")
+def s3_endpoint():
+    """moto S3 서버 실행"""
+    port = _free_port()
+    server = moto_server.ThreadedMotoServer(ip_address="127.0.0.1", port=port)
+    server.start()
+    yield f"http://127.0.0.1:{port}"
+    server.stop()
+
+
+@pytest.fixture
+def s3_storage(s3_endpoint, monkeypatch):
+    """S3 저장소 설정으로 전환하고 버킷 생성 (테스트 후 전역 저장소 인스턴스 초기화)"""
+    monkeypatch.setattr(settings, "STORAGE_BACKEND", "s3")
+    monkeypatch.setattr(settings, "S3_ENDPOINT_URL", s3_endpoint)
+    monkeypatch.setattr(settings, "S3_BUCKET", BUCKET)
+    monkeypatch.setattr(settings, "S3_REGION", "us-east-1")
+    monkeypatch.setattr(settings, "S3_ACCESS_KEY_ID", "testing")
+    monkeypatch.setattr(settings, "S3_SECRET_ACCESS_KEY", "testing")
+    monkeypatch.setattr(settings, "S3_PUBLIC_BASE_URL", "")
+    monkeypatch.setattr(storage_module, "_storage", None)
+
+    storage = storage_module.get_storage()
+    storage.client.create_bucket(Bucket=BUCKET)
+    yield storage
+
+    for obj in storage.client.list_objects_v2(Bucket=BUCKET).get("Contents", []):
+        storage.client.delete_object(Bucket=BUCKET, Key=obj["Key"])
+    storage.client.delete_bucket(Bucket=BUCKET)
+    storage_module._storage = None
+
+
+@pytest.fixture
+def client():
+    with TestClient(main.app) as test_client:
+        yield test_client
+
+
+def _headers(user_id: str) -> dict:
+    return {"Authorization": f"Bearer {create_access_token(user_id)}"}
+
+
+def _presign_and_put(client, user_id: str, payload: bytes = PAYLOAD) -> dict:
+    response = client.post(
+        "/api/upload/presign",
+        json={"filename": "photo.jpg", "content_type": "image/jpeg", "size": len(payload)},
+        headers=_headers(user_id)
+    )
+    assert response.status_code == 200, response.text
+    upload = response.json()
+
+    put = requests.put(upload["upload_url"], data=payload, headers={"Content-Type": "image/jpeg"}, timeout=10)
+    assert put.status_code == 200, put.text
+    return upload
+
+
+def test_presign_confirm_delete(client, s3_storage):
+    upload = _presign_and_put(client, "s3-user")
+    key = s3_storage.key_from_url(upload["file_url"])
+    assert key.startswith("images/s3-user/")
+
+    response = client.post("/api/upload/confirm", json={"file_url": upload["file_url"]}, headers=_headers("s3-user"))
+    assert response.status_code == 200, response.text
+    assert response.json()["file_url"] == upload["file_url"]
+    with SessionLocal() as db:
+        recorded = uploaded_object_crud.get_uploaded_object(db, key)
+        assert recorded is not None
+        assert recorded.user_id == "s3-user"
+        assert recorded.size == len(PAYLOAD)
+
+    response = client.delete("/api/upload/file", params={"file_url": upload["file_url"]}, headers=_headers("s3-user"))
+    assert response.status_code == 200, response.text
+    assert s3_storage.size(key) is None
+    with SessionLocal() as db:
+        assert uploaded_object_crud.get_uploaded_object(db, key) is None
+
+
+def test_confirm_rejects_other_users_file(client, s3_storage):
+    upload = _presign_and_put(client, "s3-owner")
+
+    response = client.post("/api/upload/confirm", json={"file_url": upload["file_url"]}, headers=_headers("s3-other"))
+    assert response.status_code == 403
+    response = client.delete("/api/upload/file", params={"file_url": upload["file_url"]}, headers=_headers("s3-other"))
+    assert response.status_code == 403
+    assert s3_storage.size(s3_storage.key_from_url(upload["file_url"])) == len(PAYLOAD)
+
+
+def test_confirm_missing_file(client, s3_storage):
+    response = client.post(
+        "/api/upload/presign",
+        json={"filename": "photo.jpg", "content_type": "image/jpeg", "size": len(PAYLOAD)},
+        headers=_headers("s3-user")
+    )
+    upload = response.json()
+
+    response = client.post("/api/upload/confirm", json={"file_url": upload["file_url"]}, headers=_headers("s3-user"))
+    assert response.status_code == 404
+
+
+def test_confirm_deletes_oversized_file(client, s3_storage, monkeypatch):
+    upload = _presign_and_put(client, "s3-user")
+    monkeypatch.setattr(settings, "MAX_UPLOAD_SIZE", len(PAYLOAD) - 1)
+
+    response = client.post("/api/upload/confirm", json={"file_url": upload["file_url"]}, headers=_headers("s3-user"))
+    assert response.status_code == 413
+    assert s3_storage.size(s3_storage.key_from_url(upload["file_url"])) is None
+
+
+def test_delete_rejects_path_traversal(client, s3_storage):
+    upload = _presign_and_put(client, "s3-owner")
+    traversal_url = upload["file_url"].replace("/images/s3-owner/", "/images/s3-other/../s3-owner/")
+    assert s3_storage.key_from_url(traversal_url) is None
+
+    response = client.delete("/api/upload/file", params={"file_url": traversal_url}, headers=_headers("s3-other"))
+    assert response.status_code == 403
+    assert s3_storage.size(s3_storage.key_from_url(upload["file_url"])) == len(PAYLOAD)
@@ -0,0 +1,89 @@
+"""
+이어받기 업로드 세션 테스트 (로컬 저장소)
+- 다른 워커 프로세스가 부분 파일 잠금(flock)을 잡고 있으면 청크/완료 요청이 409로 거절되는지 확인
+"""
+import pytest
+
+fcntl = pytest.importorskip("fcntl")
+
+from fastapi.testclient import TestClient
+
+import main
+from app.core.security import create_access_token
+from app.core.storage import upload_session_path
+
+PAYLOAD = b"\xff\xd8\xff\xe0" + b"0" * 2048
+CHUNK_HEADERS = {"Content-Type": "application/offset+octet-stream"}
+
+
+@pytest.fixture
+def client():
+    with TestClient(main.app) as test_client:
+        yield test_client
+
+
+def _headers(user_id: str) -> dict:
+    return {"Authorization": f"Bearer {create_access_token(user_id)}"}
+
+
+def _create_session(client) -> str:
+    response = client.post(
+        "/api/upload/sessions",
+        json={"filename": "photo.jpg", "content_type": "image/jpeg", "size": len(PAYLOAD)},
+        headers=_headers("session-user")
+    )
+    assert response.status_code == 201, response.text
+    return response.json()["session_id"]
+
+
+def _patch(client, session_id: str, offset: int, data: bytes):
+    return client.patch(
+        f"/api/upload/sessions/{session_id}",
+        content=data,
+        headers={**_headers("session-user"), **CHUNK_HEADERS, "Upload-Offset": str(offset)}
+    )
+
+
+def test_chunk_rejected_while_other_worker_holds_part_file(client):
+    session_id = _create_session(client)
+
+    # 다른 워커가 같은 세션의 청크를 쓰는 중인 상황 (flock은 열린 파일마다 따로 잡히므로 같은 프로세스에서도 재현됨)
+    with open(upload_session_path(session_id), "r+b") as other_worker:
+        fcntl.flock(other_worker.fileno(), fcntl.LOCK_EX)
+
+        response = _patch(client, session_id, 0, PAYLOAD[:1000])
+        assert response.status_code == 409
+        assert response.headers["Upload-Offset"] == "0"
+
+        response = client.post(f"/api/upload/sessions/{session_id}/complete", headers=_headers("session-user"))
+        assert response.status_code == 409
+
+    assert upload_session_path(session_id).stat().st_size == 0
+
+    response = _patch(client, session_id, 0, PAYLOAD[:1000])
+    assert response.status_code == 204
+    assert response.headers["Upload-Offset"] == "1000"
+
+    response = _patch(client, session_id, 1000, PAYLOAD[1000:])
+    assert response.headers["Upload-Offset"] == str(len(PAYLOAD))
+
+    response = client.post(f"/api/upload/sessions/{session_id}/complete", headers=_headers("session-user"))
+    assert response.status_code == 200, response.text
+    assert client.get(response.json()["file_url"]).content == PAYLOAD
+    assert not upload_session_path(session_id).exists()
+
+
+def test_oversized_chunk_is_rolled_back(client):
+    session_id = _create_session(client)
+    assert _patch(client, session_id, 0, PAYLOAD[:1000]).status_code == 204
+
+    response = _patch(client, session_id, 1000, PAYLOAD[1000:] + b"extra")
+    assert response.status_code == 413
+    assert upload_session_path(session_id).stat().st_size == 1000
+
+
+def test_partial_upload_is_not_served(client):
+    session_id = _create_session(client)
+    assert _patch(client, session_id, 0, PAYLOAD[:1000]).status_code == 204
+
+    assert client.get(f"/uploads/.sessions/{session_id}.part").status_code == 404
@@ -0,0 +1,97 @@
+"""
+API 서버 경유 업로드 테스트 (multipart 본문 스트리밍 파싱, 로컬 저장소)
+- Content-Length 없이 보내도 누적 크기가 MAX_UPLOAD_SIZE를 넘으면 413으로 중단하고 임시 파일을 남기지 않는지 확인
+- 삭제 요청의 파일 URL에 .. 구간을 넣어 다른 사용자 파일을 지울 수 없는지 확인
+"""
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+
+import main
+from app.api.upload import STAGING_PREFIX
+from app.core.config import settings
+from app.core.security import create_access_token
+from app.core.storage import get_storage
+
+BOUNDARY = "catalog-test-boundary"
+
+
+@pytest.fixture
+def client():
+    with TestClient(main.app) as test_client:
+        yield test_client
+
+
+def _headers(user_id: str) -> dict:
+    return {
+        "Authorization": f"Bearer {create_access_token(user_id)}",
+        "Content-Type": f"multipart/form-data; boundary={BOUNDARY}",
+    }
+
+
+def _multipart_chunks(filename: str, payload_chunks):
+    """file 필드 하나짜리 multipart 본문을 청크 단위로 생성 (제너레이터 본문은 chunked로 전송됨)"""
+    yield (
+        f'--{BOUNDARY}\r\nContent-Disposition: form-data; name="file"; filename="{filename}"\r\n'
+        f"Content-Type: image/jpeg\r\n\r\n"
+    ).encode()
+    yield from payload_chunks
+    yield f"\r\n--{BOUNDARY}--\r\n".encode()
+
+
+def _staged_files() -> list:
+    staging_dir = Path(settings.UPLOAD_DIR) / STAGING_PREFIX
+    return list(staging_dir.iterdir()) if staging_dir.exists() else []
+
+
+def test_upload_file_streams_to_storage(client):
+    payload = b"\xff\xd8\xff\xe0" + b"0" * 4096
+    response = client.post(
+        "/api/upload/file",
+        content=_multipart_chunks("photo.jpg", [payload]),
+        headers=_headers("stream-user")
+    )
+    assert response.status_code == 200, response.text
+    local_path = get_storage().local_path(get_storage().key_from_url(response.json()["file_url"]))
+    assert local_path.read_bytes() == payload
+    assert _staged_files() == []
+
+
+def test_upload_file_rejects_oversized_chunked_body(client, monkeypatch):
+    monkeypatch.setattr(settings, "MAX_UPLOAD_SIZE", 64 * 1024)
+    response = client.post(
+        "/api/upload/file",
+        content=_multipart_chunks("photo.jpg", (b"0" * 16 * 1024 for _ in range(16))),
+        headers=_headers("stream-user")
+    )
+    assert response.status_code == 413
+    assert _staged_files() == []
+
+
+def test_upload_file_rejects_extension_before_body(client):
+    response = client.post(
+        "/api/upload/file",
+        content=_multipart_chunks("script.exe", [b"0" * 1024]),
+        headers=_headers("stream-user")
+    )
+    assert response.status_code == 400
+    assert _staged_files() == []
+
+
+def test_delete_rejects_path_traversal(client):
+    response = client.post(
+        "/api/upload/file",
+        content=_multipart_chunks("photo.jpg", [b"\xff\xd8\xff\xe0" + b"0" * 1024]),
+        headers=_headers("traversal-owner")
+    )
+    assert response.status_code == 200, response.text
+    file_url = response.json()["file_url"]
+    local_path = get_storage().local_path(get_storage().key_from_url(file_url))
+
+    traversal_url = file_url.replace("/images/traversal-owner/", "/images/traversal-other/../traversal-owner/")
+    auth = {"Authorization": f"Bearer {create_access_token('traversal-other')}"}
+    for url in (traversal_url, f"/uploads/{local_path}"):
+        response = client.delete("/api/upload/file", params={"file_url": url}, headers=auth)
+        assert response.status_code == 403
+    assert local_path.exists()